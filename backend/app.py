@@ -1,26 +1,48 @@
-from flask import Flask, jsonify, request
+import startup  # 🔥 가장 먼저 임포트 (시작 시각 기준점)
+from flask import Flask, Response, g, jsonify, request, send_file
 from flask_cors import CORS
 import time
 import database
 import lcu_driver
-import win32gui
+import live_client
+import ranking
+import item_catalog
+import lazy_import
+import metrics
 import threading
+import multiprocessing
+import argparse
 import json
 import os
 import sys
 import io
+from werkzeug.serving import make_server
+
+# win32gui 는 픽창 창 위치를 처음 조회할 때 로드
+win32gui = lazy_import.lazy("win32gui")
 
 # 🔥 [필수] 인코딩 설정 (PyInstaller 빌드 시 에러 방지)
 sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace')
 sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8', errors='replace')
 
-# 🔥 상점 감지기 & 증강 감지기 임포트
-from augment_watcher import AugmentWatcher
-import shop_detector 
+# 🔥 상점 감지기 & 증강 감지기는 cv2/pytesseract 로딩이 무거우므로
+# 서버가 포트를 연 뒤 백그라운드 초기화 단계에서 임포트합니다 (start_watcher, start_shop_monitor)
 
 app = Flask(__name__)
 CORS(app)
 
+# 라우트별 처리 시간 (/metrics 의 stage="route:<endpoint>")
+@app.before_request
+def _metrics_start():
+    g.metrics_started = time.perf_counter()
+
+@app.after_request
+def _metrics_stop(response):
+    started = g.pop("metrics_started", None)
+    if started is not None and request.endpoint:
+        metrics.observe(f"route:{request.endpoint}", time.perf_counter() - started)
+    return response
+
 # 🔥 [디버깅] 파일 로깅 추가 (빌드 후 실행 시 에러 확인용)
 import logging
 log_filename = os.path.join(os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__)), 'server_debug.txt')
@@ -57,6 +79,12 @@ normalize_name = database.normalize_name
 # 빌드 데이터 저장소
 BUILD_DATA = {}
 
+# 게임 중 Live Client Data API (게임 시간/레벨/챔피언, 증강 선택 시점 예측)
+LIVE_GAME = live_client.LiveGameTracker()
+
+# 인식 실행 방식 (thread: 서버 프로세스 안, process: perception_worker)
+PERCEPTION_MODE = "thread"
+
 # ==========================================
 # 유틸리티 함수
 # ==========================================
@@ -74,6 +102,13 @@ BUILD_DATA_NORMALIZED = {}
 def load_build_data():
     global BUILD_DATA, BUILD_DATA_NORMALIZED
     try:
+        # 런타임 번들이 있으면 이미 정규화된 빌드 데이터를 그대로 사용
+        bundle = database.load_runtime_bundle()
+        if bundle is not None:
+            BUILD_DATA = BUILD_DATA_NORMALIZED = bundle["builds"]
+            print(f"[Server] ✅ 빌드 데이터 로드 완료 ({len(BUILD_DATA)} champions, 번들)")
+            return f"{len(BUILD_DATA)} champions (bundle)"
+
         path = resource_path(os.path.join("data", "aram_builds.json"))
         if os.path.exists(path):
             with open(path, "r", encoding="utf-8") as f:
@@ -86,22 +121,106 @@ def load_build_data():
                 BUILD_DATA_NORMALIZED[clean_name] = data # 데이터는 그대로, 키만 변환
                 
             print(f"[Server] ✅ 빌드 데이터 로드 완료 ({len(BUILD_DATA)} champions)")
+            return f"{len(BUILD_DATA)} champions"
         else:
             print(f"[Server] ⚠️ 빌드 데이터 파일 없음")
             BUILD_DATA = {}
             BUILD_DATA_NORMALIZED = {}
+            return "no build data"
     except Exception as e:
         print(f"[Server] ❌ 빌드 데이터 로드 실패: {e}")
+        raise
 
 def reset_state():
+    global _PREWARMED
     print("[Server] 🔄 상태 초기화")
     STATE["active"] = False
     STATE["champion"] = None
     STATE["augments"] = []
     STATE["ts"] = 0
     STATE["shop_open"] = False
+    _PREWARMED = None
+    with _CHAMP_SELECT_LOCK:
+        _CHAMP_SELECT.update(key=None, team=[], bench=[], summoner=None)
+
+# ==========================================
+# 챔피언별 캐시 + 예열 (픽 확정 / 게임 중 재확인 시)
+# ==========================================
+# 첫 증강 화면에서 DB 조회 + 이름 정규화 + 빌드 직렬화 + OCR 엔진 첫 실행 비용을
+# 챔피언이 정해진 시점(증강 선택보다 몇 분 전)에 미리 치러 둡니다.
+_CHAMP_CACHE = {}         # normalize_name(챔피언) -> {"aug_tiers", "build", "build_json"}
+_CHAMP_CACHE_LOCK = threading.Lock()
+_PREWARMED = None         # 마지막으로 예열한 챔피언 (같은 챔피언은 한 번만)
+
+def champion_cache(champ_name):
+    """챔피언의 증강 티어 맵 {증강 id: 티어} 과 직렬화한 빌드 데이터"""
+    key = normalize_name(champ_name)
+    with _CHAMP_CACHE_LOCK:
+        entry = _CHAMP_CACHE.get(key)
+    if entry is not None: return entry
+
+    # 🔥 증강 id 로 저장 (DB 의 한글 행 / 영어 행 모두 같은 id -> 조회할 때 이름 비교 없음)
+    aug_tiers = database.get_champion_augment_tiers(champ_name)
+    build = BUILD_DATA_NORMALIZED.get(key)
+    entry = {"aug_tiers": aug_tiers, "build": build,
+             "build_json": json.dumps(build, ensure_ascii=False)}
+
+    # 초기화가 끝나기 전에 만든 결과는 비어 있을 수 있으므로 저장하지 않음
+    if startup.is_ready("database") and startup.is_ready("builds"):
+        with _CHAMP_CACHE_LOCK:
+            _CHAMP_CACHE[key] = entry
+    return entry
+
+def clear_champion_cache():
+    with _CHAMP_CACHE_LOCK:
+        _CHAMP_CACHE.clear()
+
+def set_champion(champ_name):
+    """내 챔피언 확정 -> 상태 저장 + 백그라운드 예열"""
+    STATE["champion"] = champ_name
+    prewarm_champion(champ_name)
+
+def prewarm_champion(champ_name):
+    global _PREWARMED
+    if not champ_name or champ_name == _PREWARMED: return
+    _PREWARMED = champ_name
+    threading.Thread(target=_prewarm, args=(champ_name,), name="prewarm", daemon=True).start()
+
+def _prewarm(champ_name):
+    started = time.perf_counter()
+    try:
+        startup.wait_for("database", timeout=30)
+        startup.wait_for("builds", timeout=30)
+        entry = champion_cache(champ_name)
+        ranking.current()  # 증강 점수 행렬 (ranking.npz 읽기 또는 생성)
+        # 빌드 아이템 아이콘을 디스크 캐시에 미리 받아 둠 (상점을 처음 열 때 네트워크 대기 없음)
+        if startup.wait_for("items", timeout=30):
+            item_catalog.prefetch_icons(item_catalog.build_item_ids(entry["build"]))
+
+        # thread 모드: 이 프로세스의 OCR 엔진 예열 (process 모드는 워커가 시작할 때 예열함)
+        if PERCEPTION_MODE == "thread" and startup.wait_for("watcher", timeout=30):
+            import augment_watcher
+            augment_watcher.warm_up()
+
+        elapsed = time.perf_counter() - started
+        metrics.observe("prewarm", elapsed)
+        print(f"[Server] 🔥 {champ_name} 예열 완료 (증강 {len(entry['aug_tiers'])}개, "
+              f"빌드 {'있음' if entry['build'] else '없음'}, {elapsed * 1000:.0f} ms)")
+    except Exception as e:
+        print(f"[Server] ⚠️ {champ_name} 예열 실패: {e}")
+
+# 픽창 위치는 거의 바뀌지 않으므로 잠깐 캐시 (오버레이가 1초마다 조회)
+WINDOW_RECT_TTL = 2.0
+_WINDOW_RECT = {"at": 0.0, "rect": None}
 
 def get_lcu_window_rect():
+    now = time.time()
+    if now - _WINDOW_RECT["at"] < WINDOW_RECT_TTL: return _WINDOW_RECT["rect"]
+    rect = _find_lcu_window_rect()
+    _WINDOW_RECT.update(at=now, rect=rect)
+    return rect
+
+def _find_lcu_window_rect():
     hwnd = win32gui.FindWindow(None, "League of Legends")
     if not hwnd: return None
     try:
@@ -114,6 +233,12 @@ def get_lcu_window_rect():
 
 # 🔥 [신규 함수] 게임 중일 때 내 챔피언 찾기 (중요!)
 def fetch_current_champion():
+    # Live Client API 가 응답 중이면 호출 없이 바로 확인
+    champ_name = LIVE_GAME.champion()
+    if champ_name:
+        print(f"[Server] 🎮 게임 중 챔피언 재확인 완료 (Live Client): {champ_name}")
+        return champ_name
+
     try:
         # 1. 내 소환사 정보 가져오기
         summoner = lcu_driver.driver.get("/lol-summoner/v1/current-summoner")
@@ -177,25 +302,25 @@ def monitor_gameflow():
             if current_phase == "InProgress" and STATE["champion"] is None:
                 found_champ = fetch_current_champion()
                 if found_champ:
-                    STATE["champion"] = found_champ
+                    set_champion(found_champ)
 
         except Exception as e: 
             print(f"[GameFlow] Error: {e}")
             
         time.sleep(1)
 
-import mss
-
 # ==========================================
 # 스레드 2: 상점 감지 (백그라운드 실행)
 # ==========================================
 def monitor_shop():
+    import shop_detector
     print("[Server] 🛡️ 상점 감시 스레드 시작 (좀비 모드)")
     
     # 이전 상태를 기억해서, 상태가 바뀔 때만 로그를 찍음 (로그 폭주 방지)
     last_shop_state = False 
     
     # 🔥 MSS 인스턴스 생성 (재사용)
+    import mss
     sct = mss.mss()
 
     try:
@@ -241,6 +366,10 @@ def monitor_shop():
 # API 라우트
 # ==========================================
 
+# /champ-select 응답 캐시: 세션 지문(내 셀, 팀 챔피언, 벤치)이 같으면 이전 결과 재사용
+_CHAMP_SELECT = {"key": None, "team": [], "bench": [], "summoner": None}
+_CHAMP_SELECT_LOCK = threading.Lock()  # 오버레이 폴링 요청이 여러 스레드에서 동시에 들어옴
+
 @app.route("/champ-select")
 def champ_select():
     current_phase = STATE.get("game_phase", "None")
@@ -252,7 +381,13 @@ def champ_select():
 
     try:
         session = lcu_driver.driver.get("/lol-champ-select/v1/session")
-        summoner = lcu_driver.driver.get("/lol-summoner/v1/current-summoner")
+        # 소환사 정보는 픽창마다 한 번만 (reset_state 에서 초기화). LCU 요청 중에는 잠그지 않음
+        with _CHAMP_SELECT_LOCK:
+            summoner = _CHAMP_SELECT["summoner"]
+        if not summoner:
+            summoner = lcu_driver.driver.get("/lol-summoner/v1/current-summoner")
+            with _CHAMP_SELECT_LOCK:
+                _CHAMP_SELECT["summoner"] = summoner
     except:
         return jsonify({"phase": None, "window_rect": window_rect})
         
@@ -260,6 +395,21 @@ def champ_select():
          return jsonify({"phase": "ChampSelect", "team": [], "bench": [], "window_rect": window_rect})
 
     cell_id = session.get("localPlayerCellId", -1)
+    key = (cell_id,
+           tuple((m.get("cellId"), m.get("championId", 0)) for m in session.get("myTeam", [])),
+           tuple(b.get("championId") for b in session.get("benchChampions", [])),
+           startup.is_ready("database"), bool(lcu_driver.driver.id_to_name))
+    # 지문 비교 -> 다시 만들기 -> 저장을 한 번에 (다른 요청이 key/team/bench 를 반만 바꾼 상태를 보지 않게)
+    with _CHAMP_SELECT_LOCK:
+        if key != _CHAMP_SELECT["key"]:
+            team, bench = build_champ_select(session, cell_id)
+            _CHAMP_SELECT.update(key=key, team=team, bench=bench)
+        team, bench = _CHAMP_SELECT["team"], _CHAMP_SELECT["bench"]
+
+    return jsonify({"phase": "ChampSelect", "team": team, "bench": bench, "window_rect": window_rect})
+
+def build_champ_select(session, cell_id):
+    """픽창 세션 -> (우리 팀, 벤치) 응답 목록. 세션 지문이 바뀔 때만 호출됨"""
     my_team = []
     
     # 우리 팀 정보 파싱
@@ -270,7 +420,7 @@ def champ_select():
         
         # 내가 선택한 챔피언 저장
         if member["cellId"] == cell_id and name:
-             STATE["champion"] = name 
+             set_champion(name)
 
         my_team.append({
             "name": name or "Unknown",
@@ -288,7 +438,44 @@ def champ_select():
             info = database.get_champion_info(name)
             bench.append({"name": name, **(info or {})})
 
-    return jsonify({"phase": "ChampSelect", "team": my_team, "bench": bench, "window_rect": window_rect})
+    return my_team, bench
+
+@app.route("/health")
+def health():
+    # 서브시스템별 준비 상태 및 초기화 소요 시간
+    return jsonify(startup.report())
+
+@app.route("/metrics")
+def metrics_endpoint():
+    # 구간별 지연 시간 (Prometheus 텍스트 포맷)
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+@app.route("/admin/reload-mapping", methods=["POST"])
+def reload_mapping():
+    # augment_mapping_full.txt 수정 후 서버 재시작 없이 반영
+    force = bool((request.json or {}).get("force")) if request.is_json else False
+    result = database.import_mapping_file(force=force)
+    if result["error"]:
+        return jsonify({"ok": False, **result}), 500
+    if not result["skipped"]:
+        clear_champion_cache()
+
+    # 증강 감지기가 떠 있으면 OCR 검증용 이름 목록도 갱신
+    watcher_module = sys.modules.get("augment_watcher")
+    if watcher_module and not result["skipped"]:
+        watcher_module.load_valid_names()
+    return jsonify({"ok": True, **result})
+
+@app.route("/admin/reload-data", methods=["POST"])
+def reload_data():
+    # compile_data.py 로 번들/점수 행렬을 다시 만든 뒤 서버 재시작 없이 반영
+    database.reload_data()
+    clear_champion_cache()
+    watcher_module = sys.modules.get("augment_watcher")
+    if watcher_module:
+        watcher_module.load_valid_names()
+    matrix = ranking.current()  # 새 데이터로 행렬 교체
+    return jsonify({"ok": True, "ranking": list(matrix.scores.shape)})
 
 @app.route("/augments/current")
 def augments_current():
@@ -296,14 +483,26 @@ def augments_current():
     if time.time() - STATE["ts"] > 6.0: STATE["active"] = False
     return jsonify(STATE)
 
+@app.route("/augments/tips")
+def augments_tips():
+    # 오버레이에는 팁 2개만 내려가므로, 전체 팁은 펼칠 때만 따로 요청
+    name = request.args.get("name", "")
+    tips = database.get_augment_tips(name) if name else None
+    if not tips:
+        return jsonify({"ok": False, "error": "unknown augment"}), 404
+    return jsonify({"ok": True, **tips})
+
 @app.route("/augments/update", methods=["POST"])
 def augments_update():
-    data = request.json or {}
-    
+    apply_augment_update(request.json or {})
+    return jsonify({"ok": True})
+
+def apply_augment_update(data):
+    """증강 감지 결과 반영 (/augments/update 와 process 모드의 인식 워커가 같이 사용)"""
     # 증강 창이 닫혔다는 신호가 오면 끔
     if not data.get("active"):
         STATE["active"] = False
-        return jsonify({"ok": True})
+        return
         
     STATE["active"] = True
     STATE["ts"] = time.time()
@@ -313,35 +512,30 @@ def augments_update():
     current_champ = req_champ if req_champ else STATE["champion"]
     
     # 증강 티어 매핑
-    enriched = database.enrich_ocr_augments(data.get("names_ko", []))
-    champ_aug_map = {}
-    
-    if current_champ:
-        rows = database.get_champion_augments(current_champ)
-        for r in rows: 
-            # 🔥 [수정 1] DB에서 가져온 이름도 정규화해서 키(Key)로 저장
-            # 예: "Nunu & Willump" -> "nunuwillump" 로 저장됨
-            clean_db_name = normalize_name(r['name'])
-            champ_aug_map[clean_db_name] = r['tier'] 
+    with metrics.span("enrich"):
+        enriched = database.enrich_ocr_augments(data.get("names_ko", []))
+
+    # 🔥 [수정 1] 챔피언별 증강 티어 맵 (픽 확정 때 미리 만들어 둔 캐시)
+    champ_aug_map = champion_cache(current_champ)["aug_tiers"] if current_champ else {}
 
     for item in enriched:
-        # 🔥 [수정 2] OCR로 읽은 영어 이름을 정규화해서 찾기
-        clean_en = normalize_name(item.get("name_en"))
-        t = champ_aug_map.get(clean_en)
-        
-        # 🔥 [수정 3] 없으면 한글 이름도 정규화해서 다시 찾아보기 (안전장치)
-        if not t:
-            clean_ko = normalize_name(item.get("name_ko"))
-            t = champ_aug_map.get(clean_ko)
-            
+        # 🔥 [수정 2] enrich 단계에서 찾은 증강 id 로 바로 조회 (한글/영어 표기 무관)
+        t = champ_aug_map.get(item.get("augment_id"))
         item["tier_champ"] = t
         
         # (디버깅용) 매핑 실패 시 로그 출력
         if not t and item.get("name_en"):
-             print(f"⚠️ 증강 매핑 실패: {item.get('name_en')} (변환: {clean_en})")
+             print(f"⚠️ 증강 매핑 실패: {item.get('name_en')} (id: {item.get('augment_id')})")
+
+    # 🔥 [수정 3] 추천 점수 / 순위 (미리 계산한 챔피언 x 증강 행렬에서 꺼내기만 함)
+    # 카드 위치와 맞춰야 하므로 순서는 그대로 두고 rank(1 = 추천) 필드로 전달
+    with metrics.span("rank"):
+        scores, ranks = ranking.rank(current_champ, [item["augment_id"] for item in enriched])
+    for item, score, rank in zip(enriched, scores, ranks):
+        item["score"] = score
+        item["rank"] = rank
         
     STATE["augments"] = enriched
-    return jsonify({"ok": True})
 
 # 챔피언 빌드 정보 (상점 열림 여부 포함)
 @app.route("/champion/build")
@@ -349,31 +543,55 @@ def get_champion_build():
     is_shop_open = STATE.get("shop_open", False)
     champ_name = STATE.get("champion") # 예: "Kai'Sa"
     
-    build_data = None
+    build_json = "null"
     if champ_name:
-        # 🔥 [수정] 정규화된 이름으로 검색 (kaisa로 검색)
-        clean_name = normalize_name(champ_name)
-        build_data = BUILD_DATA_NORMALIZED.get(clean_name)
+        # 🔥 [수정] 정규화된 이름으로 검색 (kaisa로 검색), 직렬화도 챔피언당 한 번만
+        entry = champion_cache(champ_name)
+        build_json = entry["build_json"]
         
         # 만약 못 찾았으면 로그 찍어보기 (디버깅용)
-        if not build_data:
-            print(f"❌ 챔피언 매핑 실패: 원본[{champ_name}] -> 변환[{clean_name}]")
+        if not entry["build"]:
+            print(f"❌ 챔피언 매핑 실패: 원본[{champ_name}] -> 변환[{normalize_name(champ_name)}]")
     
-    return jsonify({
-        "ok": True,
-        "champion": champ_name,
-        "shop_open": is_shop_open,
-        "data": build_data
-    })
+    # 상점 상태만 매번 바뀌므로 나머지는 캐시된 JSON 을 그대로 이어 붙임
+    body = (f'{{"ok":true,"champion":{json.dumps(champ_name, ensure_ascii=False)},'
+            f'"shop_open":{"true" if is_shop_open else "false"},"data":{build_json}}}')
+    return Response(body, mimetype="application/json")
+
+# 상점 빌드 툴팁용 아이템 정보 (현재 챔피언 빌드에 나오는 아이템만, 로컬 카탈로그)
+@app.route("/items/catalog")
+def items_catalog():
+    champ_name = request.args.get("champion") or STATE.get("champion")
+    build = champion_cache(champ_name)["build"] if champ_name else None
+    item_ids = item_catalog.build_item_ids(build)
+
+    res = Response(json.dumps(item_catalog.catalog_for(item_ids), ensure_ascii=False),
+                   mimetype="application/json")
+    # 챔피언이 바뀌거나 카탈로그 버전이 바뀔 때만 본문 전송 (그 외 304)
+    res.set_etag(item_catalog.catalog_etag(item_ids))
+    res.cache_control.no_cache = True
+    return res.make_conditional(request)
+
+@app.route("/items/icon/<int:item_id>.png")
+def item_icon(item_id):
+    path = item_catalog.icon_path(item_id)
+    if not path: return Response(status=404)
+    return send_file(path, mimetype="image/png", etag=item_catalog.icon_etag(item_id), max_age=86400)
 
 import traceback
 
-def start_watcher():
+def augment_scan_allowed():
+    """증강 OCR 게이트: 증강 레벨 도달 직후만 (Live Client 정보가 없으면 항상 허용)"""
+    return LIVE_GAME.scan_allowed()
+
+def start_watcher(ocr_workers=None):
+    from augment_watcher import AugmentWatcher
+
     retry_count = 0
     while retry_count < 5:
         try:
             print(f"[Server] AugmentWatcher Thread Starting (Attempt {retry_count+1})...")
-            watcher = AugmentWatcher()
+            watcher = AugmentWatcher(ocr_workers=ocr_workers, should_scan=augment_scan_allowed)
             watcher.start()
             print("[Server] AugmentWatcher Started Successfully.")
             return
@@ -382,17 +600,99 @@ def start_watcher():
             traceback.print_exc()
             retry_count += 1
             time.sleep(2)
-    print("[Server] ❌ AugmentWatcher failed to start after 5 attempts.")
+    raise RuntimeError("AugmentWatcher failed to start after 5 attempts.")
 
-if __name__ == "__main__":
-    load_build_data() 
-    lcu_driver.driver.connect()
-    
-    print("--- Starting Background Threads ---")
-    
-    # 스레드 시작
-    threading.Thread(target=start_watcher, daemon=True).start()
-    threading.Thread(target=monitor_gameflow, daemon=True).start()
+def connect_lcu():
+    # 클라이언트가 꺼져 있어도 실패는 아님 (monitor_gameflow 가 나중에 재연결)
+    if lcu_driver.driver.connect():
+        return "connected"
+    return "waiting for client"
+
+def start_shop_monitor():
+    # shop_detector 임포트까지만 초기화로 간주 (cv2/템플릿은 첫 감지 때 로드)
+    import shop_detector
     threading.Thread(target=monitor_shop, daemon=True).start()
-    
-    app.run(port=5000)
\ No newline at end of file
+
+def start_perception_process(ocr_workers=None):
+    """증강 OCR + 상점 감지를 별도 프로세스에서 실행 (perception_worker.py 참고)"""
+    from perception_worker import PerceptionProcess
+
+    def on_augments(active, titles=None):
+        data = {"active": active}
+        if active and titles:
+            data["names_ko"] = titles
+        apply_augment_update(data)
+
+    def on_shop(is_open):
+        STATE["shop_open"] = is_open
+        status = "열림 🛒" if is_open else "닫힘 ❌"
+        print(f"[ShopMonitor] 상점 상태 변경: {status}")
+
+    PerceptionProcess(on_augments, on_shop,
+                      check_shop=lambda: STATE.get("game_phase") == "InProgress",
+                      ocr_workers=ocr_workers, check_augments=augment_scan_allowed).start()
+
+def start_background_init(ocr_workers=None, perception="thread"):
+    """무거운 초기화를 서브시스템별로 동시에 시작"""
+    global PERCEPTION_MODE
+    PERCEPTION_MODE = perception
+    startup.start("database", database.init_db)
+    startup.start("builds", load_build_data)
+    startup.start("lcu", connect_lcu)
+    startup.start("live_client", LIVE_GAME.start)
+    startup.start("items", item_catalog.init)
+    if perception == "process":
+        startup.start("perception", lambda: start_perception_process(ocr_workers))
+    else:
+        startup.start("watcher", lambda: start_watcher(ocr_workers))
+        startup.start("shop", start_shop_monitor)
+
+    # 게임 흐름 감시는 LCU 연결 시도가 끝난 뒤 시작
+    startup.start("gameflow", lambda: threading.Thread(target=monitor_gameflow, daemon=True).start(),
+                  depends=("lcu",))
+
+def run_startup_profile(server, report_path, settle=1.0, timeout=60):
+    """
+    시작 프로파일 모드: 모든 서브시스템 초기화가 끝나면 리포트를 쓰고 종료
+    (profile_startup.py 가 -X importtime 과 함께 이 모드로 실행합니다)
+    """
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    startup.wait_all(timeout)
+    ready_at = time.time()
+    # 첫 감지 주기에서 일어나는 지연 임포트(cv2 등)까지 잡히도록 잠깐 대기
+    time.sleep(settle)
+
+    startup.write_profile(report_path, ready_at)
+    print(f"[Server] 📊 시작 프로파일 저장: {report_path}")
+    server.shutdown()
+
+if __name__ == "__main__":
+    # PyInstaller 빌드에서 인식 워커 프로세스(--perception process)를 띄울 때 필요
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--profile-startup", metavar="REPORT",
+                        help="초기화 완료 후 시작 프로파일(JSON)을 저장하고 종료")
+    parser.add_argument("--ocr-workers", type=int, default=None,
+                        help="카드 OCR 동시 실행 수 (기본: augment_watcher.OCR_WORKERS, 1 = 순차)")
+    parser.add_argument("--live-client-url", default=live_client.BASE_URL,
+                        help="Live Client Data API 주소 (테스트: live_client.py --stub)")
+    parser.add_argument("--perception", choices=("thread", "process"), default="thread",
+                        help="화면 인식(증강 OCR/상점) 실행 방식: 서버 스레드 또는 별도 프로세스")
+    args = parser.parse_args()
+
+    LIVE_GAME.client.base_url = args.live_client_url.rstrip("/")
+
+    # 🔥 포트를 먼저 열어서 Electron 이 바로 붙을 수 있게 함
+    server = make_server("127.0.0.1", args.port, app, threaded=True)
+    startup.mark("http_bound")
+    print(f"[Server] 🌐 HTTP 서버 바인딩 완료 (127.0.0.1:{server.server_port})")
+
+    print("--- Starting Background Init ---")
+    start_background_init(args.ocr_workers, args.perception)
+    metrics.start_reporter()
+
+    if args.profile_startup:
+        run_startup_profile(server, args.profile_startup)
+    else:
+        server.serve_forever()
\ No newline at end of file
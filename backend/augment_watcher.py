@@ -3,14 +3,21 @@ import threading
 import re
 import os
 import difflib
+import functools
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait
 
-import numpy as np
-import cv2
-import mss
-import pytesseract
-import requests
+import lazy_import
+import metrics
+from probe import TemplateProbe
+
+# 무거운 모듈은 감지기가 처음 돌 때 로드 (lazy_import.py 참고)
+np = lazy_import.lazy("numpy")
+cv2 = lazy_import.lazy("cv2")
+mss = lazy_import.lazy("mss")
+pytesseract = lazy_import.lazy("pytesseract")
+requests = lazy_import.lazy("requests")
 
 # =========================
 # PATH & SETTINGS
@@ -21,28 +28,44 @@ def resource_path(relative_path):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
-# Tesseract Setup
-portable_tesseract = resource_path(os.path.join("Tesseract-OCR", "tesseract.exe"))
-if os.path.exists(portable_tesseract):
-    pytesseract.pytesseract.tesseract_cmd = portable_tesseract
-    print(f"[Watcher] Using Portable Tesseract: {portable_tesseract}")
-else:
-    pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-    print("[Watcher] Using System Tesseract (Dev Check)")
-
 # Data Files
 MAPPING_TXT_PATH = resource_path("augment_mapping_full.txt")
 BUTTON_TEMPLATE_PATH = resource_path("assets/augment_confirm_button.png")
 
-BUTTON_TEMPLATE = cv2.imread(BUTTON_TEMPLATE_PATH)
-if BUTTON_TEMPLATE is None:
-    print(f"[Watcher] Warning: Button template not found at {BUTTON_TEMPLATE_PATH}")
-else:
-    print("[Watcher] Button template loaded.")
+BUTTON_TEMPLATE = None
+BUTTON_PROBE = None
+_ENGINE_READY = False
+
+def init_engine():
+    """Tesseract 경로 설정 + 버튼 템플릿 로드 (감지 루프 시작 시 1회)"""
+    global BUTTON_TEMPLATE, BUTTON_PROBE, _ENGINE_READY
+    if _ENGINE_READY: return
+
+    # Tesseract Setup
+    portable_tesseract = resource_path(os.path.join("Tesseract-OCR", "tesseract.exe"))
+    if os.name != "nt":
+        # 리눅스 등 (replay.py 로 오프라인 측정할 때): PATH 의 tesseract 사용
+        print("[Watcher] Using Tesseract from PATH")
+    elif os.path.exists(portable_tesseract):
+        pytesseract.pytesseract.tesseract_cmd = portable_tesseract
+        print(f"[Watcher] Using Portable Tesseract: {portable_tesseract}")
+    else:
+        pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+        print("[Watcher] Using System Tesseract (Dev Check)")
+
+    BUTTON_TEMPLATE = cv2.imread(BUTTON_TEMPLATE_PATH)
+    if BUTTON_TEMPLATE is None:
+        print(f"[Watcher] Warning: Button template not found at {BUTTON_TEMPLATE_PATH}")
+    else:
+        BUTTON_PROBE = TemplateProbe("button", BUTTON_TEMPLATE, BUTTON_THRESHOLD)
+        print("[Watcher] Button template loaded.")
+    _ENGINE_READY = True
 
 # Config
 POLL_INTERVAL = 0.2
 OCR_LANG = "kor"
+OCR_WORKERS = 3         # 카드 OCR 동시 실행 수 (1 이하면 순차 실행)
+OCR_DEADLINE = 0.6      # 한 프레임에서 카드 OCR 결과를 기다리는 최대 시간 (초)
 
 # ROI Coordinates (1920x1080)
 # Cards X
@@ -76,6 +99,7 @@ def load_valid_names():
                     ko, _ = line.split(" : ", 1)
                     names.add(ko.strip())
         VALID_NAMES = list(names)
+        match_valid_name.cache_clear()
         print(f"[Watcher] Loaded {len(VALID_NAMES)} valid names from mapping file.")
     except Exception as e:
         print(f"[Watcher] Error loading mapping: {e}")
@@ -86,57 +110,279 @@ def is_valid_text(text):
     matches = difflib.get_close_matches(text, VALID_NAMES, n=1, cutoff=0.6)
     return len(matches) > 0
 
+UNKNOWN_NAME_SCORE = 0.5  # 매핑 파일에 없는 이름의 일치 점수 (여러 프레임 투표가 필요)
+
+@functools.lru_cache(maxsize=512)
+def match_valid_name(text):
+    """OCR 텍스트 -> (가장 가까운 증강 이름, 일치 점수 0~1). 매핑에 없으면 원문 그대로"""
+    if not VALID_NAMES or text in VALID_NAMES: return text, 1.0
+    matches = difflib.get_close_matches(text, VALID_NAMES, n=1, cutoff=0.6)
+    if not matches: return text, UNKNOWN_NAME_SCORE
+    return matches[0], difflib.SequenceMatcher(None, text, matches[0]).ratio()
+
 def clean_text(text):
     # 특수문자 제거하고 한글/영문/숫자만 남김
     return re.sub(r"[^\w가-힣\s]", "", text).strip()
 
 def preprocess_for_ocr(img_roi):
-    # 2배 확대 + Otsu 이진화
+    # 2배 확대 + Otsu 이진화 (카드 1장 단위, 비교/디버그용)
     gray = cv2.cvtColor(img_roi, cv2.COLOR_BGR2GRAY)
     _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
     h, w = binary.shape
     binary = cv2.resize(binary, (w * 2, h * 2), interpolation=cv2.INTER_CUBIC)
     return binary
 
-def extract_title_text(full_img, x1, x2):
-    # 좌표 계산
+# =========================
+# 전처리 (3장 묶음 + 버퍼 재사용)
+# =========================
+# 확대 배율/보간법은 ocr_sweep.py 로 정확도와 속도를 비교해서 정함
+OCR_UPSCALE = 2
+OCR_INTERPOLATION = "cubic"
+STRIP_GAP = 4  # 스트립 사이 빈 줄 (확대할 때 위아래 카드 글자가 섞이지 않게)
+
+INTERPOLATIONS = {
+    "nearest": "INTER_NEAREST",
+    "linear": "INTER_LINEAR",
+    "cubic": "INTER_CUBIC",
+    "area": "INTER_AREA",
+    "lanczos": "INTER_LANCZOS4",
+}
+
+class StripPreprocessor:
+    """
+    카드 제목 스트립 여러 장을 세로로 쌓은 한 배열에서 흑백 변환/확대를 한 번에 처리
+    버퍼는 ROI 모양이 바뀔 때만 새로 만들고, 매 틱 재사용합니다.
+    주의: process() 가 돌려주는 이미지는 내부 버퍼의 뷰라서 다음 호출 때 덮어써짐
+    """
+    def __init__(self, scale=OCR_UPSCALE, interpolation=OCR_INTERPOLATION):
+        self.scale = scale
+        self.interpolation = getattr(cv2, INTERPOLATIONS[interpolation])
+        self._shapes = None
+
+    def _allocate(self, shapes):
+        self._rows = []
+        y = 0
+        for h, w in shapes:
+            self._rows.append((y, h, w))
+            y += h + STRIP_GAP
+        height, width = y - STRIP_GAP, max(w for _, w in shapes)
+
+        # 빈 칸(좁은 스트립의 오른쪽, 스트립 사이)은 0 으로 남겨 둠
+        self._bgr = np.zeros((height, width, 3), np.uint8)
+        self._gray = np.zeros((height, width), np.uint8)
+        self._binary = np.zeros((height, width), np.uint8)
+        self._scaled = np.zeros((round(height * self.scale), round(width * self.scale)), np.uint8)
+        self._shapes = shapes
+
+    def process(self, rois):
+        shapes = tuple(roi.shape[:2] for roi in rois)
+        if shapes != self._shapes:
+            self._allocate(shapes)
+
+        for (y, h, w), roi in zip(self._rows, rois):
+            self._bgr[y:y + h, :w] = roi
+        cv2.cvtColor(self._bgr, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        # Otsu 임계값은 카드마다 따로 계산 (빈 칸 제외, 결과는 버퍼에 바로 기록)
+        for y, h, w in self._rows:
+            cv2.threshold(self._gray[y:y + h, :w], 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+                          dst=self._binary[y:y + h, :w])
+
+        out_h, out_w = self._scaled.shape
+        cv2.resize(self._binary, (out_w, out_h), dst=self._scaled, interpolation=self.interpolation)
+
+        s = self.scale
+        return [self._scaled[round(y * s):round((y + h) * s), :round(w * s)] for y, h, w in self._rows]
+
+def title_rois(full_img):
+    """왼쪽/가운데/오른쪽 카드 제목 영역 (원본 뷰)"""
     y1_abs = CARD_TOP_Y + TITLE_ROI_Y1
     y2_abs = CARD_TOP_Y + TITLE_ROI_Y2
-    x1_abs = x1 + TITLE_ROI_MARGIN_X
-    x2_abs = x2 - TITLE_ROI_MARGIN_X
-    
-    roi = full_img[y1_abs:y2_abs, x1_abs:x2_abs]
-    if roi.size == 0: return ""
-    
-    processed = preprocess_for_ocr(roi)
-    # Tesseract 실행 --psm 7 (Single Line)
+    return [full_img[y1_abs:y2_abs, x1 + TITLE_ROI_MARGIN_X:x2 - TITLE_ROI_MARGIN_X]
+            for x1, x2 in ((LEFT_CARD_X1, LEFT_CARD_X2), (MID_CARD_X1, MID_CARD_X2),
+                           (RIGHT_CARD_X1, RIGHT_CARD_X2))]
+
+def ocr_title_scored(processed):
+    """Tesseract --psm 7 (Single Line) -> (텍스트, 단어 신뢰도 평균 0~1)"""
     try:
-        raw_text = pytesseract.image_to_string(processed, lang=OCR_LANG, config="--psm 7")
-        text = clean_text(raw_text)
-        return text
+        data = pytesseract.image_to_data(processed, lang=OCR_LANG, config="--psm 7",
+                                         output_type=pytesseract.Output.DICT)
     except Exception as e:
         print(f"[Watcher] OCR Fail: {e}")
-        return ""
+        metrics.inc("ocr_fail")
+        return "", 0.0
+
+    words, weighted, total = [], 0.0, 0
+    for word, conf in zip(data["text"], data["conf"]):
+        word = word.strip()
+        if not word or float(conf) < 0: continue
+        words.append(word)
+        # 긴 단어의 신뢰도가 더 크게 반영되도록 글자 수로 가중 평균
+        weighted += float(conf) * len(word)
+        total += len(word)
+    text = clean_text(" ".join(words))
+    return text, (weighted / total / 100) if total else 0.0
+
+def ocr_title(processed):
+    return ocr_title_scored(processed)[0]
+
+def score_card(processed):
+    """전처리된 제목 이미지 1장 -> (증강 이름, 점수). 못 읽으면 ("", 0.0)"""
+    text, conf = ocr_title_scored(processed)
+    if len(text) <= 1: return "", 0.0
+    # 점수 = OCR 신뢰도 x 증강 이름과의 일치도
+    name, match = match_valid_name(text)
+    return name, conf * match
+
+class CardReader:
+    """
+    카드 3장의 OCR 을 스레드 풀에서 동시에 실행 (Tesseract 는 외부 프로세스라 GIL 과 무관)
+    - deadline 안에 못 끝난 카드는 None (지난 결과를 다시 돌려주면 투표에서 같은 읽기를 매번 또 셈)
+      늦게 끝난 결과는 다음 프레임에 한 번만 반환
+    - 아직 돌고 있는 카드는 새로 넣지 않음 (카드당 작업 1개 -> 큐가 쌓이지 않음)
+    workers <= 1 이면 호출한 스레드에서 순차 실행 (기존 동작)
+    """
+    def __init__(self, workers=OCR_WORKERS, deadline=OCR_DEADLINE):
+        self.workers = workers
+        self.deadline = deadline
+        self.executor = None
+        if workers > 1:
+            # Tesseract 가 프로세스마다 OpenMP 스레드를 여러 개 띄우면 동시 실행 시 서로 경쟁함
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr")
+        self.pending = [None] * 3
+        self.unreported = [None] * 3  # deadline 뒤에 끝나서 아직 반환하지 않은 결과
+
+    def read(self, images):
+        if self.executor is None:
+            return [score_card(img) for img in images]
+
+        submitted = []
+        for i, img in enumerate(images):
+            future = self.pending[i]
+            if future is not None:
+                if not future.done(): continue   # 지난 프레임 작업이 아직 진행 중
+                self.unreported[i] = future.result()  # 새 작업이 늦으면 이번 프레임에 대신 반환
+            # 전처리 버퍼는 다음 프레임에서 덮어쓰므로 복사본을 넘김
+            self.pending[i] = self.executor.submit(score_card, img.copy())
+            submitted.append(i)
+
+        if submitted:
+            wait([self.pending[i] for i in submitted], timeout=self.deadline)
+
+        cards = []
+        for i, future in enumerate(self.pending):
+            if future is not None and future.done():
+                card = future.result()
+                self.pending[i] = None
+                self.unreported[i] = None
+            else:
+                metrics.inc("ocr_late")
+                card, self.unreported[i] = self.unreported[i], None
+            cards.append(card)
+        return cards
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+def read_three_cards(full_img, preprocessor=None, reader=None):
+    """카드 3장 각각 (증강 이름, 점수). 못 읽은 카드는 ("", 0.0), 시간 안에 못 읽은 카드는 None (reader)"""
+    rois = title_rois(full_img)
+    if any(roi.size == 0 for roi in rois): return [("", 0.0)] * 3
+
+    preprocessor = preprocessor or StripPreprocessor()
+    images = preprocessor.process(rois)
+    if reader is None:
+        return [score_card(img) for img in images]
+    return reader.read(images)
+
+def extract_three_titles(full_img, preprocessor=None):
+    titles = [name for name, _ in read_three_cards(full_img, preprocessor) if name]
 
-def extract_three_titles(full_img):
-    t1 = extract_title_text(full_img, LEFT_CARD_X1, LEFT_CARD_X2)
-    t2 = extract_title_text(full_img, MID_CARD_X1, MID_CARD_X2)
-    t3 = extract_title_text(full_img, RIGHT_CARD_X1, RIGHT_CARD_X2)
-    
     # 3개 중 2개 이상이 유효하면 성공
-    raw_titles = [t for t in [t1, t2, t3] if len(t) > 1]
-    if len(raw_titles) < 2: return []
-    
-    return raw_titles
+    if len(titles) < 2: return []
+    return titles
 
-class AugmentWatcher:
+# =========================
+# 카드별 시간 투표 (Temporal Fusion)
+# =========================
+# 카드마다 따로 추적: 점수가 충분히 높으면 첫 프레임에 바로 확정,
+# 아니면 프레임마다 점수를 누적해서 VOTE_THRESHOLD 를 넘으면 확정.
+# 한 카드만 리롤돼도 다른 카드의 확정 상태는 유지됩니다.
+ACCEPT_SCORE = 0.80     # 한 프레임만으로 확정하는 점수
+VOTE_THRESHOLD = 1.2    # 누적 확정 점수
+VOTE_DECAY = 0.5        # 다른 이름이 읽히면 기존 후보 점수를 줄임
+
+class CardVoter:
     def __init__(self):
+        self.votes = {}       # 이름 -> 누적 점수
+        self.accepted = ""    # 확정된 이름
+
+    def reset(self):
+        self.votes.clear()
+        self.accepted = ""
+
+    def update(self, name, score):
+        if not name: return self.accepted  # 이번 프레임에 못 읽음 -> 이전 상태 유지
+
+        for other in list(self.votes):
+            if other != name:
+                self.votes[other] *= VOTE_DECAY
+                if self.votes[other] < 0.05: del self.votes[other]
+        self.votes[name] = self.votes.get(name, 0.0) + score
+
+        if score >= ACCEPT_SCORE or self.votes[name] >= VOTE_THRESHOLD:
+            self.accepted = name
+        return self.accepted
+
+# 증강 선택창 확인용 버튼 영역 (1920x1080 기준 858, 825 ~ 1060, 890)
+BUTTON_ROI = (slice(825, 890), slice(858, 1060))
+BUTTON_THRESHOLD = 0.85
+
+def is_augment_phase(full_img, use_probe=True):
+    """증강 선택창인지 확인 (Confirm 버튼 템플릿 매칭, 픽셀 프로브로 대부분 생략)"""
+    if BUTTON_TEMPLATE is None:
+        # 템플릿 파일이 없으면 그냥 OCR 결과만 믿음 (기존 동작)
+        return True
+
+    # 사용자 요청: 유사도 0.85 이상일 때만 인정
+    # (버튼이 없으면 OCR 결과가 있어도 무시 - 오인식 방지)
+    return BUTTON_PROBE.match(full_img[BUTTON_ROI], use_probe)
+
+def warm_up():
+    """
+    OCR 엔진 예열: 엔진/템플릿 로드 + 빈 프레임으로 버튼 확인과 OCR 1회
+    (첫 증강 화면에서 Tesseract 언어 데이터 로드 / cv2 초기화 비용이 생기지 않도록)
+    """
+    init_engine()
+    started = time.perf_counter()
+    blank = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    is_augment_phase(blank)
+    processed = StripPreprocessor().process(title_rois(blank))
+    ocr_title_scored(processed[0])
+    return (time.perf_counter() - started) * 1000
+
+class AugmentWatcher:
+    """
+    sender: (active, titles=None) 를 받는 전송 함수 (기본: 서버로 POST)
+    clock : 현재 시각 함수 (기본: time.time, 리플레이에서는 가짜 시계)
+    ocr_workers: 카드 OCR 동시 실행 수 (기본: OCR_WORKERS)
+    should_scan: 이번 주기에 OCR 을 돌릴지 (기본: 항상, 서버는 live_client 의 증강 레벨 창 사용)
+    """
+    def __init__(self, sender=None, clock=time.time, ocr_workers=None, should_scan=None):
         self._stop_event = threading.Event()
         self._thread = None
         self.last_sent_titles = []
         self.last_sent_time = 0
-        self.stability_count = 0
-        self.last_candidates = []
+        self.voters = [CardVoter() for _ in range(3)]
+        self.preprocessor = None  # 감지 루프에서 생성 (cv2 로드 후)
+        self.sender = sender or self._send_update
+        self.clock = clock
+        self.last_timings = {}    # 마지막 프레임의 단계별 소요 시간 (ms)
+        self.reader = CardReader(OCR_WORKERS if ocr_workers is None else ocr_workers)
+        self.should_scan = should_scan or (lambda: True)
 
     def start(self):
         load_valid_names()
@@ -149,69 +395,73 @@ class AugmentWatcher:
         self._stop_event.set()
         if self._thread:
             self._thread.join()
+        self.reader.close()
 
     def _loop(self):
         print("[Watcher] OCR Monitoring started...")
+        init_engine()
         with mss.mss() as sct:
             while not self._stop_event.is_set():
                 time.sleep(POLL_INTERVAL)
+                # 증강 선택 시점이 아니면 캡처/OCR 생략 (떠 있는 오버레이는 닫힐 때까지 계속 감시)
+                if not self.last_sent_titles and not self.should_scan(): continue
                 try:
                     # 화면 캡처
-                    monitor = sct.monitors[1]
-                    img = np.array(sct.grab(monitor))
-                    full_img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-                    
-                    title_titles = extract_three_titles(full_img)
-                    
-                    # [추가] 증강 선택창인지 확실하게 확인 (Confirm Button Check)
-                    # 좌표: 858, 825 ~ 1060, 890
-                    btn_roi = full_img[825:890, 858:1060]
-                    is_augment_phase = False
-                    
-                    if BUTTON_TEMPLATE is not None:
-                        # 템플릿 매칭
-                        res = cv2.matchTemplate(btn_roi, BUTTON_TEMPLATE, cv2.TM_CCOEFF_NORMED)
-                        _, max_val, _, _ = cv2.minMaxLoc(res)
-                        
-                        # 사용자 요청: 유사도 0.85 이상일 때만 인정
-                        if max_val >= 0.85:
-                            is_augment_phase = True
-                        else:
-                            # 버튼이 없으면 OCR 결과가 있어도 무시 (오인식 방지)
-                            # print(f"[Watcher] Button Score: {max_val:.2f} (Required: 0.85)")
-                            pass
-                    else:
-                        # 템플릿 파일이 없으면 그냥 OCR 결과만 믿음 (기존 동작)
-                        is_augment_phase = True
-
-                    if not is_augment_phase or not title_titles:
-                        # 리셋 로직
-                        self.stability_count = 0
-                        if self.last_sent_titles:
-                            # print("[Watcher] Cleared (No Button or Titles).")
-                            self._send_update(active=False)
-                            self.last_sent_titles = []
-                        continue
-
-                    # 안정화 (흔들림 방지, 2회 연속 일치)
-                    if title_titles == self.last_candidates:
-                        self.stability_count += 1
-                    else:
-                        self.stability_count = 1
-                        self.last_candidates = title_titles
-                    
-                    if self.stability_count >= 2:
-                        # 중복 전송 방지 (3초 쿨타임)
-                        if (title_titles != self.last_sent_titles) or (time.time() - self.last_sent_time > 3.0):
-                            print(f"[Watcher] Detect: {title_titles}")
-                            self._send_update(active=True, titles=title_titles)
-                            self.last_sent_titles = title_titles
-                            self.last_sent_time = time.time()
-                            
+                    with metrics.span("capture"):
+                        monitor = sct.monitors[1]
+                        img = np.array(sct.grab(monitor))
+                        full_img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+                    self.process_frame(full_img)
                 except Exception as e:
                     print(f"[Watcher] Error: {e}")
                     time.sleep(1)
 
+    def process_frame(self, full_img, now=None):
+        """
+        BGR 프레임 1장 처리 (실시간 루프와 replay.py 가 같은 경로 사용)
+        반환: {"titles": 확정된 카드 이름, "cards": 이 프레임의 카드별 (이름, 점수) 또는 None(시간 초과),
+               "augment_phase": 버튼 확인 여부}
+        """
+        if self.preprocessor is None:
+            self.preprocessor = StripPreprocessor()
+        now = self.clock() if now is None else now
+
+        started = time.perf_counter()
+        cards = read_three_cards(full_img, self.preprocessor, self.reader)
+        ocr_done = time.perf_counter()
+
+        # [추가] 증강 선택창인지 확실하게 확인 (Confirm Button Check)
+        augment_phase = is_augment_phase(full_img)
+        button_done = time.perf_counter()
+        self.last_timings = {"ocr": (ocr_done - started) * 1000, "button": (button_done - ocr_done) * 1000}
+        metrics.observe("ocr", ocr_done - started)
+        metrics.observe("button", button_done - ocr_done)
+
+        # 시간 안에 못 읽은 카드(None)가 있으면 "카드 없음"으로 보지 않음
+        if not augment_phase or (None not in cards and not any(name for name, _ in cards)):
+            # 리셋 로직
+            for voter in self.voters: voter.reset()
+            if self.last_sent_titles:
+                # print("[Watcher] Cleared (No Button or Titles).")
+                self.sender(active=False)
+                self.last_sent_titles = []
+            return {"titles": [], "cards": cards, "augment_phase": augment_phase}
+
+        # 카드별 투표 -> 확정된 카드만 (왼쪽부터 순서 유지). 새로 읽지 못한 카드는 투표하지 않음
+        title_titles = [t for t in (voter.update(*card) if card is not None else voter.accepted
+                                    for voter, card in zip(self.voters, cards)) if t]
+        result = {"titles": title_titles, "cards": cards, "augment_phase": augment_phase}
+
+        # 3개 중 2개 이상 확정되면 전송
+        if len(title_titles) >= 2:
+            # 중복 전송 방지 (3초 쿨타임)
+            if (title_titles != self.last_sent_titles) or (now - self.last_sent_time > 3.0):
+                print(f"[Watcher] Detect: {title_titles}")
+                self.sender(active=True, titles=title_titles)
+                self.last_sent_titles = title_titles
+                self.last_sent_time = now
+        return result
+
     def _send_update(self, active, titles=None):
         try:
             data = {"active": active}
@@ -20,9 +20,13 @@ a = Analysis(
         ('data/aram_builds.json', 'data'),
         ('shop_template.png', '.'),
         ('game_data.db', '.'),
+        ('runtime_data.json', '.'), # compile_data.py 로 생성한 런타임 번들
+        ('ranking.npz', '.'), # compile_data.py 로 생성한 증강 점수 행렬
         ('Tesseract-OCR', 'Tesseract-OCR') # 🔥 [필수] Tesseract 포함
     ],
-    hiddenimports=['engineio.async_drivers.threading', 'cv2', 'numpy', 'PIL', 'mss', 'requests', 'lcu_driver', 'win32gui'],
+    # cv2 ~ win32gui: lazy_import.lazy() 로 문자열 임포트하는 모듈 (lazy_import.LAZY_MODULES 와 같게 유지)
+    hiddenimports=['engineio.async_drivers.threading', 'cv2', 'numpy', 'PIL', 'mss', 'pytesseract', 'requests',
+                   'psutil', 'win32gui', 'lcu_driver'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
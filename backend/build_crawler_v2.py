@@ -2,32 +2,32 @@ import time
 import json
 import os
 import re
+import argparse
+import hashlib
+import tempfile
+import threading
+import functools
+import http.server
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-
-# ==========================================
-# 1. 챔피언 이름 예외 처리 (Lolalytics URL 규칙)
-# ==========================================
-URL_EXCEPTIONS = {
-    "Renata": "renata",
-    "MonkeyKing": "wukong",
-    "Nunu": "nunu",
-    "DrMundo": "drmundo",
-    "JarvanIV": "jarvaniv",
-    "LeeSin": "leesin",
-    "MasterYi": "masteryi",
-    "MissFortune": "missfortune",
-    "TahmKench": "tahmkench",
-    "TwistedFate": "twistedfate",
-    "XinZhao": "xinzhao",
-    "KogMaw": "kogmaw",
-    "RekSai": "reksai",
-    "Belveth": "belveth",
-    "Glasc": "renata" 
-}
+import lxml.html
+# selenium 은 브라우저 모드에서만 필요 -> 함수 안에서 임포트 (--fetcher http / 픽스처 파싱은 selenium 없이 동작)
+
+import registry
+
+BASE_URL = "https://lolalytics.com"
+DEFAULT_OUT_PATH = os.path.join("..", "backend", "data", "aram_builds.json")
+# 실제 사이트가 아닌 곳(--fixtures, --base-url)에서 받은 결과는 --out 을 주지 않으면 임시 폴더에 저장
+# (로컬 테스트가 실제 빌드 데이터와 저널을 덮어쓰지 않도록)
+TEST_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "build_crawler")
 
+# 섹션이 렌더링될 때까지 기다리는 최대 시간 (고정 sleep 대신)
+SECTION_WAIT_TIMEOUT = 10
+
+# ==========================================
+# 1. 챔피언 목록 / URL 슬러그 (이름 예외 처리는 registry.py)
+# ==========================================
 def get_champion_list():
     """라이엇 API에서 최신 챔피언 목록 가져오기"""
     try:
@@ -41,9 +41,8 @@ def get_champion_list():
         return ["Gwen", "Ezreal", "Ahri"] 
 
 def get_slug(champ_id):
-    """챔피언 ID를 Lolalytics URL 슬러그로 변환"""
-    if champ_id in URL_EXCEPTIONS: return URL_EXCEPTIONS[champ_id]
-    return champ_id.lower().replace(" ", "").replace("'", "").replace(".", "")
+    """챔피언 ID를 Lolalytics URL 슬러그로 변환 (예외 목록은 registry.LOLALYTICS_SLUGS)"""
+    return registry.lolalytics_slug(champ_id)
 
 def extract_id_from_url(url):
     """URL에서 아이템 ID 숫자만 추출 (예: .../1001.webp -> 1001)"""
@@ -59,6 +58,7 @@ def parse_starting_items(driver):
     [수정] 시작 아이템은 하나의 박스 안에 여러 아이템이 있고,
     승률/게임 수는 박스 맨 아래에 단 하나만 존재함.
     """
+    from selenium.webdriver.common.by import By
     items = []
     try:
         # 1. "Starting Items" 텍스트를 포함한 최상위 컨테이너 찾기
@@ -107,6 +107,7 @@ def parse_section(driver, header_text):
     일반 섹션: 아이템별로 승률이 따로 붙어있는 경우 (Item 4, 5, 6 등)
     또는 코어 빌드처럼 순서대로 나열된 경우
     """
+    from selenium.webdriver.common.by import By
     items = []
     try:
         # 해당 헤더를 가진 컨테이너 찾기
@@ -156,58 +157,437 @@ def parse_section(driver, header_text):
         
     return items
 
-def crawl_builds():
+# ==========================================
+# 3-1. 한 번에 추출 + 로컬 파싱 (빠른 경로)
+# ==========================================
+# 위 parse_* 함수들은 블록/이미지/승률마다 find_element 를 호출해서
+# 챔피언 1명당 WebDriver 왕복이 수십 번 생깁니다.
+# 아래 경로는 execute_script 1번으로 섹션 HTML 을 통째로 가져와 lxml 로 파싱합니다.
+SECTION_HEADERS = ["Starting Items", "Core Build", "Item 4", "Item 5", "Item 6"]
+
+def _section_xpath(header_text):
+    return f"//div[contains(text(), '{header_text}')]/ancestor::div[contains(@class, 'basis')]"
+
+def _class_xpath(tag, cls):
+    # CSS "tag.cls" 와 같은 XPath (클래스 토큰 단위 비교)
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+# 헤더별로 컨테이너 outerHTML 을 문서 순서대로 반환 (find_elements 와 같은 순서)
+EXTRACT_SECTIONS_JS = """
+const out = {};
+for (const [header, xpath] of arguments[0]) {
+    const res = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const htmls = [];
+    for (let i = 0; i < res.snapshotLength; i++) htmls.push(res.snapshotItem(i).outerHTML);
+    out[header] = htmls;
+}
+return out;
+"""
+
+def _first_text(element, xpath):
+    found = element.xpath(xpath)
+    return found[0].text_content().strip() if found else ""
+
+def parse_starting_items_html(containers):
+    """parse_starting_items 와 같은 결과를 lxml 요소에서 추출"""
+    items = []
+    for container in containers:
+        win_rate = _first_text(container, _class_xpath("span", "text-green-500"))
+        win_rate = win_rate.replace("%", "").replace(" Win Rate", "").strip()
+        games = _first_text(container, _class_xpath("span", "text-gray-400")).replace(" Games", "").strip()
+
+        for img in container.xpath(_class_xpath("div", "h-[34px]") + "//img"):
+            item_id = extract_id_from_url(img.get("src"))
+            if item_id:
+                # 모든 아이템에 동일한 승률 적용
+                items.append({"id": item_id, "win": win_rate, "games": games})
+    return items
+
+def parse_section_html(container):
+    """parse_section 과 같은 결과를 lxml 요소에서 추출"""
+    items = []
+    if container is None: return items
+
+    for block in container.xpath(_class_xpath("div", "text-center")):
+        imgs = block.xpath(".//img")
+        if not imgs: continue
+        item_id = extract_id_from_url(imgs[0].get("src"))
+        if not item_id: continue
+
+        win_rate = _first_text(block, _class_xpath("span", "text-green-500")).replace("%", "").strip()
+        games = _first_text(block, _class_xpath("span", "text-gray-400")).replace(" Games", "").strip()
+        items.append({"id": item_id, "win": win_rate, "games": games})
+    return items
+
+def parse_build_sections(sections):
+    """{헤더: [lxml 요소, ...]} -> 빌드 데이터"""
+    def first(header):
+        found = sections.get(header) or []
+        return found[0] if found else None
+
+    return {
+        "starting": parse_starting_items_html(sections.get("Starting Items") or []),  # 시작 아이템 전용
+        "core": parse_section_html(first("Core Build")),
+        "item4": parse_section_html(first("Item 4")),
+        "item5": parse_section_html(first("Item 5")),
+        "item6": parse_section_html(first("Item 6")),
+    }
+
+def extract_build(driver):
+    """브라우저 왕복 1번으로 빌드 데이터 추출"""
+    raw = driver.execute_script(EXTRACT_SECTIONS_JS, [[h, _section_xpath(h)] for h in SECTION_HEADERS])
+    sections = {h: [lxml.html.fromstring(html) for html in (raw.get(h) or [])] for h in SECTION_HEADERS}
+    return parse_build_sections(sections)
+
+def extract_build_from_html(page_html):
+    """저장된/정적 HTML 전체에서 빌드 데이터 추출 (브라우저 없이)"""
+    doc = lxml.html.fromstring(page_html)
+    return parse_build_sections({h: doc.xpath(_section_xpath(h)) for h in SECTION_HEADERS})
+
+def extract_build_legacy(driver):
+    """예전 방식 (요소마다 WebDriver 호출) - 벤치마크 비교용"""
+    return {
+        "starting": parse_starting_items(driver),
+        "core": parse_section(driver, "Core Build"),
+        "item4": parse_section(driver, "Item 4"),
+        "item5": parse_section(driver, "Item 5"),
+        "item6": parse_section(driver, "Item 6"),
+    }
+
+# ==========================================
+# 4. 브라우저 / 페이지 단위 크롤링
+# ==========================================
+def make_driver(headless=True):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     # 브라우저 옵션 설정
     options = Options()
-    # options.add_argument("--headless") # 디버깅 시에는 주석 처리 (브라우저 화면 보임)
+    if headless:
+        options.add_argument("--headless=new")  # 디버깅 시 --headed 로 실행 (브라우저 화면 보임)
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--log-level=3") # 불필요한 로그 숨김
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36")
+    return webdriver.Chrome(options=options)
+
+def build_url(slug, base_url=BASE_URL):
+    return f"{base_url.rstrip('/')}/lol/{slug}/aram/build/"
+
+def wait_for_sections(driver, timeout=SECTION_WAIT_TIMEOUT):
+    """시작 아이템 / 코어 빌드 섹션이 나타날 때까지 대기 (없으면 timeout 후 진행)"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+
+    xpath = "//div[contains(text(), 'Starting Items') or contains(text(), 'Core Build')]"
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
+        return True
+    except TimeoutException:
+        return False
+
+def crawl_champion(driver, champ, base_url=BASE_URL):
+    """챔피언 1명 수집. 데이터가 없으면 None"""
+    url = build_url(get_slug(champ), base_url)
+    driver.get(url)
+    if not wait_for_sections(driver):
+        print(f"⚠️ {champ} 섹션 로딩 시간 초과 ({url})")
+
+    # 데이터 수집 (섹션 HTML 한 번에 가져와서 로컬 파싱)
+    build_data = extract_build(driver)
     
-    driver = webdriver.Chrome(options=options)
-    champions = get_champion_list()
-    all_data = {}
+    # 데이터가 유의미하면 저장
+    if build_data["starting"] or build_data["core"]:
+        return build_data
+    return None
 
-    print(f"🚀 총 {len(champions)}개 챔피언 크롤링 시작...")
+def crawl_champion_http(champ, base_url=BASE_URL):
+    """
+    브라우저 없이 HTML 만 받아서 파싱 (서버 렌더링된 페이지일 때 사용 가능)
+    페이지에 심어진 JSON 을 읽는 방식은 쓰지 않음: 그 형식이 문서화돼 있지 않고 배포마다 바뀜.
+    대신 브라우저 모드와 같은 섹션 XPath 로 HTML 을 파싱함 (두 모드의 결과가 같음)
+    """
+    url = build_url(get_slug(champ), base_url)
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36"}
+    res = requests.get(url, headers=headers, timeout=15)
+    res.raise_for_status()
 
-    for i, champ in enumerate(champions):
-        slug = get_slug(champ)
-        url = f"https://lolalytics.com/lol/{slug}/aram/build/"
-        print(f"[{i+1}/{len(champions)}] {champ} 수집 중... ({slug})")
+    build_data = extract_build_from_html(res.text)
+    if build_data["starting"] or build_data["core"]:
+        return build_data
+    return None
 
+# ==========================================
+# 5. 워커 프로세스 (프로세스마다 브라우저 1개)
+# ==========================================
+_WORKER_DRIVER = None
+
+def _init_worker(headless, fetcher="browser"):
+    global _WORKER_DRIVER
+    if fetcher != "browser": return  # http 모드는 브라우저 불필요
+    _WORKER_DRIVER = make_driver(headless)
+    # 워커 프로세스 종료 시 브라우저도 닫기
+    multiprocessing.util.Finalize(None, _WORKER_DRIVER.quit, exitpriority=10)
+
+def _crawl_in_worker(champ, base_url):
+    if _WORKER_DRIVER is None:
+        return crawl_champion_http(champ, base_url)
+    return crawl_champion(_WORKER_DRIVER, champ, base_url)
+
+# ==========================================
+# 6. 로컬 픽스처 서버 (오프라인 테스트용)
+# ==========================================
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass  # 요청 로그 숨김
+
+def serve_fixtures(directory):
+    """
+    저장해 둔 HTML 을 로컬 HTTP 서버로 제공하고 base_url 반환
+    디렉터리 구조: <directory>/lol/<slug>/aram/build/index.html
+    """
+    handler = functools.partial(_QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+def fixture_champions(directory):
+    """픽스처 폴더의 슬러그 목록 (<directory>/lol/<slug>)"""
+    lol_dir = os.path.join(directory, "lol")
+    return sorted(os.listdir(lol_dir)) if os.path.isdir(lol_dir) else []
+
+def champions_from_slugs(slugs, known):
+    """Lolalytics 슬러그 -> DDragon 챔피언 ID (결과 파일 키와 맞춤). 모르는 슬러그는 그대로"""
+    by_slug = {}
+    for champ in list(known) + list(registry.LOLALYTICS_SLUGS):
+        by_slug.setdefault(get_slug(champ), champ)
+    unknown = [slug for slug in slugs if slug not in by_slug]
+    if unknown: print(f"⚠️ 챔피언 ID 를 모르는 슬러그 (그대로 사용): {', '.join(unknown)}")
+    return [by_slug.get(slug, slug) for slug in slugs]
+
+# ==========================================
+# 7. 크롤링 저널 (챔피언별 즉시 저장 / 이어하기)
+# ==========================================
+# 챔피언 1명이 끝날 때마다 저널(JSON Lines)에 한 줄씩 추가합니다.
+# - 중간에 죽어도 다음 실행에서 끝난 챔피언은 건너뜀 (TTL 이내)
+# - 내용 해시로 실제로 바뀐 챔피언만 구분
+DEFAULT_TTL_HOURS = 24
+
+def journal_path_for(save_path):
+    return os.path.splitext(save_path)[0] + ".journal.jsonl"
+
+def content_hash(data):
+    raw = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+def load_journal(path):
+    """저널 읽기 -> {champ: 마지막 기록}. 깨진 줄(쓰다 죽은 경우)은 무시"""
+    entries = {}
+    if not os.path.exists(path): return entries
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                entries[entry["champion"]] = entry
+            except (ValueError, KeyError):
+                continue
+    return entries
+
+def append_journal(path, entry):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def load_builds(path):
+    """기존 결과 파일 읽기 -> {champ: 빌드 데이터} (없거나 깨졌으면 빈 dict)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def seed_journal(journal, save_path):
+    """
+    저널에 없는 챔피언은 기존 결과 파일에서 채움 (수집 시각 0 -> TTL 과 무관하게 다시 수집)
+    결과 파일은 저널만으로 다시 만들기 때문에, 저널이 없던 첫 실행이나 일부만 수집한 실행에서
+    나머지 챔피언이 빠지지 않도록 함. 수집에 실패한 챔피언도 이 기록이 그대로 남음
+    """
+    seeded = 0
+    for champ, data in load_builds(save_path).items():
+        if champ in journal or not data: continue
+        journal[champ] = {"champion": champ, "slug": get_slug(champ), "hash": content_hash(data),
+                          "fetched_at": 0, "data": data}
+        seeded += 1
+    return seeded
+
+def compact_journal(path, entries):
+    """챔피언당 마지막 기록 1줄만 남기도록 저널 다시 쓰기"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for entry in entries.values():
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+# ==========================================
+# 8. 전체 크롤링
+# ==========================================
+def crawl_builds(workers=4, headless=True, base_url=BASE_URL, champions=None, save_path=DEFAULT_OUT_PATH,
+                 ttl_hours=DEFAULT_TTL_HOURS, fresh=False, fetcher="browser"):
+    champions = champions or get_champion_list()
+    os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+    journal_path = journal_path_for(save_path)
+    journal = {} if fresh else load_journal(journal_path)
+    seeded = seed_journal(journal, save_path)
+    if seeded: print(f"📂 기존 결과 파일에서 {seeded}명 불러옴 (실패하면 이 결과를 유지)")
+
+    # TTL 이내에 수집된 챔피언은 건너뜀 (이어하기)
+    now = time.time()
+    todo = [c for c in champions
+            if c not in journal or now - journal[c]["fetched_at"] > ttl_hours * 3600]
+    stats = {"changed": 0, "unchanged": 0, "skipped": len(champions) - len(todo), "failed": 0}
+
+    def record(champ, data):
+        """수집 결과를 저널에 기록. 빈 결과는 실패로 세고 이전 기록을 유지 (다음 실행에서 재시도)"""
+        if not data:
+            stats["failed"] += 1
+            kept = " (이전 수집분 유지)" if champ in journal else ""
+            print(f"❌ {champ} 수집 실패: 빌드 섹션이 비어 있음{kept}")
+            return False
+        digest = content_hash(data)
+        previous = journal.get(champ)
+        stats["unchanged" if previous and previous["hash"] == digest else "changed"] += 1
+        entry = {"champion": champ, "slug": get_slug(champ), "hash": digest,
+                 "fetched_at": time.time(), "data": data}
+        journal[champ] = entry
+        append_journal(journal_path, entry)
+        return True
+
+    print(f"🚀 총 {len(champions)}개 중 {len(todo)}개 챔피언 크롤링 시작... "
+          f"(워커 {workers}개, {stats['skipped']}개는 {ttl_hours}시간 이내 수집분 재사용)")
+    started = time.time()
+
+    if not todo:
+        pass
+    elif workers <= 1:
+        driver = make_driver(headless) if fetcher == "browser" else None
         try:
-            driver.get(url)
-            # 페이지 로딩 대기 (네트워크 느리면 늘려주세요)
-            time.sleep(2.5) 
-
-            # 데이터 수집
-            build_data = {
-                "starting": parse_starting_items(driver),  # 시작 아이템 전용
-                "core": parse_section(driver, "Core Build"),
-                "item4": parse_section(driver, "Item 4"),
-                "item5": parse_section(driver, "Item 5"),
-                "item6": parse_section(driver, "Item 6"),
-            }
-            
-            # 데이터가 유의미하면 저장
-            if build_data["starting"] or build_data["core"]:
-                all_data[champ] = build_data
-                
-        except Exception as e:
-            print(f"❌ {champ} 수집 실패: {e}")
+            for i, champ in enumerate(todo):
+                print(f"[{i+1}/{len(todo)}] {champ} 수집 중... ({get_slug(champ)})")
+                try:
+                    if driver is None:
+                        record(champ, crawl_champion_http(champ, base_url))
+                    else:
+                        record(champ, crawl_champion(driver, champ, base_url))
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"❌ {champ} 수집 실패: {e}")
+        finally:
+            if driver is not None: driver.quit()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(headless, fetcher)) as pool:
+            futures = {pool.submit(_crawl_in_worker, champ, base_url): champ for champ in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                champ = futures[future]
+                try:
+                    if record(champ, future.result()):
+                        print(f"[{done}/{len(todo)}] {champ} 완료")
+                except Exception as e:
+                    stats["failed"] += 1
+                    print(f"❌ {champ} 수집 실패: {e}")
 
-    driver.quit()
+    # 완료 순서와 무관하게 챔피언 목록 순서대로 합침 (항상 같은 결과 파일)
+    # 이번 목록에 없는 챔피언도 저널에 있으면 유지 (--champions 로 일부만 갱신한 경우)
+    order = list(champions) + sorted(c for c in journal if c not in set(champions))
+    all_data = {champ: journal[champ]["data"] for champ in order
+                if champ in journal and journal[champ]["data"]}
 
-    # JSON 파일 저장
+    # JSON 파일 저장 (임시 파일에 쓰고 교체 -> 쓰다 죽어도 기존 파일 유지)
     # 저장 경로: backend/data/aram_builds.json
-    save_dir = os.path.join("..", "backend", "data")
-    os.makedirs(save_dir, exist_ok=True)
-    save_path = os.path.join(save_dir, "aram_builds.json")
-    
-    with open(save_path, "w", encoding="utf-8") as f:
+    tmp_path = save_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(all_data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, save_path)
+    compact_journal(journal_path, journal)
+
+    print(f"\n✅ 크롤링 완료! ({time.time() - started:.0f}초, {len(all_data)}명) 저장된 파일: {os.path.abspath(save_path)}")
+    print(f"   변경 {stats['changed']} / 동일 {stats['unchanged']} / 건너뜀 {stats['skipped']} / 실패 {stats['failed']}")
+    return all_data
 
-    print(f"\n✅ 크롤링 완료! 저장된 파일: {os.path.abspath(save_path)}")
+# ==========================================
+# 9. 파싱 벤치마크 (저장된 페이지 기준)
+# ==========================================
+def benchmark_parse(fixtures_dir, headless=True, repeat=3):
+    """챔피언 1명당 파싱 시간: 예전 방식(요소별 WebDriver 호출) vs 한 번에 추출"""
+    base_url = serve_fixtures(fixtures_dir)
+    champions = fixture_champions(fixtures_dir)
+    driver = make_driver(headless)
+    legacy_ms, fast_ms = [], []
+    try:
+        for champ in champions:
+            driver.get(build_url(champ, base_url))
+            wait_for_sections(driver)
+
+            started = time.perf_counter()
+            for _ in range(repeat): legacy = extract_build_legacy(driver)
+            legacy_ms.append((time.perf_counter() - started) / repeat * 1000)
+
+            started = time.perf_counter()
+            for _ in range(repeat): fast = extract_build(driver)
+            fast_ms.append((time.perf_counter() - started) / repeat * 1000)
+
+            same = "OK" if legacy == fast else "DIFF"
+            print(f"{champ:16} legacy {legacy_ms[-1]:8.1f} ms   fast {fast_ms[-1]:7.1f} ms   [{same}]")
+    finally:
+        driver.quit()
+
+    if champions:
+        avg_legacy = sum(legacy_ms) / len(legacy_ms)
+        avg_fast = sum(fast_ms) / len(fast_ms)
+        print(f"{'평균':16} legacy {avg_legacy:8.1f} ms   fast {avg_fast:7.1f} ms   (x{avg_legacy / max(avg_fast, 1e-6):.1f})")
 
 if __name__ == "__main__":
-    crawl_builds()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Lolalytics ARAM 빌드 크롤러")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 띄울 브라우저 수 (1 = 순차)")
+    parser.add_argument("--headed", action="store_true", help="브라우저 화면 표시 (디버깅용)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--fixtures", help="저장된 HTML 디렉터리를 로컬 서버로 띄워서 크롤링 (오프라인 테스트)")
+    parser.add_argument("--champions", help="쉼표로 구분한 챔피언 목록 (기본: DDragon 전체)")
+    parser.add_argument("--out", help=f"기본값: {DEFAULT_OUT_PATH} (--fixtures / --base-url 은 임시 폴더)")
+    parser.add_argument("--ttl-hours", type=float, default=DEFAULT_TTL_HOURS,
+                        help="이 시간 안에 수집한 챔피언은 다시 받지 않음 (0 = 전부 다시)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="저널 무시하고 전부 다시 수집 (실패한 챔피언은 기존 결과 유지)")
+    parser.add_argument("--fetcher", choices=["browser", "http"], default="browser",
+                        help="http: 브라우저 없이 HTML 만 받아 같은 XPath 로 파싱 (서버 렌더링 페이지용, selenium 불필요)")
+    parser.add_argument("--bench", action="store_true", help="--fixtures 페이지로 파싱 속도 비교만 실행")
+    args = parser.parse_args()
+
+    if args.bench:
+        if not args.fixtures: parser.error("--bench 는 --fixtures 가 필요합니다")
+        benchmark_parse(args.fixtures, headless=not args.headed)
+        raise SystemExit(0)
+
+    base_url = args.base_url
+    champions = args.champions.split(",") if args.champions else None
+    if args.fixtures:
+        base_url = serve_fixtures(args.fixtures)
+        if not champions:
+            # 픽스처 폴더 이름은 슬러그 -> 실제 결과 파일의 챔피언 ID 로 (없으면 DDragon 목록)
+            known = list(load_builds(DEFAULT_OUT_PATH)) or get_champion_list()
+            champions = champions_from_slugs(fixture_champions(args.fixtures), known)
+
+    out_path = args.out
+    if out_path is None:
+        if args.fixtures or base_url != BASE_URL:
+            os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
+            out_path = os.path.join(TEST_OUTPUT_DIR, os.path.basename(DEFAULT_OUT_PATH))
+            print(f"🧪 테스트 실행: 결과/저널은 {out_path} 에 저장")
+        else:
+            out_path = DEFAULT_OUT_PATH
+
+    crawl_builds(workers=args.workers, headless=not args.headed, base_url=base_url,
+                 champions=champions, save_path=out_path, ttl_hours=args.ttl_hours, fresh=args.fresh,
+                 fetcher=args.fetcher)
@@ -0,0 +1,122 @@
+"""
+런타임 데이터 번들 생성 (오프라인 빌드 단계)
+
+서버가 시작할 때마다 game_data.db + augment_mapping_full.txt + augments_global_ko.json
++ data/aram_builds.json 을 각각 읽고 이름을 정규화하던 작업을 미리 해 두고,
+서버가 실제로 응답에 쓰는 필드만 runtime_data.json 하나로 저장합니다.
+database.load_all_data_to_memory() 는 이 파일이 있고 원본과 일치하면 한 번에 읽어서 씁니다.
+증강 추천 점수 행렬(ranking.py)도 같은 데이터로 계산해서 ranking.npz 로 저장합니다.
+
+데이터(DB, 매핑, 팁 번역, 빌드)를 바꾼 뒤에는 다시 실행하세요:
+    python compile_data.py
+"""
+import os
+import json
+import sqlite3
+import time
+import argparse
+
+import database
+import ranking
+from database import normalize_name
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUT_PATH = os.path.join(BASE_DIR, "runtime_data.json")
+RANKING_OUT_PATH = os.path.join(BASE_DIR, "ranking.npz")
+
+
+def _use_backend_paths():
+    """database 의 경로를 현재 작업 폴더가 아니라 이 파일 기준으로 고정"""
+    database.DB_NAME = os.path.join(BASE_DIR, "game_data.db")
+    database.GLOBAL_AUG_JSON_PATH = os.path.join(BASE_DIR, "augments_global_ko.json")
+    database.MAPPING_TXT_PATH = os.path.join(BASE_DIR, "augment_mapping_full.txt")
+    database.BUILD_JSON_PATH = os.path.join(BASE_DIR, "data", "aram_builds.json")
+    database.RUNTIME_BUNDLE_SOURCES = {
+        name: os.path.join(BASE_DIR, *name.split("/")) for name in database.RUNTIME_BUNDLE_SOURCES}
+    database.invalidate_read_connections()
+
+
+def compile_bundle():
+    _use_backend_paths()
+
+    # 1. 매핑 텍스트 -> DB 동기화 (서버와 같은 증분 임포터)
+    result = database.import_mapping_file(database.MAPPING_TXT_PATH, db_path=database.DB_NAME)
+    if result["error"]:
+        raise SystemExit(f"❌ 매핑 반영 실패, 번들을 만들지 않음: {result['error']}")
+
+    # 2. 원본에서 메모리 맵 생성 (서버의 원본 로더를 그대로 사용 -> 결과 동일 보장)
+    database._load_from_sources()
+
+    # 3. 빌드 데이터 (챔피언 이름 정규화)
+    builds = {}
+    if os.path.exists(database.BUILD_JSON_PATH):
+        with open(database.BUILD_JSON_PATH, "r", encoding="utf-8") as f:
+            for name, data in json.load(f).items():
+                builds[normalize_name(name)] = data
+
+    sources = {name: database.source_fingerprint(path)
+               for name, path in database.RUNTIME_BUNDLE_SOURCES.items() if os.path.exists(path)}
+    if os.path.exists(database.DB_NAME):
+        sources[database.RUNTIME_BUNDLE_DB_SOURCE] = database.db_fingerprint()
+
+    return {
+        "format": database.RUNTIME_BUNDLE_FORMAT,
+        "sources": sources,
+        "champions": database._CHAMPION_CACHE_NORMALIZED,
+        "champion_ids": database._CHAMPION_ID_BY_NORM,
+        "champion_augments": {cid: [list(r) for r in rows]
+                              for cid, rows in database._CHAMPION_AUGMENTS.items()},
+        "augments": database._AUGMENT_NAMES,
+        "tiers": database._TIER_LABELS,
+        "augment_types": database._AUGMENT_TYPE_LABELS,
+        "augment_map": database._AUGMENT_MAP_KO_TO_EN,
+        "augment_map_normalized": database._AUGMENT_MAP_NORMALIZED,
+        "augment_stats": {key: stats.to_dict() for key, stats in database._GLOBAL_AUG_STATS.items()},
+        "builds": builds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="runtime_data.json 생성")
+    parser.add_argument("--out", default=OUT_PATH)
+    parser.add_argument("--ranking-out", default=RANKING_OUT_PATH)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    bundle = compile_bundle()
+    # 번들과 같은 데이터(방금 원본에서 읽은 메모리 맵)로 점수 행렬 계산
+    matrix = ranking.build()
+
+    tmp_path = args.out + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp_path, args.out)
+    ranking.save(matrix, bundle, args.ranking_out)
+
+    # 로드 시간 비교 (번들 1회 읽기 vs 원본에서 생성)
+    started_load = time.perf_counter()
+    with open(args.out, "r", encoding="utf-8") as f:
+        json.load(f)
+    bundle_ms = (time.perf_counter() - started_load) * 1000
+
+    started_load = time.perf_counter()
+    database._load_from_sources()
+    sources_ms = (time.perf_counter() - started_load) * 1000
+
+    # 번들 DB 는 immutable 로 읽으므로 롤백 저널 모드로 되돌림 (매핑 임포트가 WAL 로 바꿔 둠)
+    # -> 배포/커밋되는 DB 가 파일 1개이고, 읽기만 해도 -wal/-shm 파일이 생기지 않음
+    database.close_read_connection()
+    conn = sqlite3.connect(database.DB_NAME)
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+
+    print(f"✅ {args.out} 생성 ({os.path.getsize(args.out) // 1024} KB, "
+          f"{(time.perf_counter() - started) * 1000:.0f} ms)")
+    print(f"   챔피언 {len(bundle['champions'])}, 증강 {len(bundle['augments'])}, "
+          f"매핑 {len(bundle['augment_map'])}, 통계 {len(bundle['augment_stats'])}, 빌드 {len(bundle['builds'])}")
+    print(f"   점수 행렬: {args.ranking_out} ({matrix.scores.shape[0]}x{matrix.scores.shape[1]})")
+    print(f"   로드 시간: 번들 {bundle_ms:.1f} ms / 원본 {sources_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,12 @@ import sys
 import json
 import sqlite3
 import difflib
+import functools
+import hashlib
+import threading
+from pathlib import Path
+
+import registry
 
 # ==========================================
 # 1. 유틸리티 & 설정
@@ -18,23 +24,63 @@ def resource_path(relative_path):
 GLOBAL_AUG_JSON_PATH = resource_path("augments_global_ko.json")
 MAPPING_TXT_PATH = resource_path("augment_mapping_full.txt")
 DB_NAME = resource_path("game_data.db")
-
-# 🔥 [핵심] 문자열 정규화 함수 (Regex 사용)
+BUILD_JSON_PATH = resource_path(os.path.join("data", "aram_builds.json"))
+
+# 런타임 번들: 위 파일들을 compile_data.py 로 미리 합쳐 둔 결과물 (한 번에 읽음)
+RUNTIME_BUNDLE_PATH = resource_path("runtime_data.json")
+RUNTIME_BUNDLE_FORMAT = 2
+# 번들 생성에 쓰인 원본 (변경 감지용, 키는 backend 기준 상대 경로)
+RUNTIME_BUNDLE_SOURCES = {
+    "augments_global_ko.json": GLOBAL_AUG_JSON_PATH,
+    "augment_mapping_full.txt": MAPPING_TXT_PATH,
+    "data/aram_builds.json": BUILD_JSON_PATH,
+}
+# DB 는 파일 크기/수정시각으로 판단할 수 없음 (WAL 이면 본 파일이 그대로이고, meta 기록만으로도 바뀜)
+# -> 번들에 들어가는 테이블 내용의 해시로 비교
+RUNTIME_BUNDLE_DB_SOURCE = "game_data.db"
+_DB_FINGERPRINT_QUERIES = (
+    "SELECT id, label FROM tier ORDER BY id",
+    "SELECT id, label FROM augment_type ORDER BY id",
+    "SELECT id, name, name_norm, role, tier_id, win_rate, pick_rate, ban_rate, score FROM champion ORDER BY id",
+    "SELECT id, name, name_norm FROM augment ORDER BY id",
+    "SELECT champion_id, augment_id, type_id, tier_id FROM champion_augment ORDER BY champion_id, augment_id",
+    "SELECT name_ko, name_en FROM augment_name_map ORDER BY name_ko",
+)
+
+# 🔥 [핵심] 문자열 정규화 함수 (registry.normalize: 미리 컴파일한 정규식 + 결과 캐시)
 # 모든 특수문자와 공백을 제거하고 소문자만 남김
 # "Kog'Maw" -> "kogmaw", "전환: 프리즘" -> "전환프리즘"
-import re
-def normalize_name(name):
-    if not name: return ""
+normalize_name = registry.normalize
+
+# 증강 통계 레코드: JSON 원본(tips_flat, tips_structured 등) 대신 응답에 쓰는 필드만 보관
+# 전체 팁은 get_augment_tips() 로 필요할 때만 원본 JSON 에서 읽음
+TIPS_PER_AUGMENT = 2
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+class AugmentStats:
+    __slots__ = ("tier_global", "win_rate", "pick_rate", "tips")
 
-    EXCEPTION_MAP = {
-        "MonkeyKing": "wukong",
-    }
+    def __init__(self, tier_global="?", win_rate="-", pick_rate="-", tips=()):
+        # 티어/승률 문자열은 증강끼리 겹치는 값이 많아서 intern
+        self.tier_global = _intern(tier_global)
+        self.win_rate = _intern(win_rate)
+        self.pick_rate = _intern(pick_rate)
+        self.tips = tuple(tips)
 
-    if name in EXCEPTION_MAP:
-        return EXCEPTION_MAP[name]
+    @classmethod
+    def from_item(cls, item):
+        """augments_global_ko.json 항목 -> 레코드"""
+        return cls(item.get("tier_global") or item.get("tier") or "?",
+                   item.get("win_rate", "-"), item.get("pick_rate", "-"),
+                   (item.get("tips") or [])[:TIPS_PER_AUGMENT])
 
-    # 한글, 영어, 숫자만 남기고 나머지(공백, 특수문자) 다 제거
-    return re.sub(r'[^a-zA-Z0-9가-힣]', '', name).lower()
+    def to_dict(self):
+        return {"tier_global": self.tier_global, "win_rate": self.win_rate,
+                "pick_rate": self.pick_rate, "tips": list(self.tips)}
+
+_EMPTY_AUG_STATS = AugmentStats()
 
 # ==========================================
 # 2. 전역 변수 (캐싱용)
@@ -45,66 +91,286 @@ _CHAMPION_CACHE_NORMALIZED = {} # {"kaisa": {tier: S, ...}}
 # 증강 데이터 캐시
 _AUGMENT_MAP_KO_TO_EN = {}      # 원본 한글 -> 영어
 _AUGMENT_MAP_NORMALIZED = {}    # 정규화된 한글 -> 영어 (검색용)
-_GLOBAL_AUG_STATS = {}          # 정규화된 영어 -> 증강 통계 데이터
+_GLOBAL_AUG_STATS = {}          # 정규화된 영어 -> AugmentStats (응답에 쓰는 필드만)
+
+# 챔피언별 증강 티어 캐시 (v2 스키마의 정수 키 그대로 보관)
+_CHAMPION_ID_BY_NORM = {}       # "kaisa" -> champion_id
+_CHAMPION_AUGMENTS = {}         # champion_id -> ((augment_id, type_id, tier_id), ...)
+_AUGMENT_NAMES = {}             # augment_id -> "흡혈병"
+_TIER_LABELS = {}               # tier_id -> "S"
+_AUGMENT_TYPE_LABELS = {}       # type_id -> "General"
+
+# registry id 기준 색인 (조회 시 문자열 정규화 없이 dict 한 번)
+_CHAMPION_INFO_BY_ID = {}       # champion_id -> {tier, win_rate, score, name}
+_AUG_STATS_BY_ID = {}           # registry 증강 id -> AugmentStats
+DATA_GENERATION = 0             # 데이터를 (다시) 읽을 때마다 +1 (파생 캐시 무효화용, ranking.py)
+
+# 런타임 번들 (로드 성공 시 캐시, 원본이 바뀌었으면 None)
+_RUNTIME_BUNDLE = None
+_BUNDLE_LOCK = threading.Lock()
 
 # 데이터 로드 여부 플래그
 _IS_DATA_LOADED = False
+# 백그라운드 초기화와 요청 처리 스레드가 동시에 로드하지 않도록 잠금
+_LOAD_LOCK = threading.Lock()
+
+# ==========================================
+# DB 연결 관리
+# ==========================================
+# 읽기: 스레드별로 읽기 전용 연결을 하나씩 캐싱해서 재사용 (매 호출마다 open/close 하지 않음)
+# 쓰기: 매핑 임포트/스키마 생성만 별도 쓰기 연결 사용 -> 끝나면 읽기 연결 세대(generation)를 올려서 재연결
+
+MMAP_SIZE = 64 * 1024 * 1024      # DB 전체(수 MB)를 mmap 으로 읽기
+STATEMENT_CACHE_SIZE = 128         # sqlite3 준비문(prepared statement) 캐시
+
+_READ_LOCAL = threading.local()
+_READ_GENERATION = 0
+
+def _is_bundled_db(db_path):
+    # PyInstaller 번들(_MEIPASS) 안의 DB 는 실행 중에 바뀌지 않음
+    return hasattr(sys, '_MEIPASS') and os.path.abspath(db_path).startswith(os.path.abspath(sys._MEIPASS))
+
+def _read_uri(db_path):
+    uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+    if _is_bundled_db(db_path):
+        uri += "&immutable=1"  # 잠금/변경 감지 생략
+    return uri
+
+def get_read_connection():
+    """현재 스레드의 캐싱된 읽기 전용 연결 (닫지 말 것)"""
+    conn = getattr(_READ_LOCAL, "conn", None)
+    if conn is not None and _READ_LOCAL.generation == _READ_GENERATION:
+        return conn
+    if conn is not None:
+        conn.close()
+
+    conn = sqlite3.connect(_read_uri(DB_NAME), uri=True,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute("PRAGMA query_only = ON")
+    _READ_LOCAL.conn = conn
+    _READ_LOCAL.generation = _READ_GENERATION
+    return conn
+
+def get_write_connection(db_path=None):
+    """쓰기 전용 경로 (스키마 생성, 매핑 임포트). 사용 후 close + invalidate_read_connections()"""
+    db_path = db_path or DB_NAME
+    conn = sqlite3.connect(db_path, timeout=5)
+    if not _is_bundled_db(db_path):
+        # 개발 환경: WAL 로 읽기와 쓰기가 서로 막지 않게 함
+        # (번들 DB 는 immutable 로 읽으므로 WAL 파일을 만들지 않음)
+        conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+def close_read_connection():
+    """현재 스레드의 읽기 연결 닫기 (DB 파일을 직접 다루기 전에 호출)"""
+    conn = getattr(_READ_LOCAL, "conn", None)
+    if conn is not None:
+        conn.close()
+        _READ_LOCAL.conn = None
 
-def get_connection():
-    return sqlite3.connect(DB_NAME)
+def invalidate_read_connections():
+    """쓰기 후 호출: 각 스레드가 다음 조회 때 읽기 연결을 새로 염"""
+    global _READ_GENERATION
+    _READ_GENERATION += 1
 
 # ==========================================
 # 3. 초기화 및 데이터 로드
 # ==========================================
 
 def init_db():
-    """데이터베이스 테이블 생성 및 초기 데이터 로드"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # 테이블 생성
-    cursor.execute('''CREATE TABLE IF NOT EXISTS champions (
-        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE, role TEXT, tier TEXT,
-        win_rate TEXT, pick_rate TEXT, ban_rate TEXT, score TEXT, detail_url TEXT,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''')
-
-    cursor.execute('''CREATE TABLE IF NOT EXISTS augments (
-        id INTEGER PRIMARY KEY AUTOINCREMENT, champion_name TEXT, augment_type TEXT,
-        augment_name TEXT, augment_tier TEXT,
-        FOREIGN KEY(champion_name) REFERENCES champions(name))''')
-
-    cursor.execute('''CREATE TABLE IF NOT EXISTS augment_name_map (
-        id INTEGER PRIMARY KEY AUTOINCREMENT, name_ko TEXT NOT NULL UNIQUE, name_en TEXT NOT NULL)''')
-    
-    conn.commit()
-    conn.close()
+    """
+    데이터베이스 테이블 생성 및 초기 데이터 로드
+    (import 시점이 아니라 서버 시작 후 백그라운드에서 호출됩니다 - startup.py 참고)
+    """
+    import migrate_schema  # normalize_name 을 쓰므로 여기서 임포트 (순환 임포트 방지)
+
+    conn = get_write_connection()
+    try:
+        if migrate_schema.needs_migration(conn):
+            # 예전(v1) 문자열 스키마 -> 정수 키 스키마로 변환
+            migrate_schema.migrate(conn)
+        elif migrate_schema.current_version(conn) != migrate_schema.SCHEMA_VERSION:
+            # 테이블 생성 (이미 최신이면 건너뜀)
+            migrate_schema.create_schema(conn)
+    finally:
+        conn.close()
+        invalidate_read_connections()
     
-    # 텍스트 파일 내용을 DB에 넣기 (최초 1회)
-    _import_mapping_txt_to_db()
+    # 텍스트 파일 내용을 DB에 반영 (바뀐 경우에만)
+    import_mapping_file()
     
     # 메모리에 데이터 로드 (고속 검색을 위해)
     load_all_data_to_memory()
 
-def _import_mapping_txt_to_db():
-    """augment_mapping_full.txt 파일 내용을 DB로 이관"""
-    if not os.path.exists(MAPPING_TXT_PATH): return
-    
-    conn = get_connection()
-    cur = conn.cursor()
+def parse_mapping_file(path=MAPPING_TXT_PATH):
+    """
+    매핑 텍스트 파일 파싱 -> {한글: 영어}
+    포맷: "한글 : 영어" (구버전 "한글=영어" 도 허용)
+    """
+    mapping = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if " : " in line:
+                ko, en = line.split(" : ", 1)
+            elif "=" in line:
+                ko, en = line.split("=", 1)
+            else:
+                continue
+            ko, en = ko.strip(), en.strip()
+            if ko and en:
+                mapping[ko] = en
+    return mapping
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def import_mapping_file(path=MAPPING_TXT_PATH, force=False, db_path=None):
+    """
+    매핑 파일 -> augment_name_map 증분 반영
+    - meta 테이블에 파일 해시/수정시각을 기록하고, 바뀌지 않았으면 건너뜀
+    - 바뀌었으면 DB와의 차이(추가/변경/삭제)만 계산해서 한 트랜잭션으로 반영
+    - 반영 후 메모리 맵도 새로 읽음 (서버 재시작 불필요)
+    반환: {"skipped": bool, "error": None 또는 오류 메시지, "added": n, "updated": n, "removed": n}
+    (오류가 나면 skipped=False, error 에 메시지 -> 호출한 쪽에서 실패로 처리)
+    """
+    result = {"skipped": True, "error": None, "added": 0, "updated": 0, "removed": 0}
+    if not os.path.exists(path): return result
+
+    mtime = str(os.path.getmtime(path))
+    conn = get_write_connection(db_path)
     try:
-        with open(MAPPING_TXT_PATH, "r", encoding="utf-8") as f:
-            for line in f:
-                if "=" in line: # 포맷이 "한글=영어" 인 경우
-                    ko, en = line.strip().split("=", 1)
-                    cur.execute("INSERT OR IGNORE INTO augment_name_map(name_ko, name_en) VALUES(?, ?)", (ko, en))
-                elif " : " in line: # 포맷이 "한글 : 영어" 인 경우 (구버전 호환)
-                    ko, en = line.strip().split(" : ", 1)
-                    cur.execute("INSERT OR IGNORE INTO augment_name_map(name_ko, name_en) VALUES(?, ?)", (ko, en))
-        conn.commit()
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        meta = dict(conn.execute(
+            "SELECT key, value FROM meta WHERE key IN ('mapping_sha256', 'mapping_mtime')"))
+
+        # 1. 수정시각이 같으면 해시 계산도 생략
+        if not force and meta.get("mapping_mtime") == mtime:
+            return result
+
+        digest = _file_sha256(path)
+        if not force and meta.get("mapping_sha256") == digest:
+            # 내용은 같고 수정시각만 바뀜 (git checkout 등)
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES('mapping_mtime', ?)", (mtime,))
+            return result
+
+        # 2. 파일과 DB 비교해서 차이만 계산
+        new_map = parse_mapping_file(path)
+        old_map = dict(conn.execute("SELECT name_ko, name_en FROM augment_name_map"))
+
+        added = [(ko, en) for ko, en in new_map.items() if ko not in old_map]
+        updated = [(en, ko) for ko, en in new_map.items() if ko in old_map and old_map[ko] != en]
+        removed = [(ko,) for ko in old_map if ko not in new_map]
+
+        # 3. 한 트랜잭션으로 반영
+        with conn:
+            conn.executemany("INSERT INTO augment_name_map(name_ko, name_en) VALUES(?, ?)", added)
+            conn.executemany("UPDATE augment_name_map SET name_en = ? WHERE name_ko = ?", updated)
+            conn.executemany("DELETE FROM augment_name_map WHERE name_ko = ?", removed)
+            conn.executemany("INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
+                             [("mapping_sha256", digest), ("mapping_mtime", mtime)])
+
+        result.update(skipped=False, added=len(added), updated=len(updated), removed=len(removed))
+        print(f"[DB] 매핑 반영: 추가 {len(added)}, 변경 {len(updated)}, 삭제 {len(removed)}")
     except Exception as e:
         print(f"[DB] 매핑 파일 임포트 중 오류: {e}")
+        result.update(skipped=False, error=str(e), added=0, updated=0, removed=0)
+        return result
     finally:
         conn.close()
+        invalidate_read_connections()
+
+    # 4. 메모리 맵 갱신 (이미 로드된 경우에만)
+    if _IS_DATA_LOADED and (db_path is None or db_path == DB_NAME):
+        reload_data()
+    return result
+
+def reload_data():
+    """DB/JSON 을 다시 읽어서 메모리 맵 교체 (서버 실행 중 갱신용)"""
+    global _RUNTIME_BUNDLE
+    with _LOAD_LOCK:
+        _RUNTIME_BUNDLE = None  # 번들도 원본과 다시 비교
+        _read_augment_tips.cache_clear()
+        _load_all_data_to_memory()
+
+# ==========================================
+# 3-1. 런타임 번들 (compile_data.py 결과물)
+# ==========================================
+def source_fingerprint(path):
+    """원본 파일 변경 감지용 {size, mtime_ns, sha256}"""
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _file_sha256(path)}
+
+def db_fingerprint():
+    """DB 내용 지문 {sha256} (번들에 들어가는 테이블의 행을 정해진 순서로 해시)"""
+    h = hashlib.sha256()
+    conn = get_read_connection()
+    for query in _DB_FINGERPRINT_QUERIES:
+        h.update(query.encode("utf-8"))
+        for row in conn.execute(query):
+            h.update(repr(row).encode("utf-8"))
+    return {"sha256": h.hexdigest()}
+
+def _is_db_fresh(recorded):
+    if not os.path.exists(DB_NAME): return recorded is None
+    if recorded is None: return False
+    try:
+        return db_fingerprint() == recorded
+    except sqlite3.Error as e:
+        print(f"[DB] DB 지문 계산 실패: {e}")
+        return False
+
+def _is_source_fresh(path, recorded):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return recorded is None
+    if recorded is None or st.st_size != recorded["size"]: return False
+    if st.st_mtime_ns == recorded["mtime_ns"]: return True
+    # 수정시각만 다른 경우 (git checkout 등) 내용으로 비교
+    return _file_sha256(path) == recorded["sha256"]
+
+def load_runtime_bundle():
+    """
+    runtime_data.json 을 읽어서 반환 (한 번만 읽고 캐시)
+    파일이 없거나, 포맷 버전이 다르거나, 원본이 바뀌었으면 None -> 원본(DB/JSON)에서 직접 로드
+    """
+    global _RUNTIME_BUNDLE
+    if _RUNTIME_BUNDLE is not None: return _RUNTIME_BUNDLE
+    if not os.path.exists(RUNTIME_BUNDLE_PATH): return None
+
+    with _BUNDLE_LOCK:
+        if _RUNTIME_BUNDLE is not None: return _RUNTIME_BUNDLE
+        try:
+            with open(RUNTIME_BUNDLE_PATH, "r", encoding="utf-8") as f:
+                bundle = json.load(f)
+        except Exception as e:
+            print(f"[DB] 런타임 번들 읽기 실패: {e}")
+            return None
+
+        if bundle.get("format") != RUNTIME_BUNDLE_FORMAT:
+            print(f"[DB] ⚠️ 런타임 번들 포맷 불일치 (v{bundle.get('format')}) -> 원본에서 로드")
+            return None
+        # PyInstaller 번들 안의 파일은 바뀌지 않으므로 검사 생략
+        if not hasattr(sys, '_MEIPASS'):
+            recorded = bundle.get("sources", {})
+            stale = [name for name, path in RUNTIME_BUNDLE_SOURCES.items()
+                     if not _is_source_fresh(path, recorded.get(name))]
+            if not _is_db_fresh(recorded.get(RUNTIME_BUNDLE_DB_SOURCE)):
+                stale.append(RUNTIME_BUNDLE_DB_SOURCE)
+            if stale:
+                print(f"[DB] ⚠️ 런타임 번들이 오래됨 ({', '.join(stale)} 변경) -> 원본에서 로드. "
+                      f"python compile_data.py 로 다시 생성하세요.")
+                return None
+
+        _RUNTIME_BUNDLE = bundle
+        return bundle
 
 def load_all_data_to_memory():
     """DB와 JSON 데이터를 읽어 정규화된 맵(Dictionary)을 생성"""
@@ -113,38 +379,97 @@ def load_all_data_to_memory():
     global _GLOBAL_AUG_STATS, _IS_DATA_LOADED
 
     if _IS_DATA_LOADED: return
+    with _LOAD_LOCK:
+        if _IS_DATA_LOADED: return
+        _load_all_data_to_memory()
+
+def _format_stat(value, suffix=""):
+    # REAL -> 예전 TEXT 응답 모양 ("49.11%", "76.48") 유지
+    return f"{value:.2f}{suffix}" if value is not None else None
+
+def _load_all_data_to_memory():
+    # 1순위: 미리 합쳐 둔 런타임 번들 (정규화까지 끝난 상태라 그대로 사용)
+    bundle = load_runtime_bundle()
+    if bundle is not None:
+        _load_from_bundle(bundle)
+    else:
+        _load_from_sources()
+    print(f"[DB] 메모리 로드 완료: 챔피언({len(_CHAMPION_CACHE_NORMALIZED)}), 증강매핑({len(_AUGMENT_MAP_NORMALIZED)})"
+          f"{' [번들]' if bundle is not None else ''}")
+
+def _load_from_bundle(bundle):
+    global _CHAMPION_CACHE_NORMALIZED
+    global _AUGMENT_MAP_KO_TO_EN, _AUGMENT_MAP_NORMALIZED
+    global _GLOBAL_AUG_STATS, _IS_DATA_LOADED
+    global _CHAMPION_ID_BY_NORM, _CHAMPION_AUGMENTS
+    global _AUGMENT_NAMES, _TIER_LABELS, _AUGMENT_TYPE_LABELS
+
+    # JSON 키는 문자열이라 정수 id 만 되돌림
+    _CHAMPION_CACHE_NORMALIZED = bundle["champions"]
+    _CHAMPION_ID_BY_NORM = bundle["champion_ids"]
+    _CHAMPION_AUGMENTS = {int(cid): tuple(map(tuple, rows))
+                          for cid, rows in bundle["champion_augments"].items()}
+    _AUGMENT_NAMES = {int(k): v for k, v in bundle["augments"].items()}
+    _TIER_LABELS = {int(k): v for k, v in bundle["tiers"].items()}
+    _AUGMENT_TYPE_LABELS = {int(k): v for k, v in bundle["augment_types"].items()}
+    _AUGMENT_MAP_KO_TO_EN = bundle["augment_map"]
+    _AUGMENT_MAP_NORMALIZED = bundle["augment_map_normalized"]
+    _GLOBAL_AUG_STATS = {key: AugmentStats(**fields) for key, fields in bundle["augment_stats"].items()}
+    _build_registry()
+    _IS_DATA_LOADED = True
+
+def _load_from_sources():
+    global _CHAMPION_CACHE_NORMALIZED
+    global _AUGMENT_MAP_KO_TO_EN, _AUGMENT_MAP_NORMALIZED
+    global _GLOBAL_AUG_STATS, _IS_DATA_LOADED
+    global _CHAMPION_ID_BY_NORM, _CHAMPION_AUGMENTS
+    global _AUGMENT_NAMES, _TIER_LABELS, _AUGMENT_TYPE_LABELS
 
-    # 1. 챔피언 정보 로드
-    conn = get_connection()
+    conn = get_read_connection()
     cur = conn.cursor()
-    cur.execute("SELECT name, tier, win_rate, score FROM champions")
+
+    # 0. enum 테이블
+    tier_labels = dict(cur.execute("SELECT id, label FROM tier"))
+    type_labels = dict(cur.execute("SELECT id, label FROM augment_type"))
+
+    # 1. 챔피언 정보 로드 (name_norm 은 마이그레이션 때 미리 정규화됨)
+    cur.execute("SELECT id, name, name_norm, tier_id, win_rate, score FROM champion")
     rows = cur.fetchall()
     
-    _CHAMPION_CACHE_NORMALIZED = {}
-    for r in rows:
-        # 키를 정규화해서 저장 (예: "Kog'Maw" -> "kogmaw")
-        clean_name = normalize_name(r[0])
-        _CHAMPION_CACHE_NORMALIZED[clean_name] = {
-            'name': r[0], 'tier': r[1], 'win_rate': r[2], 'score': r[3]
+    # 🔥 새 맵을 지역 변수로 다 만든 뒤 마지막에 한 번에 교체 (재로드 중 조회 안전)
+    champion_cache = {}
+    champion_ids = {}
+    for champ_id, name, clean_name, tier_id, win_rate, score in rows:
+        champion_ids[clean_name] = champ_id
+        champion_cache[clean_name] = {
+            'name': name, 'tier': tier_labels.get(tier_id),
+            'win_rate': _format_stat(win_rate, "%"), 'score': _format_stat(score)
         }
 
+    # 1-1. 챔피언별 증강 티어 (작은 정수 튜플로 보관)
+    augment_names = dict(cur.execute("SELECT id, name FROM augment"))
+    grouped = {}
+    for champ_id, aug_id, type_id, tier_id in cur.execute(
+            "SELECT champion_id, augment_id, type_id, tier_id FROM champion_augment"):
+        grouped.setdefault(champ_id, []).append((aug_id, type_id, tier_id))
+    champion_augments = {cid: tuple(v) for cid, v in grouped.items()}
+
     # 2. 증강 이름 매핑 로드 (DB -> Memory)
     cur.execute("SELECT name_ko, name_en FROM augment_name_map")
     map_rows = cur.fetchall()
-    conn.close()
 
-    _AUGMENT_MAP_KO_TO_EN = {}
-    _AUGMENT_MAP_NORMALIZED = {}
+    map_ko_to_en = {}
+    map_normalized = {}
     
     for ko, en in map_rows:
-        _AUGMENT_MAP_KO_TO_EN[ko] = en
+        map_ko_to_en[ko] = en
         
         # 🔥 한글 이름 정규화해서 저장 (예: "지옥의 계약" -> "지옥의계약")
         clean_ko = normalize_name(ko)
-        _AUGMENT_MAP_NORMALIZED[clean_ko] = en
+        map_normalized[clean_ko] = en
 
     # 3. 범용 증강 통계 로드 (JSON -> Memory)
-    _GLOBAL_AUG_STATS = {}
+    aug_stats = {}
     if os.path.exists(GLOBAL_AUG_JSON_PATH):
         try:
             with open(GLOBAL_AUG_JSON_PATH, "r", encoding="utf-8") as f:
@@ -157,12 +482,37 @@ def load_all_data_to_memory():
                 if name_en:
                     # 🔥 영어 이름 정규화해서 저장 (예: "Infernal Contract" -> "infernalcontract")
                     clean_en = normalize_name(name_en)
-                    _GLOBAL_AUG_STATS[clean_en] = item
+                    aug_stats[clean_en] = AugmentStats.from_item(item)
         except Exception as e:
             print(f"[DB] 범용 JSON 로드 실패: {e}")
 
+    _CHAMPION_CACHE_NORMALIZED = champion_cache
+    _CHAMPION_ID_BY_NORM = champion_ids
+    _CHAMPION_AUGMENTS = champion_augments
+    _AUGMENT_NAMES = augment_names
+    _TIER_LABELS = tier_labels
+    _AUGMENT_TYPE_LABELS = type_labels
+    _AUGMENT_MAP_KO_TO_EN = map_ko_to_en
+    _AUGMENT_MAP_NORMALIZED = map_normalized
+    _GLOBAL_AUG_STATS = aug_stats
+    _build_registry()
     _IS_DATA_LOADED = True
-    print(f"[DB] 메모리 로드 완료: 챔피언({len(_CHAMPION_CACHE_NORMALIZED)}), 증강매핑({len(_AUGMENT_MAP_NORMALIZED)})")
+
+def _build_registry():
+    """읽어 둔 맵으로 이름 레지스트리 + id 색인 생성 (번들/원본 로더 공통)"""
+    global _CHAMPION_INFO_BY_ID, _AUG_STATS_BY_ID, DATA_GENERATION
+
+    registry.load({cid: _CHAMPION_CACHE_NORMALIZED[norm]['name'] for norm, cid in _CHAMPION_ID_BY_NORM.items()},
+                  _AUGMENT_NAMES, _AUGMENT_MAP_KO_TO_EN)
+
+    _CHAMPION_INFO_BY_ID = {cid: _CHAMPION_CACHE_NORMALIZED[norm] for norm, cid in _CHAMPION_ID_BY_NORM.items()}
+    aug_stats = {}
+    for key, stats in _GLOBAL_AUG_STATS.items():
+        aid = registry.augment_id(key)
+        if aid is not None:
+            aug_stats.setdefault(aid, stats)
+    _AUG_STATS_BY_ID = aug_stats
+    DATA_GENERATION += 1
 
 # ==========================================
 # 4. 데이터 조회 함수 (외부 호출용)
@@ -172,45 +522,44 @@ def get_champion_info(name):
     """챔피언 정보 조회 (정규화 적용)"""
     if not _IS_DATA_LOADED: load_all_data_to_memory()
     
-    # 입력된 이름 정규화 후 검색 (Kog'Maw, LeBlanc 등 해결)
-    clean_name = normalize_name(name)
-    return _CHAMPION_CACHE_NORMALIZED.get(clean_name)
+    # 어떤 표기든 레지스트리 별칭으로 id 조회 (Kog'Maw, LeBlanc, MonkeyKing, Renata 등)
+    return _CHAMPION_INFO_BY_ID.get(registry.champion_id(name))
 
 def get_champion_augments(name):
     """
     챔피언 전용 증강 목록 조회
     DB에 'LeBlanc'으로 저장되어 있든, 'Kog'Maw'로 저장되어 있든 무조건 찾아냅니다.
+    (레지스트리 별칭 -> 챔피언 id -> 메모리의 정수 튜플, SQL 조회 없음)
     """
     if not _IS_DATA_LOADED: load_all_data_to_memory()
     
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    # 🔥 [수정 핵심] SQL 내부에서 특수문자를 다 지우고 비교하는 쿼리
-    # REPLACE 함수를 중첩해서 공백(' '), 따옴표('''), 점('.'), 앤드('&')를 다 지웁니다.
-    # 주의: SQL에서 따옴표를 표현하려면 '' (두 개)를 써야 합니다.
-    sql = """
-        SELECT augment_type, augment_name, augment_tier 
-        FROM augments 
-        WHERE 
-            REPLACE(
-                REPLACE(
-                    REPLACE(
-                        REPLACE(LOWER(champion_name), ' ', ''), 
-                    '''', ''), 
-                '.', ''), 
-            '&', '') = ?
-    """
-    
-    # 파이썬에서도 똑같이 정규화해서 넣어줍니다.
-    clean_name = normalize_name(name)
-    
-    cursor.execute(sql, (clean_name,))
-    rows = cursor.fetchall()
-    conn.close()
-    
+    champ_id = registry.champion_id(name)
+    if champ_id is None: return []
+
     # 결과 반환
-    return [{'type': r[0], 'name': r[1], 'tier': r[2]} for r in rows]
+    return [{'type': _AUGMENT_TYPE_LABELS.get(type_id), 'name': _AUGMENT_NAMES[aug_id],
+             'tier': _TIER_LABELS.get(tier_id)}
+            for aug_id, type_id, tier_id in _CHAMPION_AUGMENTS.get(champ_id, ())]
+
+def get_champion_augment_tiers(name):
+    """챔피언 전용 증강 티어 {registry 증강 id: 티어} (한글/영어 행 모두 같은 id 로)"""
+    if not _IS_DATA_LOADED: load_all_data_to_memory()
+
+    champ_id = registry.champion_id(name)
+    return {registry.augment_id_for_db(aug_id): _TIER_LABELS.get(tier_id)
+            for aug_id, _, tier_id in _CHAMPION_AUGMENTS.get(champ_id, ())}
+
+def get_all_champion_augment_tiers():
+    """전체 챔피언 증강 티어 [(챔피언 id, registry 증강 id, 티어), ...] (ranking.py 행렬 생성용)"""
+    if not _IS_DATA_LOADED: load_all_data_to_memory()
+
+    return [(cid, registry.augment_id_for_db(aug_id), _TIER_LABELS.get(tier_id))
+            for cid, rows in _CHAMPION_AUGMENTS.items() for aug_id, _, tier_id in rows]
+
+def get_augment_stats(aug_id):
+    """registry 증강 id -> AugmentStats (없으면 기본값 레코드)"""
+    if not _IS_DATA_LOADED: load_all_data_to_memory()
+    return _AUG_STATS_BY_ID.get(aug_id, _EMPTY_AUG_STATS)
 
 def enrich_ocr_augments(names_ko):
     """
@@ -225,54 +574,65 @@ def enrich_ocr_augments(names_ko):
     for raw_ko in names_ko:
         if not raw_ko: continue
         
-        # 1. OCR 결과 정규화
-        clean_ko = normalize_name(raw_ko)
-        if clean_ko in seen_names: continue
-        seen_names.add(clean_ko)
-
-        # 2. 한글 -> 영어 이름 찾기
-        # (A) 원본 매핑 시도
-        name_en = _AUGMENT_MAP_KO_TO_EN.get(raw_ko)
-        # (B) 실패 시 정규화 매핑 시도 (핵심!)
-        if not name_en:
-            name_en = _AUGMENT_MAP_NORMALIZED.get(clean_ko)
-            
-        # (C) 그래도 없으면 Difflib(유사도) 검사 (최후의 수단)
-        if not name_en:
+        # 1. 한글 이름 -> 증강 id
+        # (A) 원문 / 정규화 별칭 (레지스트리에 미리 만들어 둔 표)
+        aug_id = registry.augment_id(raw_ko)
+
+        # (B) 없으면 Difflib(유사도) 검사 (최후의 수단)
+        if aug_id is None:
             # 모든 한글 키를 대상으로 유사도 검사
             all_ko_keys = list(_AUGMENT_MAP_NORMALIZED.keys())
-            matches = difflib.get_close_matches(clean_ko, all_ko_keys, n=1, cutoff=0.6)
+            matches = difflib.get_close_matches(normalize_name(raw_ko), all_ko_keys, n=1, cutoff=0.6)
             if matches:
-                name_en = _AUGMENT_MAP_NORMALIZED[matches[0]]
+                aug_id = registry.augment_id(_AUGMENT_MAP_NORMALIZED[matches[0]])
 
-        # 영어 이름을 못 찾았어도 한글 이름이라도 보여주기 위해 유지
-        if not name_en:
-            # print(f"[DB] Unknown Augment: {raw_ko} (Norm: {clean_ko})")
-            name_en = "" # 빈 문자열로 유지
-            
-        # 3. 글로벌 통계 데이터 조회
-        # ... (이하 로직은 name_en이 있으면 찾고, 없으면 기본값 사용)
-        
-        # 영어 정규화 키
-        clean_en = normalize_name(name_en) if name_en else ""
-        stats = _GLOBAL_AUG_STATS.get(clean_en, {})
+        dedup_key = aug_id if aug_id is not None else normalize_name(raw_ko)
+        if dedup_key in seen_names: continue
+        seen_names.add(dedup_key)
 
-        # 3. 영어 이름 -> 범용 통계 찾기
-        clean_en = normalize_name(name_en)
-        stats = _GLOBAL_AUG_STATS.get(clean_en)
+        # 2. 영어 이름 (못 찾았어도 한글 이름이라도 보여주기 위해 빈 문자열로 유지)
+        augment = registry.augment(aug_id)
+        name_en = (augment.name_en if augment else None) or ""
+
+        # 3. 범용 통계 (없으면 기본값 레코드)
+        stats = _AUG_STATS_BY_ID.get(aug_id, _EMPTY_AUG_STATS)
 
         # 결과 생성
         item = {
             "name_ko": raw_ko, # 화면에 보여줄 원본 이름
             "name_en": name_en,
-            "tier_global": stats.get("tier_global") or stats.get("tier") or "?",
-            "win_rate": stats.get("win_rate", "-"),
-            "pick_rate": stats.get("pick_rate", "-"),
-            "tips": stats.get("tips", [])[:2] if stats else []
+            "augment_id": aug_id,
+            "tier_global": stats.tier_global,
+            "win_rate": stats.win_rate,
+            "pick_rate": stats.pick_rate,
+            "tips": list(stats.tips)
         }
         results.append(item)
         
     return results
 
-# 파일 실행 시 초기화
-init_db()
\ No newline at end of file
+def get_augment_tips(name):
+    """
+    증강 전체 팁 (tips, tips_structured) - 메모리에 상주시키지 않고 요청 시 원본 JSON 에서 읽음
+    name 은 영어/한글 모두 가능. 못 찾으면 None
+    """
+    if not _IS_DATA_LOADED: load_all_data_to_memory()
+
+    augment = registry.augment(registry.augment_id(name))
+    name_en = augment.name_en if augment else None
+    return _read_augment_tips(normalize_name(name_en) if name_en else normalize_name(name))
+
+@functools.lru_cache(maxsize=32)
+def _read_augment_tips(clean_en):
+    if not clean_en or not os.path.exists(GLOBAL_AUG_JSON_PATH): return None
+    with open(GLOBAL_AUG_JSON_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    for item in (data if isinstance(data, list) else data.values()):
+        if normalize_name(item.get("name_en", "").strip()) == clean_en:
+            return {
+                "name_en": item.get("name_en"),
+                "tips": item.get("tips") or [],
+                "tips_structured": item.get("tips_structured") or [],
+            }
+    return None
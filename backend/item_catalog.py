@@ -0,0 +1,161 @@
+"""
+아이템 카탈로그 + 아이콘 캐시 (오버레이 상점 빌드용)
+
+예전에는 오버레이가 열릴 때마다 DDragon 의 ko_KR/item.json 전체(수백 KB, 16.1.1 고정)를
+인터넷에서 받고, 아이콘도 하나하나 CDN 에서 불러왔습니다.
+서버가 시작할 때 최신 버전을 확인해서 툴팁에 쓰는 필드(이름, 설명, 가격)만 남긴 카탈로그를 저장하고,
+아이콘은 처음 요청될 때(또는 챔피언 예열 때) 받아서 디스크에 둡니다.
+- /items/catalog        : 현재 챔피언 빌드에 나오는 아이템만 (ETag)
+- /items/icon/<id>.png  : 캐시된 아이콘 (ETag)
+인터넷이 안 되면 마지막으로 저장한 카탈로그/아이콘을 그대로 씁니다.
+"""
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import threading
+
+import lazy_import
+import metrics
+
+requests = lazy_import.lazy("requests")
+
+DDRAGON_URL = "https://ddragon.leagueoflegends.com"
+LOCALE = "ko_KR"
+TIMEOUT = 5
+
+# 캐시 폴더는 쓰기 가능한 위치 (PyInstaller 실행 파일이면 exe 옆, 아니면 backend/)
+BASE_DIR = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, "data", "item_cache")
+CATALOG_PATH = os.path.join(CACHE_DIR, "catalog.json")
+ICON_DIR = os.path.join(CACHE_DIR, "icons")   # icons/<버전>/<id>.png
+
+# 빌드 데이터에서 아이템이 들어 있는 섹션 (aram_builds.json)
+BUILD_SECTIONS = ("starting", "core", "item4", "item5", "item6")
+
+_CATALOG = {"version": None, "items": {}}  # items: {"3031": {name, description, gold}}
+_ICON_LOCKS = {}                  # 아이콘 경로 -> 다운로드 잠금 (같은 아이콘만 한 번씩 받음)
+_ICON_LOCKS_GUARD = threading.Lock()
+
+_BR_TAG = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+# ==========================================
+# 1. 카탈로그 (버전 확인 + 필요한 필드만 저장)
+# ==========================================
+def _trim(item):
+    # 오버레이 툴팁에 쓰는 필드만 (설명의 HTML 태그는 여기서 미리 제거)
+    description = _HTML_TAG.sub("", _BR_TAG.sub("\n", item.get("description") or ""))
+    return {"name": item.get("name"), "description": description,
+            "gold": (item.get("gold") or {}).get("total", 0)}
+
+def load():
+    """저장된 카탈로그 읽기 (없으면 빈 카탈로그)"""
+    global _CATALOG
+    if not os.path.exists(CATALOG_PATH): return
+    try:
+        with open(CATALOG_PATH, "r", encoding="utf-8") as f:
+            _CATALOG = json.load(f)
+    except Exception as e:
+        print(f"[Items] 카탈로그 읽기 실패: {e}")
+
+def update():
+    """DDragon 최신 버전과 다르면 item.json 을 받아서 다시 저장. 현재 버전 반환"""
+    global _CATALOG
+    with metrics.span("item_catalog_update"):
+        latest = requests.get(f"{DDRAGON_URL}/api/versions.json", timeout=TIMEOUT).json()[0]
+        if latest == _CATALOG["version"]: return latest
+
+        data = requests.get(f"{DDRAGON_URL}/cdn/{latest}/data/{LOCALE}/item.json", timeout=TIMEOUT).json()["data"]
+        catalog = {"version": latest, "items": {item_id: _trim(item) for item_id, item in data.items()}}
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = CATALOG_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, CATALOG_PATH)
+
+    old_version = _CATALOG["version"]
+    _CATALOG = catalog
+    # 이전 버전 아이콘은 삭제 (새 버전 아이콘은 요청될 때 다시 받음)
+    if old_version and os.path.isdir(os.path.join(ICON_DIR, old_version)):
+        shutil.rmtree(os.path.join(ICON_DIR, old_version), ignore_errors=True)
+    with _ICON_LOCKS_GUARD:
+        for path in [p for p in _ICON_LOCKS if os.path.dirname(p) != os.path.join(ICON_DIR, latest)]:
+            del _ICON_LOCKS[path]
+    print(f"[Items] 아이템 카탈로그 갱신: {old_version} -> {latest} ({len(catalog['items'])}개)")
+    return latest
+
+def init():
+    """서버 시작 시 (startup 'items'): 저장본 읽기 -> 최신 버전 확인 (실패하면 저장본 사용)"""
+    load()
+    try:
+        update()
+    except Exception as e:
+        if not _CATALOG["version"]:
+            return f"unavailable ({e})"
+        print(f"[Items] ⚠️ 버전 확인 실패, 저장된 카탈로그 사용 ({_CATALOG['version']}): {e}")
+    return f"{_CATALOG['version']} ({len(_CATALOG['items'])} items)"
+
+
+# ==========================================
+# 2. 빌드 아이템만 골라서 제공
+# ==========================================
+def build_item_ids(build):
+    """빌드 데이터에 나오는 아이템 id (등장 순서, 중복 제거)"""
+    ids = {}
+    for section in BUILD_SECTIONS:
+        for item in (build or {}).get(section) or ():
+            if item.get("id"): ids[str(item["id"])] = None
+    return list(ids)
+
+def catalog_for(item_ids):
+    """{"version", "items": {id: {name, description, gold}}} (카탈로그에 없는 id 는 생략)"""
+    catalog = _CATALOG
+    items = catalog["items"]
+    return {"version": catalog["version"],
+            "items": {item_id: items[item_id] for item_id in item_ids if item_id in items}}
+
+def catalog_etag(item_ids):
+    digest = hashlib.sha1(",".join(item_ids).encode()).hexdigest()[:16]
+    return f"{_CATALOG['version']}-{digest}"
+
+
+# ==========================================
+# 3. 아이콘 디스크 캐시
+# ==========================================
+def icon_path(item_id):
+    """캐시된 아이콘 경로 (없으면 받아서 저장). 버전을 모르거나 받기 실패하면 None"""
+    current = _CATALOG["version"]
+    if not current or str(int(item_id)) not in _CATALOG["items"]: return None
+    path = os.path.join(ICON_DIR, current, f"{int(item_id)}.png")
+    if os.path.exists(path): return path
+
+    # 경로별 잠금: 다른 아이콘의 다운로드는 기다리지 않고 동시에 진행
+    with _ICON_LOCKS_GUARD:
+        lock = _ICON_LOCKS.setdefault(path, threading.Lock())
+    with lock:
+        if os.path.exists(path): return path
+        try:
+            with metrics.span("item_icon_download"):
+                res = requests.get(f"{DDRAGON_URL}/cdn/{current}/img/item/{int(item_id)}.png", timeout=TIMEOUT)
+            if res.status_code != 200: return None
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(res.content)
+            os.replace(tmp_path, path)
+            return path
+        except Exception as e:
+            print(f"[Items] 아이콘 다운로드 실패 ({item_id}): {e}")
+            return None
+
+def icon_etag(item_id):
+    return f"{_CATALOG['version']}-{int(item_id)}"
+
+def prefetch_icons(item_ids):
+    """챔피언 예열 때 빌드 아이콘을 미리 받아 둠 (상점을 처음 열 때 네트워크 대기 없음)"""
+    return sum(1 for item_id in item_ids if icon_path(item_id))
@@ -0,0 +1,60 @@
+import importlib
+import threading
+import types
+import typing
+
+import startup
+
+# ==========================================
+# 지연 임포트 (Lazy Import)
+# ==========================================
+# cv2, pytesseract 같은 무거운 모듈은 실제로 처음 쓰일 때 임포트합니다.
+# 사용법:  cv2 = lazy_import.lazy("cv2")  ->  cv2.imread(...) 첫 호출 시 로드
+# 로드에 걸린 시간은 startup 스팬("import:cv2")으로 기록됩니다.
+
+# PyInstaller 는 문자열로 임포트하는 모듈을 찾지 못하므로, lazy() 로 쓰는 모듈은
+# 아래에 정적 import 로도 적어 둡니다 (실행 중에는 import 되지 않음, 분석기만 봄).
+# lazy() 대상을 추가하면 이 목록과 build.spec / lol_api.spec 의 hiddenimports,
+# .github/workflows/build.yml 의 --hidden-import 도 같이 수정하세요.
+LAZY_MODULES = ("cv2", "numpy", "mss", "pytesseract", "requests", "psutil", "win32gui")
+if typing.TYPE_CHECKING:
+    import cv2, numpy, mss, pytesseract, requests, psutil, win32gui  # noqa: F401
+
+_LOCK = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_target"]
+        if module is not None: return module
+
+        with _LOCK:
+            module = self.__dict__["_lazy_target"]
+            if module is None:
+                with startup.span(f"import:{self.__name__}"):
+                    module = importlib.import_module(self.__name__)
+                self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy(name):
+    """name 모듈의 지연 로딩 프록시 반환 (name 은 LAZY_MODULES 에 있어야 함)"""
+    assert name in LAZY_MODULES, f"{name} 을 LAZY_MODULES 와 PyInstaller hiddenimports 에 추가하세요"
+    return LazyModule(name)
+
+
+def is_loaded(module):
+    """프록시가 실제 모듈을 이미 로드했는지 여부 (일반 모듈이면 항상 True)"""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_target"] is not None
+    return True
@@ -1,8 +1,21 @@
 import base64
-import requests
-import psutil
-from urllib3.exceptions import InsecureRequestWarning
-requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+
+import lazy_import
+import metrics
+import registry
+
+# requests/psutil 은 첫 연결 시도 때 로드 (lazy_import.py 참고)
+requests = lazy_import.lazy("requests")
+psutil = lazy_import.lazy("psutil")
+_WARNINGS_DISABLED = False
+
+def _disable_insecure_warnings():
+    # LCU 는 자체 서명 인증서를 쓰므로 경고 끄기 (requests 로드 후 1회)
+    global _WARNINGS_DISABLED
+    if _WARNINGS_DISABLED: return
+    from urllib3.exceptions import InsecureRequestWarning
+    requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+    _WARNINGS_DISABLED = True
 
 class LcuDriver:
     def __init__(self):
@@ -14,33 +27,25 @@ class LcuDriver:
         self.id_to_name = {}
 
     def connect(self):
+        _disable_insecure_warnings()
         try:
             # 1. DDragon 데이터 로드 (ID -> Name)
             ver = requests.get("https://ddragon.leagueoflegends.com/api/versions.json").json()[0]
             data = requests.get(f"https://ddragon.leagueoflegends.com/cdn/{ver}/data/en_US/champion.json").json()["data"]
             self.id_to_name = {}
-            name_fixes = {
-                "Nunu & Willump": "Nunu",
-                "Kha'Zix": "Khazix",
-                "Kai'Sa": "Kaisa",
-                "Vel'Koz": "Velkoz",
-                "Cho'Gath": "Chogath",
-                "Bel'Veth": "Belveth",
-                "Kog'Maw": "KogMaw",
-                "Rek'Sai": "Reksai",
-                "Dr. Mundo": "DrMundo",
-                "Renata Glasc": "Renata",
-                "Wukong": "MonkeyKing", # 가끔 Wukong 대신 MonkeyKing을 쓰는 데이터가 있음
-                "LeBlanc": "Leblanc"
-            }
+            aliases = {}
             for v in data.values():
                 c_id = int(v["key"])
                 c_name = v["name"]
                 
-                # 🛠️ 누누 강제 개명 (Nunu & Willump -> Nunu)
-                if c_name in name_fixes:
-                    c_name = name_fixes[c_name]
+                # 🛠️ 누누 강제 개명 (Nunu & Willump -> Nunu), 목록은 registry.CHAMPION_NAME_FIXES
+                if c_name in registry.CHAMPION_NAME_FIXES:
+                    c_name = registry.CHAMPION_NAME_FIXES[c_name]
                 self.id_to_name[c_id] = c_name
+                # DDragon id / 표시 이름 / 바꾼 이름이 모두 같은 챔피언으로 조회되도록
+                aliases[v["id"]] = v["name"]
+                aliases[c_name] = v["name"]
+            registry.add_champion_aliases(aliases)
 
             # 2. LCU 프로세스 연결
             for proc in psutil.process_iter(['name', 'cmdline']):
@@ -58,7 +63,8 @@ class LcuDriver:
     def get(self, endpoint):
         if not self.connected and not self.connect(): return None
         try:
-            return requests.get(f"{self.base_url}{endpoint}", headers=self.headers, verify=False, timeout=1).json()
+            with metrics.span("lcu"):
+                return requests.get(f"{self.base_url}{endpoint}", headers=self.headers, verify=False, timeout=1).json()
         except:
             self.connected = False
             return None
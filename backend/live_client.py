@@ -0,0 +1,209 @@
+"""
+Live Client Data API (게임 클라이언트가 게임 중에 여는 https://127.0.0.1:2999/liveclientdata)
+
+- LiveClient.snapshot(): /allgamedata 한 번으로 게임 시간, 내 레벨, 내 챔피언
+- LiveGameTracker: 1초마다 스냅샷을 받아서 증강 선택 레벨(AUGMENT_LEVELS)에 도달한 시점을 기록하고,
+  그 뒤 AUGMENT_SCAN_WINDOW 초 동안만 증강 OCR 을 돌리도록 scan_allowed() 로 알려줌
+  (게임 밖이거나 API 응답이 없으면 항상 True -> 기존처럼 계속 감시)
+
+로컬 스텁 서버로 게임 없이 테스트:
+    python live_client.py --stub                         # http://127.0.0.1:2999 에 가짜 게임 (10배속)
+    python live_client.py --url http://127.0.0.1:2999    # 스냅샷 + 스캔 여부 출력
+    python app.py --live-client-url http://127.0.0.1:2999
+"""
+import sys
+import json
+import time
+import argparse
+import threading
+
+import lazy_import
+import lcu_driver
+import metrics
+
+requests = lazy_import.lazy("requests")
+
+BASE_URL = "https://127.0.0.1:2999"
+POLL_INTERVAL = 1.0         # 게임 중 스냅샷 주기 (초)
+IDLE_INTERVAL = 3.0         # API 가 응답하지 않을 때 (게임 밖) 재시도 주기
+STALE_AFTER = 5.0           # 마지막 스냅샷이 이보다 오래되면 게이트를 열어 둠
+AUGMENT_LEVELS = (3, 7, 11, 15)   # 증강 선택이 열리는 레벨 (모드가 바뀌면 수정)
+AUGMENT_SCAN_WINDOW = 90.0  # 레벨 도달 후 증강 OCR 을 돌리는 시간 (게임 시간, 초)
+RAW_CHAMPION_PREFIX = "game_character_displayname_"
+
+
+class LiveClient:
+    def __init__(self, base_url=BASE_URL, timeout=0.5):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, endpoint):
+        """liveclientdata 엔드포인트 JSON (게임 밖이면 None)"""
+        lcu_driver._disable_insecure_warnings()
+        try:
+            with metrics.span("live_client"):
+                # 게임 클라이언트도 자체 서명 인증서 사용 (lcu_driver 와 동일하게 검증 생략)
+                res = requests.get(f"{self.base_url}/liveclientdata/{endpoint}",
+                                   verify=False, timeout=self.timeout)
+            if res.status_code != 200: return None
+            return res.json()
+        except Exception:
+            return None
+
+    def snapshot(self):
+        """{"game_time", "game_mode", "level", "champion"} 또는 None"""
+        data = self.get("allgamedata")
+        if not data: return None
+        return parse_snapshot(data)
+
+
+def parse_snapshot(data):
+    active = data.get("activePlayer") or {}
+    game = data.get("gameData") or {}
+    me = active.get("riotId") or active.get("summonerName")
+
+    champion = None
+    for player in data.get("allPlayers", []):
+        if me and me in (player.get("riotId"), player.get("summonerName")):
+            champion = champion_from_player(player)
+            break
+
+    return {
+        "game_time": float(game.get("gameTime", 0.0)),
+        "game_mode": game.get("gameMode"),
+        "level": int(active.get("level", 0)),
+        "champion": champion,
+    }
+
+
+def champion_from_player(player):
+    # championName 은 클라이언트 언어로 나오므로 (예: "카이사") 내부 이름을 우선 사용
+    # rawChampionName: "game_character_displayname_Kaisa" -> "Kaisa" (DDragon id)
+    raw = player.get("rawChampionName") or ""
+    if raw.startswith(RAW_CHAMPION_PREFIX):
+        return raw[len(RAW_CHAMPION_PREFIX):]
+    return player.get("championName")
+
+
+# ==========================================
+# 증강 선택 시점 추적
+# ==========================================
+class LiveGameTracker:
+    def __init__(self, client=None, levels=AUGMENT_LEVELS, window=AUGMENT_SCAN_WINDOW, clock=time.time):
+        self.client = client or LiveClient()
+        self.levels = levels
+        self.window = window
+        self.clock = clock
+        self.snapshot = None
+        self.updated_at = 0.0
+        self.reached = {}          # 증강 레벨 -> 처음 확인한 게임 시간
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def update(self, snap):
+        with self._lock:
+            if snap and self.snapshot and snap["game_time"] + 5 < self.snapshot["game_time"]:
+                self.reached.clear()  # 게임 시간이 되돌아감 -> 새 게임
+            if snap:
+                for level in self.levels:
+                    if snap["level"] >= level and level not in self.reached:
+                        self.reached[level] = snap["game_time"]
+                        print(f"[LiveClient] 레벨 {level} 도달 ({snap['game_time']:.0f}s) -> 증강 감시")
+                self.updated_at = self.clock()
+            else:
+                self.reached.clear()
+            self.snapshot = snap
+
+    def champion(self):
+        with self._lock:
+            if self.snapshot and self.clock() - self.updated_at <= STALE_AFTER:
+                return self.snapshot["champion"]
+        return None
+
+    def scan_allowed(self):
+        """지금 증강 OCR 을 돌려야 하는지 (정보가 없으면 True)"""
+        with self._lock:
+            if self.snapshot is None: return True
+            elapsed = self.clock() - self.updated_at
+            if elapsed > STALE_AFTER: return True
+            game_time = self.snapshot["game_time"] + elapsed
+            return any(0 <= game_time - t <= self.window for t in self.reached.values())
+
+    def _loop(self):
+        while True:
+            snap = self.client.snapshot()
+            self.update(snap)
+            time.sleep(POLL_INTERVAL if snap else IDLE_INTERVAL)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="live-client", daemon=True)
+        self._thread.start()
+        return self._thread
+
+
+# ==========================================
+# 테스트용 스텁 서버
+# ==========================================
+def run_stub(port=2999, speed=10.0, champion="Kaisa", level_every=60.0):
+    """가짜 allgamedata: speed 배속으로 게임 시간이 흐르고 level_every 초(게임 시간)마다 레벨업"""
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    started = time.time()
+
+    def game_data():
+        game_time = (time.time() - started) * speed
+        level = min(18, 1 + int(game_time // level_every))
+        me = {"riotId": "Stub#KR1", "summonerName": "Stub"}
+        return {
+            "activePlayer": dict(me, level=level),
+            "allPlayers": [dict(me, championName=champion, rawChampionName=RAW_CHAMPION_PREFIX + champion,
+                                level=level, team="ORDER")],
+            "gameData": {"gameMode": "ARAM", "gameTime": game_time},
+        }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            data = game_data()
+            routes = {"/liveclientdata/allgamedata": data,
+                      "/liveclientdata/activeplayer": data["activePlayer"],
+                      "/liveclientdata/playerlist": data["allPlayers"],
+                      "/liveclientdata/gamestats": data["gameData"]}
+            if self.path not in routes:
+                self.send_error(404)
+                return
+            body = json.dumps(routes[self.path]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    print(f"[LiveClient] 스텁 서버: http://127.0.0.1:{port}/liveclientdata/allgamedata ({speed:g}배속)")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live Client Data API 확인 / 스텁 서버")
+    parser.add_argument("--stub", action="store_true", help="가짜 Live Client 서버 실행")
+    parser.add_argument("--port", type=int, default=2999)
+    parser.add_argument("--speed", type=float, default=10.0, help="스텁 게임 시간 배속")
+    parser.add_argument("--url", default=BASE_URL, help="조회할 Live Client 주소")
+    args = parser.parse_args()
+
+    if args.stub:
+        run_stub(args.port, args.speed)
+        return 0
+
+    tracker = LiveGameTracker(LiveClient(args.url))
+    while True:
+        snap = tracker.client.snapshot()
+        tracker.update(snap)
+        print(f"[LiveClient] {snap} scan={tracker.scan_allowed()}")
+        time.sleep(POLL_INTERVAL)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
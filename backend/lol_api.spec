@@ -42,6 +42,8 @@ rapidocr_hidden_imports = [
 
 # 동적 모듈 수집
 jaraco_imports = collect_submodules('jaraco')
+# lazy_import.lazy() 로 문자열 임포트하는 모듈 (lazy_import.LAZY_MODULES 와 같게 유지)
+lazy_imports = ['cv2', 'numpy', 'mss', 'pytesseract', 'requests', 'psutil', 'win32gui']
 rapidocr_submodules = collect_submodules('rapidocr_onnxruntime')
 
 # RapidOCR 모델 데이터 수집
@@ -56,11 +58,13 @@ a = Analysis(
         ('augments_global_ko.json', '.'),
         ('augment_mapping_full.txt', '.'),
         ('game_data.db', '.'),
+        ('runtime_data.json', '.'),  # compile_data.py 로 생성한 런타임 번들
+        ('ranking.npz', '.'),        # compile_data.py 로 생성한 증강 점수 행렬
         ('assets', 'assets'),
         ('data', 'data'),
         ('models', 'models'),  # 🔥 [중요] 한국어 모델(det/rec/dict) 폴더 포함
     ] + rapidocr_datas,  # RapidOCR 기본 파일 포함 (안전망)
-    hiddenimports=rapidocr_hidden_imports + jaraco_imports + rapidocr_submodules,
+    hiddenimports=rapidocr_hidden_imports + jaraco_imports + rapidocr_submodules + lazy_imports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,124 @@
+import math
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# ==========================================
+# 구간 측정 (Hot-path Metrics)
+# ==========================================
+# 캡처 / 템플릿 매칭 / OCR / 증강 정보 조회 / LCU 호출 / 라우트 처리 시간을
+# 메모리에 모아 두고 /metrics (Prometheus 텍스트 포맷) 와 주기적 요약 로그로 보여줍니다.
+# 사용법:
+#     with metrics.span("ocr"): ...
+#     metrics.observe("button", elapsed_seconds)
+# 백분위는 구간별 최근 WINDOW 개 샘플 기준, _sum/_count 는 프로세스 시작 이후 누적입니다.
+
+WINDOW = 512              # 구간별로 보관할 최근 샘플 수
+QUANTILES = (0.5, 0.9, 0.99)
+SUMMARY_INTERVAL = 60     # 요약 로그 주기 (초)
+PREFIX = "lol_overlay"
+
+_STAGES = {}    # name -> {"recent": deque, "sum": float, "count": int}
+_COUNTERS = {}  # name -> int
+_LOCK = threading.Lock()
+
+
+def observe(name, seconds):
+    """구간 소요 시간(초) 기록"""
+    with _LOCK:
+        stage = _STAGES.get(name)
+        if stage is None:
+            stage = _STAGES[name] = {"recent": deque(maxlen=WINDOW), "sum": 0.0, "count": 0}
+        stage["recent"].append(seconds)
+        stage["sum"] += seconds
+        stage["count"] += 1
+
+
+@contextmanager
+def span(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started)
+
+
+def inc(name, value=1):
+    """횟수 카운터 (예: OCR 실패)"""
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + value
+
+
+def _quantile(ordered, q):
+    """nearest-rank 분위수 (ordered: 정렬된 값, q: 0~1). replay.py 도 이 함수를 사용"""
+    # round: 0.9 * 10 = 9.000000000000002 같은 부동소수 오차로 한 칸 밀리지 않게
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(round(q * len(ordered), 9)) - 1))]
+
+
+def snapshot():
+    """{구간: {count, sum, p50, p90, p99}} (초 단위)"""
+    with _LOCK:
+        stages = {name: (sorted(s["recent"]), s["sum"], s["count"]) for name, s in _STAGES.items()}
+    result = {}
+    for name, (ordered, total, count) in stages.items():
+        info = {"count": count, "sum": total}
+        for q in QUANTILES:
+            info[f"p{int(q * 100)}"] = _quantile(ordered, q) if ordered else None
+        result[name] = info
+    return result
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_prometheus():
+    """Prometheus 텍스트 포맷 (summary + counter)"""
+    lines = [f"# HELP {PREFIX}_stage_seconds Hot-path stage latency (quantiles over the last {WINDOW} samples)",
+             f"# TYPE {PREFIX}_stage_seconds summary"]
+    stages = snapshot()
+    for name in sorted(stages):
+        info, label = stages[name], _escape(name)
+        for q in QUANTILES:
+            value = info[f"p{int(q * 100)}"]
+            if value is not None:
+                lines.append(f'{PREFIX}_stage_seconds{{stage="{label}",quantile="{q}"}} {value:.6f}')
+        lines.append(f'{PREFIX}_stage_seconds_sum{{stage="{label}"}} {info["sum"]:.6f}')
+        lines.append(f'{PREFIX}_stage_seconds_count{{stage="{label}"}} {info["count"]}')
+
+    with _LOCK:
+        counters = dict(_COUNTERS)
+    if counters:
+        lines += [f"# HELP {PREFIX}_events_total Event counters", f"# TYPE {PREFIX}_events_total counter"]
+        for name in sorted(counters):
+            lines.append(f'{PREFIX}_events_total{{event="{_escape(name)}"}} {counters[name]}')
+    return "\n".join(lines) + "\n"
+
+
+def summary_line():
+    """'[Metrics] ocr p50 12.1ms p90 30.4ms (n=120) | ...' 한 줄 요약"""
+    parts = []
+    for name, info in sorted(snapshot().items()):
+        if info["p50"] is None: continue
+        parts.append(f"{name} p50 {info['p50'] * 1000:.1f}ms p90 {info['p90'] * 1000:.1f}ms (n={info['count']})")
+    return "[Metrics] " + " | ".join(parts) if parts else None
+
+
+def _report_loop(interval):
+    last_total = None
+    while True:
+        time.sleep(interval)
+        with _LOCK:
+            total = sum(s["count"] for s in _STAGES.values())
+        if total == last_total: continue  # 새 샘플이 없으면 생략
+        last_total = total
+        line = summary_line()
+        if line: print(line)
+
+
+def start_reporter(interval=SUMMARY_INTERVAL):
+    """interval 초마다 요약 한 줄 출력 (백그라운드 스레드)"""
+    t = threading.Thread(target=_report_loop, args=(interval,), name="metrics-reporter", daemon=True)
+    t.start()
+    return t
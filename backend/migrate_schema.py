@@ -0,0 +1,273 @@
+"""
+game_data.db 스키마 정규화 (v1 -> v2)
+
+v1: champions / augments 테이블에 챔피언 이름, 증강 이름, 티어를 TEXT 로 반복 저장
+    (augments 약 2.1만 행, 승률/점수도 '51.17%' 같은 TEXT)
+v2: 정수 키로 정규화
+    - tier / augment_type : 작은 enum 테이블
+    - champion            : 정수 id + REAL 통계 + 정규화 이름(name_norm)
+    - augment             : 정수 id + 이름
+    - champion_augment    : (champion_id, augment_id) 복합 PK (WITHOUT ROWID)
+    - champions / augments: 예전 모양 그대로 보여주는 호환용 VIEW
+
+서버(database.init_db)는 v1 DB 를 만나면 자동으로 migrate() 를 호출합니다.
+직접 실행하면 마이그레이션 전/후 DB 크기, 로드 시간, 조회 지연을 측정해서 보여줍니다:
+    python migrate_schema.py [game_data.db]
+"""
+import os
+import sys
+import time
+import sqlite3
+
+from database import normalize_name
+
+SCHEMA_VERSION = 2
+
+# 티어 enum (id 가 작을수록 좋은 티어)
+TIERS = ["S+", "S", "A", "B", "C", "D"]
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE IF NOT EXISTS tier (
+    id INTEGER PRIMARY KEY, label TEXT NOT NULL UNIQUE);
+
+CREATE TABLE IF NOT EXISTS augment_type (
+    id INTEGER PRIMARY KEY, label TEXT NOT NULL UNIQUE);
+
+CREATE TABLE IF NOT EXISTS champion (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_norm TEXT NOT NULL UNIQUE,
+    role TEXT,
+    tier_id INTEGER REFERENCES tier(id),
+    win_rate REAL, pick_rate REAL, ban_rate REAL, score REAL,
+    detail_url TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+
+CREATE TABLE IF NOT EXISTS augment (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_norm TEXT NOT NULL);
+
+CREATE TABLE IF NOT EXISTS champion_augment (
+    champion_id INTEGER NOT NULL REFERENCES champion(id),
+    augment_id INTEGER NOT NULL REFERENCES augment(id),
+    type_id INTEGER REFERENCES augment_type(id),
+    tier_id INTEGER REFERENCES tier(id),
+    PRIMARY KEY (champion_id, augment_id)) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS augment_name_map (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, name_ko TEXT NOT NULL UNIQUE, name_en TEXT NOT NULL);
+
+CREATE VIEW IF NOT EXISTS champions AS
+    SELECT c.id, c.name, c.role, t.label AS tier,
+           CASE WHEN c.win_rate IS NULL THEN NULL ELSE printf('%.2f%%', c.win_rate) END AS win_rate,
+           CASE WHEN c.pick_rate IS NULL THEN NULL ELSE printf('%.2f%%', c.pick_rate) END AS pick_rate,
+           CASE WHEN c.ban_rate IS NULL THEN NULL ELSE printf('%.2f%%', c.ban_rate) END AS ban_rate,
+           CASE WHEN c.score IS NULL THEN NULL ELSE printf('%.2f', c.score) END AS score,
+           c.detail_url, c.updated_at
+    FROM champion c LEFT JOIN tier t ON t.id = c.tier_id;
+
+CREATE VIEW IF NOT EXISTS augments AS
+    SELECT c.name AS champion_name, y.label AS augment_type,
+           a.name AS augment_name, t.label AS augment_tier
+    FROM champion_augment ca
+    JOIN champion c ON c.id = ca.champion_id
+    JOIN augment a ON a.id = ca.augment_id
+    LEFT JOIN augment_type y ON y.id = ca.type_id
+    LEFT JOIN tier t ON t.id = ca.tier_id;
+"""
+# executescript 는 실행 전에 COMMIT 하므로 마이그레이션 트랜잭션 안에서는 문장별로 execute
+# (문장 안에 ';' 가 없어야 함)
+SCHEMA_STATEMENTS = [stmt.strip() for stmt in SCHEMA_SQL.split(";") if stmt.strip()]
+
+# 마이그레이션 도중 이름을 바꿔 둔 v1 테이블 (남아 있으면 이전 마이그레이션이 중단된 것)
+V1_LEFTOVERS = {"champions": "_champions_v1", "augments": "_augments_v1"}
+
+
+def _to_real(text):
+    """'51.17%' / '48.55' / None -> float 또는 None"""
+    if text is None: return None
+    try:
+        return float(str(text).replace("%", "").strip())
+    except ValueError:
+        return None
+
+
+def _table_type(conn, name):
+    row = conn.execute("SELECT type FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def current_version(conn):
+    """meta 테이블의 schema_version (없으면 None)"""
+    if _table_type(conn, "meta") != "table": return None
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    return int(row[0]) if row else None
+
+
+def needs_migration(conn):
+    """v1 스키마(실제 테이블 augments)나 중단된 마이그레이션의 _*_v1 테이블이 남아 있으면 True"""
+    return (_table_type(conn, "augments") == "table"
+            or any(_table_type(conn, leftover) == "table" for leftover in V1_LEFTOVERS.values()))
+
+
+def _apply_schema(conn):
+    # 커밋하지 않음 (호출한 쪽의 트랜잭션에 포함)
+    for stmt in SCHEMA_STATEMENTS:
+        conn.execute(stmt)
+    conn.executemany("INSERT OR IGNORE INTO tier(id, label) VALUES(?, ?)",
+                     [(i + 1, label) for i, label in enumerate(TIERS)])
+    conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES('schema_version', ?)",
+                 (str(SCHEMA_VERSION),))
+
+
+def create_schema(conn):
+    """v2 스키마 생성 (빈 DB / 이미 v2 인 DB 모두 안전)"""
+    _apply_schema(conn)
+    conn.commit()
+
+
+def migrate(conn):
+    """
+    v1 테이블을 읽어 v2 로 옮긴 뒤 v1 테이블은 제거 (BEGIN ... COMMIT 한 트랜잭션)
+    sqlite3 모듈은 DDL 에 트랜잭션을 자동으로 열지 않으므로 isolation_level=None 으로 직접 관리.
+    중간에 실패하면 ROLLBACK -> v1 그대로 남음 (다음 시작 때 다시 시도)
+    예전 코드로 중단되어 _*_v1 테이블만 남은 DB 도 여기서 이어서 옮김
+    """
+    isolation_level = conn.isolation_level
+    if conn.in_transaction: conn.commit()
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        counts = _migrate_in_transaction(conn)
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction: conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+
+    print(f"[DB] 스키마 v{SCHEMA_VERSION} 마이그레이션 완료: "
+          f"챔피언 {counts[0]}, 증강 {counts[1]}, 챔피언별 증강 {counts[2]}")
+
+
+def _migrate_in_transaction(conn):
+    # v1 테이블을 치워야 같은 이름의 호환 VIEW 를 만들 수 있음
+    for name, leftover in V1_LEFTOVERS.items():
+        if _table_type(conn, leftover) == "table":
+            # 이전 마이그레이션이 중단됨: 옮기다 만 v2 데이터를 지우고 _*_v1 에서 다시 시작
+            if _table_type(conn, name) == "table":
+                raise RuntimeError(f"{name} 와 {leftover} 가 둘 다 있어 자동 마이그레이션 불가")
+        else:
+            conn.execute(f"ALTER TABLE {name} RENAME TO {leftover}")
+    _apply_schema(conn)
+    for table in ("champion_augment", "augment", "champion"):
+        conn.execute(f"DELETE FROM {table}")
+
+    old_champions = conn.execute(
+        "SELECT id, name, role, tier, win_rate, pick_rate, ban_rate, score, detail_url, updated_at "
+        "FROM _champions_v1").fetchall()
+    old_augments = conn.execute(
+        "SELECT champion_name, augment_type, augment_name, augment_tier FROM _augments_v1").fetchall()
+
+    tier_ids = dict(conn.execute("SELECT label, id FROM tier"))
+
+    def tier_id(label):
+        if not label: return None
+        if label not in tier_ids:
+            cur = conn.execute("INSERT INTO tier(label) VALUES(?)", (label,))
+            tier_ids[label] = cur.lastrowid
+        return tier_ids[label]
+
+    type_ids = {}
+    for label in sorted({r[1] for r in old_augments if r[1]}):
+        conn.execute("INSERT OR IGNORE INTO augment_type(label) VALUES(?)", (label,))
+        type_ids[label] = conn.execute(
+            "SELECT id FROM augment_type WHERE label = ?", (label,)).fetchone()[0]
+
+    # 1. 챔피언 (기존 id 유지)
+    conn.executemany(
+        "INSERT INTO champion(id, name, name_norm, role, tier_id, win_rate, pick_rate, ban_rate, "
+        "score, detail_url, updated_at) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [(r[0], r[1], normalize_name(r[1]), r[2], tier_id(r[3]), _to_real(r[4]), _to_real(r[5]),
+          _to_real(r[6]), _to_real(r[7]), r[8], r[9]) for r in old_champions])
+    champ_ids = dict(conn.execute("SELECT name, id FROM champion"))
+
+    # 2. 증강 이름 (이름순으로 id 부여)
+    names = sorted({r[2] for r in old_augments if r[2]})
+    conn.executemany("INSERT INTO augment(id, name, name_norm) VALUES(?, ?, ?)",
+                     [(i + 1, n, normalize_name(n)) for i, n in enumerate(names)])
+    aug_ids = {n: i + 1 for i, n in enumerate(names)}
+
+    # 3. 챔피언별 증강 티어
+    rows = [(champ_ids[r[0]], aug_ids[r[2]], type_ids.get(r[1]), tier_id(r[3]))
+            for r in old_augments if r[0] in champ_ids and r[2]]
+    conn.executemany(
+        "INSERT OR REPLACE INTO champion_augment(champion_id, augment_id, type_id, tier_id) "
+        "VALUES(?, ?, ?, ?)", rows)
+
+    conn.execute("DROP TABLE _champions_v1")
+    conn.execute("DROP TABLE _augments_v1")
+
+    return len(champ_ids), len(aug_ids), len(rows)
+
+
+# ==========================================
+# 측정 (직접 실행 시)
+# ==========================================
+def _measure(db_path, champion="Kai'Sa", repeat=200):
+    conn = sqlite3.connect(db_path)
+    v2 = not needs_migration(conn)
+
+    started = time.perf_counter()
+    if v2:
+        rows = conn.execute("SELECT champion_id, augment_id, tier_id FROM champion_augment").fetchall()
+    else:
+        rows = conn.execute("SELECT champion_name, augment_name, augment_tier FROM augments").fetchall()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    clean = normalize_name(champion)
+    if v2:
+        sql = ("SELECT augment_id, tier_id FROM champion_augment "
+               "WHERE champion_id = (SELECT id FROM champion WHERE name_norm = ?)")
+    else:
+        # v1 database.get_champion_augments 와 같은 쿼리
+        sql = ("SELECT augment_type, augment_name, augment_tier FROM augments WHERE "
+               "REPLACE(REPLACE(REPLACE(REPLACE(LOWER(champion_name), ' ', ''), '''', ''), '.', ''), '&', '') = ?")
+    started = time.perf_counter()
+    for _ in range(repeat):
+        found = conn.execute(sql, (clean,)).fetchall()
+    lookup_us = (time.perf_counter() - started) / repeat * 1e6
+    conn.close()
+
+    return {"size_kb": os.path.getsize(db_path) // 1024, "rows": len(rows),
+            "load_ms": round(load_ms, 2), "lookup_us": round(lookup_us, 1), "found": len(found)}
+
+
+def main():
+    db_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "game_data.db")
+
+    conn = sqlite3.connect(db_path)
+    if not needs_migration(conn):
+        conn.close()
+        print(f"이미 v{SCHEMA_VERSION} 스키마입니다: {_measure(db_path)}")
+        return
+
+    before = _measure(db_path)
+    migrate(conn)
+    # 번들 DB 는 immutable 로 읽으므로 롤백 저널 모드로 두고 빈 공간 정리
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.execute("VACUUM")
+    conn.close()
+    after = _measure(db_path)
+
+    print(f"{'':10} {'before':>12} {'after':>12}")
+    for key in ("size_kb", "rows", "load_ms", "lookup_us", "found"):
+        print(f"{key:10} {before[key]:>12} {after[key]:>12}")
+
+
+if __name__ == "__main__":
+    main()
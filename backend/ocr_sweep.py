@@ -0,0 +1,128 @@
+"""
+OCR 전처리 설정 비교 (확대 배율 x 보간법)
+
+저장해 둔 카드 제목 크롭(debug_roi_*.png 등)을 augment_watcher 의 StripPreprocessor 로
+한 번에 전처리하고 Tesseract 로 읽어서, 설정별 정확도와 지연 시간을 표로 보여줍니다.
+정답은 ocr_labels.json ({"파일명": "정답 텍스트"}) 에 적어 둡니다.
+
+    python ocr_sweep.py                         # 기본: debug_roi_*.png, 전체 조합
+    python ocr_sweep.py --scales 1.5,2 --interps linear,cubic
+    python ocr_sweep.py --no-ocr                # Tesseract 없이 전처리 시간만
+
+가장 정확하면서 빠른 조합을 augment_watcher.OCR_UPSCALE / OCR_INTERPOLATION 에 반영하세요.
+"""
+import os
+import sys
+import glob
+import json
+import time
+import difflib
+import argparse
+import statistics
+
+import cv2
+
+import augment_watcher as aw
+from database import normalize_name
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LABELS_PATH = os.path.join(BASE_DIR, "ocr_labels.json")
+
+
+def load_samples(pattern, labels_path):
+    with open(labels_path, "r", encoding="utf-8") as f:
+        labels = json.load(f)
+
+    samples = []
+    for path in sorted(glob.glob(pattern)):
+        name = os.path.basename(path)
+        if name not in labels:
+            print(f"[Sweep] ⚠️ 정답 없음, 건너뜀: {name}")
+            continue
+        img = cv2.imread(path)
+        if img is None:
+            print(f"[Sweep] ⚠️ 이미지 읽기 실패: {path}")
+            continue
+        samples.append((name, img, labels[name]))
+    return samples
+
+
+def run_config(samples, scale, interp, repeat, use_ocr):
+    pre = aw.StripPreprocessor(scale, interp)
+    images = [img for _, img, _ in samples]
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        pre.process(images)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    result = {"scale": scale, "interp": interp, "pre_ms": statistics.median(timings),
+              "ocr_ms": None, "exact": None, "similarity": None}
+    if not use_ocr:
+        return result
+
+    processed = pre.process(images)
+    started = time.perf_counter()
+    texts = [aw.ocr_title(img) for img in processed]
+    result["ocr_ms"] = (time.perf_counter() - started) * 1000 / len(samples)
+
+    exact, similarity = 0, []
+    for text, (_, _, label) in zip(texts, samples):
+        got, want = normalize_name(text), normalize_name(label)
+        exact += got == want
+        similarity.append(difflib.SequenceMatcher(None, got, want).ratio())
+    result["exact"] = exact / len(samples)
+    result["similarity"] = statistics.mean(similarity)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 전처리 배율/보간법 비교")
+    parser.add_argument("--images", default=os.path.join(BASE_DIR, "debug_roi_*.png"))
+    parser.add_argument("--labels", default=LABELS_PATH)
+    parser.add_argument("--scales", default="1,1.5,2,3")
+    parser.add_argument("--interps", default=",".join(aw.INTERPOLATIONS))
+    parser.add_argument("--repeat", type=int, default=50, help="전처리 시간 측정 반복 횟수")
+    parser.add_argument("--no-ocr", action="store_true", help="Tesseract 없이 전처리 시간만 측정")
+    args = parser.parse_args()
+
+    samples = load_samples(args.images, args.labels)
+    if not samples:
+        print("[Sweep] 비교할 이미지가 없습니다.")
+        return 1
+
+    use_ocr = not args.no_ocr
+    if use_ocr:
+        aw.init_engine()
+        try:
+            aw.pytesseract.get_tesseract_version()
+        except Exception as e:
+            print(f"[Sweep] Tesseract 를 찾을 수 없습니다 ({e}). --no-ocr 로 전처리 시간만 잴 수 있습니다.")
+            return 1
+
+    print(f"[Sweep] 샘플 {len(samples)}개: {', '.join(name for name, _, _ in samples)}")
+    results = [run_config(samples, float(scale), interp, args.repeat, use_ocr)
+               for scale in args.scales.split(",") for interp in args.interps.split(",")]
+
+    # 정확도 높은 순 -> 빠른 순
+    results.sort(key=lambda r: (-(r["exact"] or 0), -(r["similarity"] or 0),
+                                (r["ocr_ms"] or 0) + r["pre_ms"]))
+
+    print(f"{'scale':>5} {'interp':>8} {'pre ms':>8} {'ocr ms':>8} {'exact':>6} {'sim':>6}")
+    for r in results:
+        ocr_ms = f"{r['ocr_ms']:8.1f}" if r["ocr_ms"] is not None else f"{'-':>8}"
+        exact = f"{r['exact']:6.0%}" if r["exact"] is not None else f"{'-':>6}"
+        sim = f"{r['similarity']:6.2f}" if r["similarity"] is not None else f"{'-':>6}"
+        print(f"{r['scale']:5g} {r['interp']:>8} {r['pre_ms']:8.3f} {ocr_ms} {exact} {sim}")
+
+    if not use_ocr:
+        return 0  # 정확도 없이 속도만으로는 추천하지 않음
+    best = results[0]
+    print(f"[Sweep] 추천: OCR_UPSCALE = {best['scale']:g}, OCR_INTERPOLATION = \"{best['interp']}\" "
+          f"(현재 {aw.OCR_UPSCALE}, \"{aw.OCR_INTERPOLATION}\")")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
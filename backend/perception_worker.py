@@ -0,0 +1,316 @@
+"""
+인식 파이프라인을 별도 프로세스에서 실행 (app.py --perception process)
+
+기본(thread) 모드에서는 화면 캡처 / OpenCV / OCR 이 Flask 서버와 같은 프로세스의
+스레드에서 돌아서, 무거운 NumPy/OCR 작업이 요청 처리와 GIL 을 다툽니다.
+process 모드에서는
+- 부모(서버) 프로세스: 화면 캡처 -> 공유 메모리 링 슬롯에 바로 변환(BGRA -> BGR) 후 슬롯 번호만 전달
+- 워커 프로세스: 슬롯을 복사 없이 ndarray 로 보고 증강 OCR + 상점 템플릿 매칭
+- 결과(전송 이벤트, 상점 여부, 구간 시간)는 작은 튜플로 결과 큐에 돌려줌
+워커가 죽거나 RESULT_TIMEOUT 동안 응답이 없으면 부모가 종료 후 재시작합니다 (점점 긴 대기).
+"""
+import time
+import queue
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import lazy_import
+import metrics
+
+np = lazy_import.lazy("numpy")
+cv2 = lazy_import.lazy("cv2")
+mss = lazy_import.lazy("mss")
+
+POLL_INTERVAL = 0.2       # 캡처 주기 (augment_watcher.POLL_INTERVAL 과 같음)
+SHOP_INTERVAL = 0.5       # 상점 확인 주기 (monitor_shop 과 같음)
+RING_SLOTS = 3            # 공유 메모리 프레임 슬롯 수 (빈 슬롯이 없으면 그 프레임은 건너뜀)
+READY_TIMEOUT = 60.0      # 워커 초기화(cv2/Tesseract 로드) 최대 대기
+RESULT_TIMEOUT = 10.0     # 보낸 프레임의 결과가 이 시간 안에 없으면 멈춘 것으로 보고 재시작
+RESTART_BACKOFF = (1, 2, 5, 10, 30)  # 연속 재시작 대기 (초)
+HEALTHY_AFTER = 60.0      # 이 시간 이상 정상 동작하면 재시작 대기를 처음부터
+MONITOR_CHECK_INTERVAL = 2.0  # 모니터 해상도 확인 주기 (바뀌면 링 크기를 맞춰 워커 재시작)
+
+
+# ==========================================
+# 1. 공유 메모리 프레임 링
+# ==========================================
+class FrameRing:
+    """(slots, H, W, 3) uint8 프레임 버퍼. name 을 주면 기존 메모리에 연결 (워커 쪽)"""
+    def __init__(self, shape, slots=RING_SLOTS, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.owner = name is None
+        if self.owner:
+            size = slots * int(np.prod(self.shape))
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        # ndarray 가 버퍼를 잡고 있으면 close 가 실패하므로 먼저 해제
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# ==========================================
+# 2. 워커 프로세스
+# ==========================================
+def _worker_main(ring_name, shape, slots, tasks, results, ocr_workers):
+    import augment_watcher as aw
+    import shop_detector
+
+    ring = FrameRing(shape, slots, name=ring_name)
+    aw.init_engine()
+    aw.load_valid_names()
+    shop_detector.load_template()
+    aw.warm_up()
+
+    events = []
+    watcher = aw.AugmentWatcher(sender=lambda active, titles=None: events.append((active, titles)),
+                                ocr_workers=ocr_workers)
+    results.put(("ready", None))
+    try:
+        while True:
+            task = tasks.get()
+            if task is None: break
+            slot, seq, captured_at, check_augments, check_shop = task
+
+            timings, shop_open = {}, None
+            frame = ring.frames[slot]  # 복사 없이 공유 메모리를 그대로 사용
+            try:
+                if check_augments:
+                    watcher.process_frame(frame, now=captured_at)
+                    timings.update(watcher.last_timings)
+                if check_shop:
+                    started = time.perf_counter()
+                    shop_open = shop_detector.check_frame(frame)
+                    timings["shop_match"] = (time.perf_counter() - started) * 1000
+            except Exception as e:
+                print(f"[Perception] Frame Error: {e}")
+            del frame
+
+            # 슬롯 반납 + 결과 전달 (실패한 프레임도 반드시 돌려줌)
+            results.put(("frame", (slot, seq, events[:], shop_open, timings)))
+            events.clear()
+    finally:
+        watcher.reader.close()
+        ring.close()
+
+
+# ==========================================
+# 3. 부모 쪽 감독 (캡처 + 전달 + 재시작)
+# ==========================================
+def _primary_monitor():
+    """
+    주 모니터 영역 {left, top, width, height}
+    mss 인스턴스는 처음 읽은 모니터 목록을 캐시하므로, 해상도 변경을 알려면 새로 열어서 읽어야 함
+    """
+    with mss.mss() as probe:
+        return dict(probe.monitors[1])
+
+class PerceptionProcess:
+    """
+    on_augments(active, titles=None): 증강 감지 결과 (AugmentWatcher 의 sender 와 같은 형태)
+    on_shop(is_open)                : 상점 상태가 바뀔 때
+    check_shop()                    : 상점 확인이 필요한지 (예: 게임 중일 때만)
+    check_augments()                : 증강 OCR 이 필요한지 (예: 증강 레벨 도달 직후만)
+    """
+    def __init__(self, on_augments, on_shop, check_shop=lambda: True, ocr_workers=None,
+                 check_augments=lambda: True):
+        self.on_augments = on_augments
+        self.on_shop = on_shop
+        self.check_shop = check_shop
+        self.check_augments = check_augments
+        self.ocr_workers = ocr_workers
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.ring = None
+        self.proc = None
+        self.tasks = None
+        self.results = None
+
+        self.ready = False
+        self.started_at = 0.0
+        self.in_flight = {}       # slot -> (seq, 보낸 시각)
+        self.seq = 0
+        self.restarts = 0
+        self.augments_active = False
+        self.shop_open = False
+        self.last_shop_check = 0.0
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="perception", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+
+    # --- 워커 관리 ---
+    def _spawn(self, shape):
+        if self.ring is None or self.ring.shape != shape:
+            if self.ring is not None: self.ring.close()
+            self.ring = FrameRing(shape)
+
+        # 죽은 워커가 큐 잠금을 쥐고 있을 수 있으므로 큐는 매번 새로 만듦
+        self.tasks, self.results = mp.Queue(), mp.Queue()
+        self.proc = mp.Process(target=_worker_main, name="perception-worker", daemon=True,
+                               args=(self.ring.name, shape, self.ring.slots,
+                                     self.tasks, self.results, self.ocr_workers))
+        self.proc.start()
+        self.ready = False
+        self.started_at = time.time()
+        self.in_flight.clear()
+        print(f"[Perception] 워커 프로세스 시작 (pid {self.proc.pid}, {shape[1]}x{shape[0]})")
+
+    def _kill(self):
+        if self.proc is None: return
+        if self.proc.is_alive():
+            self.tasks.put(None)
+            self.proc.join(2)
+        if self.proc.is_alive():
+            self.proc.terminate()
+            self.proc.join(2)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+        self.proc = None
+        for q in (self.tasks, self.results):
+            q.cancel_join_thread()
+            q.close()
+        self.in_flight.clear()
+
+    def _restart(self, shape, reason):
+        print(f"[Perception] ⚠️ 워커 재시작: {reason}")
+        metrics.inc("perception_restart")
+        self._kill()
+        # 새 워커의 감시기는 이전 상태를 모르므로 떠 있던 증강 창은 닫아 둠
+        if self.augments_active:
+            self.augments_active = False
+            self.on_augments(active=False)
+
+        if time.time() - self.started_at > HEALTHY_AFTER: self.restarts = 0
+        delay = RESTART_BACKOFF[min(self.restarts, len(RESTART_BACKOFF) - 1)]
+        self.restarts += 1
+        if self._stop_event.wait(delay): return
+        self._spawn(shape)
+
+    def _health_error(self):
+        now = time.time()
+        if not self.proc.is_alive():
+            return f"프로세스 종료 (exit code {self.proc.exitcode})"
+        if not self.ready and now - self.started_at > READY_TIMEOUT:
+            return "초기화 시간 초과"
+        for seq, sent_at in self.in_flight.values():
+            if now - sent_at > RESULT_TIMEOUT:
+                return f"프레임 {seq} 응답 없음 ({RESULT_TIMEOUT:g}s)"
+        return None
+
+    # --- 결과 처리 ---
+    def _drain(self):
+        while True:
+            try:
+                kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "ready":
+                self.ready = True
+                print("[Perception] 워커 준비 완료")
+                continue
+
+            slot, seq, events, shop_open, timings = payload
+            self.in_flight.pop(slot, None)
+            for name, ms in timings.items():
+                metrics.observe(name, ms / 1000)
+            for active, titles in events:
+                self.augments_active = active
+                self.on_augments(active=active, titles=titles)
+            if shop_open is not None:
+                self._set_shop(shop_open)
+
+    def _set_shop(self, is_open):
+        if is_open != self.shop_open:
+            self.shop_open = is_open
+            self.on_shop(is_open)
+
+    # --- 캡처 ---
+    def _dispatch(self, sct, monitor):
+        """프레임 1장 캡처 후 워커로 전달 (monitor 영역은 링과 같은 크기)"""
+        now = time.time()
+        # 떠 있는 증강 오버레이는 닫힐 때까지 계속 감시
+        check_augments = self.augments_active or self.check_augments()
+        check_shop = self.check_shop()
+        if not check_shop:
+            self._set_shop(False)
+        elif now - self.last_shop_check >= SHOP_INTERVAL:
+            self.last_shop_check = now
+        else:
+            check_shop = False
+        if not check_augments and not check_shop:
+            return None  # 이번 주기는 볼 것이 없음 -> 캡처 생략
+
+        free = [s for s in range(self.ring.slots) if s not in self.in_flight]
+        if not free:
+            metrics.inc("perception_frame_dropped")  # 워커가 밀림 -> 이번 프레임은 건너뜀
+            return None
+        slot = free[0]
+
+        with metrics.span("capture"):
+            shot = sct.grab(monitor)
+            bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+            # 공유 메모리 슬롯에 바로 변환 (중간 배열 없음)
+            cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self.ring.frames[slot])
+
+        self.seq += 1
+        self.in_flight[slot] = (self.seq, now)
+        self.tasks.put((slot, self.seq, now, check_augments, check_shop))
+
+    def _loop(self):
+        print("[Perception] 인식 워커 감독 시작 (process 모드)")
+        with mss.mss() as sct:
+            monitor = _primary_monitor()
+            shape = (monitor["height"], monitor["width"], 3)
+            last_monitor_check = time.monotonic()
+            self._spawn(shape)
+            try:
+                while not self._stop_event.is_set():
+                    started = time.perf_counter()
+                    try:
+                        self._drain()
+                        error = self._health_error()
+                        if error:
+                            self._restart(shape, error)
+                            continue
+
+                        if time.monotonic() - last_monitor_check >= MONITOR_CHECK_INTERVAL:
+                            last_monitor_check = time.monotonic()
+                            current = _primary_monitor()
+                            if current != monitor:
+                                # 해상도가 바뀌면 링을 새 크기로 만들고 워커도 다시 시작
+                                monitor = current
+                                shape = (monitor["height"], monitor["width"], 3)
+                                self._restart(shape, "해상도 변경")
+                                continue
+
+                        if self.ready:
+                            self._dispatch(sct, monitor)
+                    except Exception as e:
+                        print(f"[Perception] Error: {e}")
+                        time.sleep(1)
+                    self._stop_event.wait(max(0.0, POLL_INTERVAL - (time.perf_counter() - started)))
+            finally:
+                self._kill()
+                if self.ring is not None:
+                    self.ring.close()
+                    self.ring = None
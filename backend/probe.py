@@ -0,0 +1,94 @@
+"""
+템플릿 매칭 앞단의 픽셀 샘플 프로브
+
+버튼/상점 감지는 거의 항상 "아니오" 인데도 매 주기 전체 영역에 matchTemplate 을 돌립니다.
+TemplateProbe 는 마지막으로 찾은 위치를 기억해 두고, 그 자리의 픽셀 몇십 개만 꺼내서
+템플릿의 같은 픽셀과 상관계수(벡터 연산 1번, 수 µs)를 봅니다.
+- 프로브가 "아님" -> 매칭 생략 (단, FULL_SEARCH_EVERY 번마다 한 번은 전체 검색)
+- 프로브가 "혹시" -> 기억한 위치 주변만 먼저 매칭, 실패하면 전체 검색
+- 아직 한 번도 찾지 못했으면 항상 전체 검색
+상관계수는 평균을 뺀 값으로 계산하므로 TM_CCOEFF_NORMED 처럼 밝기 변화에 둔감합니다.
+오탐/누락률은 replay.py --probe-check 로 확인하세요.
+"""
+import math
+
+import lazy_import
+import metrics
+
+np = lazy_import.lazy("numpy")
+cv2 = lazy_import.lazy("cv2")
+
+PROBE_SAMPLES = 48        # 템플릿에서 뽑는 샘플 픽셀 수 (격자)
+PROBE_MIN_CORR = 0.5      # 이 상관계수 이상이면 "혹시" -> 실제 매칭 수행
+PROBE_MARGIN = 4          # 기억한 위치 주변 매칭 여유 (px)
+FULL_SEARCH_EVERY = 20    # 프로브가 연속으로 "아님" 이어도 이 횟수마다 전체 검색 (위치 변경 대응)
+
+
+class TemplateProbe:
+    def __init__(self, name, template, threshold, samples=PROBE_SAMPLES, min_corr=PROBE_MIN_CORR):
+        self.name = name
+        self.template = template
+        self.threshold = threshold
+        self.min_corr = min_corr
+        self.loc = None           # 마지막으로 찾은 위치 (x, y), 검색 이미지 기준
+        self.misses = 0           # 프로브로 건너뛴 연속 횟수
+
+        # 템플릿 비율에 맞춘 격자 샘플 (가장자리 1px 제외)
+        h, w = template.shape[:2]
+        rows = max(2, min(h - 2, round(math.sqrt(samples * h / w))))
+        cols = max(2, min(w - 2, samples // rows))
+        ys = np.linspace(1, h - 2, rows).round().astype(np.intp)
+        xs = np.linspace(1, w - 2, cols).round().astype(np.intp)
+        self.ys, self.xs = (a.ravel() for a in np.meshgrid(ys, xs, indexing="ij"))
+
+        ref = template[self.ys, self.xs].astype(np.float32).ravel()
+        self.ref = ref - ref.mean()
+        self.ref_norm = float(np.linalg.norm(self.ref))  # 0 이면 단색 템플릿 -> 프로브 사용 안 함
+
+    def probe(self, image):
+        """기억한 위치의 샘플 픽셀이 템플릿과 비슷한지 ("혹시" 면 True)"""
+        x, y = self.loc
+        values = image[self.ys + y, self.xs + x].astype(np.float32).ravel()
+        values -= values.mean()
+        norm = float(np.linalg.norm(values))
+        if norm == 0: return False
+        return float(values @ self.ref) / (norm * self.ref_norm) >= self.min_corr
+
+    def _fits(self, image):
+        h, w = self.template.shape[:2]
+        x, y = self.loc
+        return y + h <= image.shape[0] and x + w <= image.shape[1]
+
+    def _match(self, image, x0=0, y0=0, remember=True):
+        res = cv2.matchTemplate(image, self.template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        if max_val < self.threshold: return False
+        if remember: self.loc = (x0 + max_loc[0], y0 + max_loc[1])
+        return True
+
+    def _match_near(self, image):
+        h, w = self.template.shape[:2]
+        x, y = self.loc
+        x0, y0 = max(0, x - PROBE_MARGIN), max(0, y - PROBE_MARGIN)
+        region = image[y0:y + h + PROBE_MARGIN, x0:x + w + PROBE_MARGIN]
+        return self._match(region, x0, y0)
+
+    def match(self, image, use_probe=True):
+        """
+        템플릿이 image 안에 있는지 (threshold 이상).
+        use_probe=False 면 프로브 상태를 건드리지 않고 전체 검색만 (replay.py 의 기준값)
+        """
+        if not use_probe:
+            return self._match(image, remember=False)
+        if self.loc is not None and self.ref_norm:
+            if not self._fits(image):
+                self.loc = None  # 해상도가 바뀜 -> 위치 다시 찾기
+            elif not self.probe(image) and self.misses < FULL_SEARCH_EVERY:
+                self.misses += 1
+                metrics.inc(f"{self.name}_probe_skip")
+                return False
+            elif self._match_near(image):
+                self.misses = 0
+                return True
+        self.misses = 0
+        return self._match(image)
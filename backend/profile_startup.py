@@ -0,0 +1,126 @@
+"""
+백엔드 콜드 스타트 프로파일러
+
+app.py 를 `-X importtime` + `--profile-startup` 모드로 실행해서
+- 모듈별 임포트 시간 (importtime)
+- 서브시스템 초기화 / 지연 임포트 구간 (startup 스팬)
+- 프로세스 실행 ~ 전체 초기화 완료까지의 콜드 스타트 시간
+을 하나의 리포트로 저장합니다.
+
+콜드 스타트 시간은 회귀 지표로 관리합니다:
+    python profile_startup.py --update-baseline   # 기준값 갱신
+    python profile_startup.py                     # 기준값 대비 +20% 넘으면 exit 1
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+REPORT_PATH = os.path.join(BASE_DIR, "startup_profile.json")
+BASELINE_PATH = os.path.join(BASE_DIR, "startup_baseline.json")
+
+
+def parse_importtime(stderr_text):
+    """'import time: self [us] | cumulative | imported package' 라인 파싱"""
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cumulative_us, name = rest.split("|", 2)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2  # 들여쓰기 = 중첩 깊이
+        entries.append({
+            "module": name.strip(),
+            "depth": depth,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return entries
+
+
+def run_once():
+    """app.py 한 번 실행 후 (리포트, importtime 항목, 콜드 스타트 ms) 반환"""
+    fd, report_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    cmd = [sys.executable, "-X", "importtime", APP_PATH,
+           "--port", "0", "--profile-startup", report_path]
+
+    spawned_at = time.time()
+    proc = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True,
+                          text=True, encoding="utf-8", errors="replace")
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        print(proc.stderr[-2000:])
+        raise RuntimeError(f"프로파일 리포트 생성 실패 (exit {proc.returncode})")
+    finally:
+        os.remove(report_path)
+
+    cold_start_ms = (report["ready_at"] - spawned_at) * 1000
+    return report, parse_importtime(proc.stderr), cold_start_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 콜드 스타트 프로파일")
+    parser.add_argument("--runs", type=int, default=3, help="반복 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="리포트에 남길 임포트 상위 개수")
+    parser.add_argument("--out", default=REPORT_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율 (0.2 = +20%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    cold_starts = []
+    for i in range(args.runs):
+        report, imports, cold_ms = run_once()
+        cold_starts.append(cold_ms)
+        print(f"[Profile] run {i+1}/{args.runs}: cold start {cold_ms:.0f} ms")
+
+    cold_start_ms = statistics.median(cold_starts)
+    top_level = [e for e in imports if e["depth"] == 0]
+    top_level.sort(key=lambda e: e["cumulative_ms"], reverse=True)
+
+    result = {
+        "cold_start_ms": round(cold_start_ms, 1),
+        "cold_start_runs_ms": [round(c, 1) for c in cold_starts],
+        "import_total_ms": round(sum(e["self_ms"] for e in imports), 1),
+        "top_imports": top_level[:args.top],
+        "startup": report,  # 마지막 실행의 서브시스템/스팬 기록
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"[Profile] 리포트 저장: {args.out}")
+
+    for e in top_level[:10]:
+        print(f"  {e['cumulative_ms']:8.1f} ms  {e['module']}")
+    for s in report["spans"]:
+        print(f"  {s['start_ms']:8.1f} +{s['elapsed_ms']:7.1f} ms  {s['name']} [{s['thread']}]")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"cold_start_ms": result["cold_start_ms"]}, f, indent=2)
+        print(f"[Profile] 기준값 갱신: {result['cold_start_ms']} ms")
+        return 0
+
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["cold_start_ms"]
+        limit = baseline * (1 + args.tolerance)
+        print(f"[Profile] 콜드 스타트 {cold_start_ms:.0f} ms (기준 {baseline:.0f} ms, 한도 {limit:.0f} ms)")
+        if cold_start_ms > limit:
+            print("[Profile] ❌ 콜드 스타트 회귀 감지")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
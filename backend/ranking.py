@@ -0,0 +1,182 @@
+"""
+증강 추천 점수 행렬 (챔피언 x 증강)
+
+증강 화면의 카드 3장에 점수와 순위를 붙입니다.
+점수 = 전용 티어(챔피언별, 없으면 범용 티어) + 범용 티어 + 승률 + 픽률 의 가중합 (0~100)
+모든 (챔피언, 증강) 조합을 미리 계산해 두고, 조회는 행 1개에서 열 3개를 꺼내는 NumPy 인덱싱 한 번.
+- 행: registry 챔피언 id 순서 + 마지막 행은 "챔피언 모름" (범용 정보만)
+- 열: registry 증강 id 순서
+
+compile_data.py 가 runtime_data.json 과 함께 ranking.npz 로 저장하고, 서버는 번들과 짝이 맞으면 그대로 읽습니다.
+없거나 맞지 않으면 메모리의 데이터로 바로 만듭니다 (100 ms 정도).
+데이터를 다시 읽으면(database.DATA_GENERATION 변경) 다음 조회 때 새 행렬을 만들어 한 번에 교체합니다.
+"""
+import os
+import json
+import threading
+
+import lazy_import
+import database
+import registry
+
+np = lazy_import.lazy("numpy")
+
+RANKING_PATH = database.resource_path("ranking.npz")
+RANKING_FORMAT = 1
+
+# 티어 점수 (S+ 가 1.0)
+TIER_POINTS = {"S+": 6, "S": 5, "A": 4, "B": 3, "C": 2, "D": 1}
+UNKNOWN_TIER_POINTS = 2.5   # "?" / 정보 없음 -> B 와 C 사이
+MAX_TIER_POINTS = 6
+
+# 가중치 (합 1.0)
+WEIGHT_CHAMPION = 0.5
+WEIGHT_GLOBAL = 0.25
+WEIGHT_WIN_RATE = 0.15
+WEIGHT_PICK_RATE = 0.10
+WIN_RATE_RANGE = (40.0, 60.0)  # 이 구간을 0~1 로 (밖은 잘라냄)
+
+
+class ScoreMatrix:
+    __slots__ = ("scores", "champion_ids", "augment_ids", "row_of", "col_of", "generation")
+
+    def __init__(self, scores, champion_ids, augment_ids, generation):
+        self.scores = scores                  # (챔피언 수 + 1, 증강 수) float32
+        self.champion_ids = champion_ids
+        self.augment_ids = augment_ids
+        self.row_of = {int(cid): i for i, cid in enumerate(champion_ids)}
+        self.col_of = {int(aid): i for i, aid in enumerate(augment_ids)}
+        self.generation = generation
+
+    def rank(self, champion, aug_ids):
+        """
+        증강 id 목록 -> ([점수], [순위]) (입력 순서 그대로, 순위는 1부터)
+        모르는 증강은 점수 None, 순위는 맨 뒤
+        """
+        row = self.row_of.get(registry.champion_id(champion), len(self.champion_ids))
+        cols = [self.col_of.get(aid, -1) for aid in aug_ids]
+        gathered = self.scores[row].take(cols).tolist()  # 카드 수만큼 한 번에 꺼냄
+        scores = [round(s, 1) if c >= 0 else None for s, c in zip(gathered, cols)]
+
+        # 카드가 3장뿐이라 순위는 파이썬 정렬이 NumPy argsort 보다 빠름
+        order = sorted(range(len(scores)), key=lambda i: -scores[i] if scores[i] is not None else float("inf"))
+        ranks = [0] * len(scores)
+        for rank, i in enumerate(order, 1):
+            ranks[i] = rank
+        return scores, ranks
+
+
+# ==========================================
+# 1. 행렬 생성
+# ==========================================
+def _tier_points(tier):
+    return TIER_POINTS.get(tier, UNKNOWN_TIER_POINTS)
+
+def _percent(value):
+    """"52.31%" -> 52.31 (없으면 nan)"""
+    try:
+        return float(str(value).rstrip("%"))
+    except (TypeError, ValueError):
+        return float("nan")
+
+def build():
+    """메모리에 읽어 둔 데이터(database + registry)로 점수 행렬 생성"""
+    database.load_all_data_to_memory()
+    generation = database.DATA_GENERATION
+    champion_ids = np.array(registry.champion_ids(), dtype=np.int64)
+    augment_ids = np.array(registry.augment_ids(), dtype=np.int64)
+    row_of = {int(cid): i for i, cid in enumerate(champion_ids)}
+    col_of = {int(aid): i for i, aid in enumerate(augment_ids)}
+
+    # 증강별 범용 정보 (열 벡터)
+    stats = [database.get_augment_stats(int(aid)) for aid in augment_ids]
+    global_tier = np.array([_tier_points(s.tier_global) for s in stats], dtype=np.float32)
+    win_rate = np.array([_percent(s.win_rate) for s in stats], dtype=np.float32)
+    pick_rate = np.array([_percent(s.pick_rate) for s in stats], dtype=np.float32)
+
+    low, high = WIN_RATE_RANGE
+    win_score = np.nan_to_num(np.clip((win_rate - low) / (high - low), 0, 1), nan=0.5)
+    max_pick = np.nanmax(pick_rate) if not np.isnan(pick_rate).all() else 0
+    pick_score = np.nan_to_num(pick_rate / max_pick, nan=0.5) if max_pick > 0 else np.full_like(pick_rate, 0.5)
+
+    # 챔피언 전용 티어 (없는 칸은 범용 티어로 채움)
+    champ_tier = np.full((len(champion_ids) + 1, len(augment_ids)), np.nan, dtype=np.float32)
+    rows, cols, points = [], [], []
+    for cid, aid, tier in database.get_all_champion_augment_tiers():
+        if cid in row_of and aid in col_of:
+            rows.append(row_of[cid])
+            cols.append(col_of[aid])
+            points.append(_tier_points(tier))
+    champ_tier[rows, cols] = points
+    champ_tier = np.where(np.isnan(champ_tier), global_tier, champ_tier)
+
+    scores = 100 * (WEIGHT_CHAMPION * champ_tier / MAX_TIER_POINTS
+                    + WEIGHT_GLOBAL * global_tier / MAX_TIER_POINTS
+                    + WEIGHT_WIN_RATE * win_score
+                    + WEIGHT_PICK_RATE * pick_score)
+    return ScoreMatrix(scores.astype(np.float32), champion_ids, augment_ids, generation)
+
+
+# ==========================================
+# 2. 저장 / 읽기 (compile_data.py 결과물)
+# ==========================================
+def _bundle_sources(bundle):
+    return json.dumps((bundle or {}).get("sources", {}), sort_keys=True)
+
+def save(matrix, bundle, path=RANKING_PATH):
+    """번들과 짝을 맞춰 저장 (임시 파일 -> 교체)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, format=RANKING_FORMAT, sources=_bundle_sources(bundle), scores=matrix.scores,
+                 champion_ids=matrix.champion_ids, augment_ids=matrix.augment_ids)
+    os.replace(tmp_path, path)
+
+def _load_saved(path=RANKING_PATH):
+    """저장된 행렬이 지금 읽은 데이터와 같으면 반환, 아니면 None"""
+    bundle = database.load_runtime_bundle()
+    if bundle is None or not os.path.exists(path): return None
+    try:
+        with np.load(path) as data:
+            if int(data["format"]) != RANKING_FORMAT or str(data["sources"]) != _bundle_sources(bundle):
+                return None
+            champion_ids, augment_ids = data["champion_ids"], data["augment_ids"]
+            # sources 에 DB 내용 지문도 들어 있음. id 체계까지 같아야 사용
+            if (champion_ids.tolist() != registry.champion_ids()
+                    or augment_ids.tolist() != registry.augment_ids()):
+                return None
+            return ScoreMatrix(data["scores"], champion_ids, augment_ids, database.DATA_GENERATION)
+    except Exception as e:
+        print(f"[Ranking] ranking.npz 읽기 실패: {e}")
+        return None
+
+
+# ==========================================
+# 3. 현재 행렬 (데이터가 바뀌면 새로 만들어 교체)
+# ==========================================
+_MATRIX = None
+_LOCK = threading.Lock()
+
+def current():
+    global _MATRIX
+    matrix = _MATRIX
+    if matrix is not None and matrix.generation == database.DATA_GENERATION:
+        return matrix
+
+    with _LOCK:
+        database.load_all_data_to_memory()
+        matrix = _MATRIX
+        if matrix is not None and matrix.generation == database.DATA_GENERATION:
+            return matrix
+        matrix = _load_saved()
+        source = "ranking.npz"
+        if matrix is None:
+            matrix = build()
+            source = "메모리 데이터"
+        # 🔥 다 만든 뒤 한 번에 교체 (조회 중인 스레드는 이전 행렬을 끝까지 사용)
+        _MATRIX = matrix
+        print(f"[Ranking] 점수 행렬 준비 ({len(matrix.champion_ids)}x{len(matrix.augment_ids)}, {source})")
+        return matrix
+
+def rank(champion, aug_ids):
+    """현재 행렬로 순위 ([점수], [순위])"""
+    return current().rank(champion, aug_ids)
@@ -0,0 +1,218 @@
+"""
+챔피언 / 증강 이름 레지스트리 (정수 id + 별칭 테이블)
+
+이름 표기가 모듈마다 달라서(LCU 의 DDragon 이름, DB 표시 이름, 한글 증강 이름, 영어 증강 이름,
+Lolalytics 슬러그 ...) 예전에는 조회할 때마다 문자열을 정규화해서 비교했습니다.
+여기서 데이터를 읽을 때 모든 표기(원문 + 정규화)를 미리 id 로 묶어 두고,
+조회는 dict 한 번(원문) 또는 두 번(정규화)으로 끝냅니다.
+
+- 챔피언 id = DB champion.id
+- 증강 id   = 같은 증강의 DB augment 행 중 가장 작은 id
+  (DB 에 한글 행과 영어 행이 따로 있어도 augment_name_map 으로 묶어서 하나의 id)
+database 가 데이터를 (다시) 읽을 때 load() 를 호출합니다.
+"""
+import re
+import functools
+
+# ==========================================
+# 1. 이름 정규화
+# ==========================================
+_NON_NAME_CHARS = re.compile(r'[^a-zA-Z0-9가-힣]')
+
+# 정규화만으로는 같아지지 않는 이름
+NORMALIZE_EXCEPTIONS = {
+    "MonkeyKing": "wukong",
+}
+
+@functools.lru_cache(maxsize=4096)
+def normalize(name):
+    """한글, 영어, 숫자만 남기고 소문자로 (공백, 특수문자 제거)"""
+    if not name: return ""
+    if name in NORMALIZE_EXCEPTIONS:
+        return NORMALIZE_EXCEPTIONS[name]
+    return _NON_NAME_CHARS.sub('', name).lower()
+
+# ==========================================
+# 2. 고정 별칭
+# ==========================================
+# DDragon 영어 이름 -> LCU 드라이버가 쓰는 이름
+CHAMPION_NAME_FIXES = {
+    "Nunu & Willump": "Nunu",
+    "Kha'Zix": "Khazix",
+    "Kai'Sa": "Kaisa",
+    "Vel'Koz": "Velkoz",
+    "Cho'Gath": "Chogath",
+    "Bel'Veth": "Belveth",
+    "Kog'Maw": "KogMaw",
+    "Rek'Sai": "Reksai",
+    "Dr. Mundo": "DrMundo",
+    "Renata Glasc": "Renata",
+    "Wukong": "MonkeyKing", # 가끔 Wukong 대신 MonkeyKing을 쓰는 데이터가 있음
+    "LeBlanc": "Leblanc"
+}
+
+# 챔피언 ID(DDragon) -> Lolalytics URL 슬러그
+LOLALYTICS_SLUGS = {
+    "Renata": "renata",
+    "MonkeyKing": "wukong",
+    "Nunu": "nunu",
+    "DrMundo": "drmundo",
+    "JarvanIV": "jarvaniv",
+    "LeeSin": "leesin",
+    "MasterYi": "masteryi",
+    "MissFortune": "missfortune",
+    "TahmKench": "tahmkench",
+    "TwistedFate": "twistedfate",
+    "XinZhao": "xinzhao",
+    "KogMaw": "kogmaw",
+    "RekSai": "reksai",
+    "Belveth": "belveth",
+    "Glasc": "renata"
+}
+
+def lolalytics_slug(champ_id):
+    """챔피언 ID를 Lolalytics URL 슬러그로 변환"""
+    if champ_id in LOLALYTICS_SLUGS: return LOLALYTICS_SLUGS[champ_id]
+    return champ_id.lower().replace(" ", "").replace("'", "").replace(".", "")
+
+# ==========================================
+# 3. 레코드 + 별칭 테이블
+# ==========================================
+class Champion:
+    __slots__ = ("id", "name")
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+class Augment:
+    __slots__ = ("id", "name_ko", "name_en")
+
+    def __init__(self, id, name_ko=None, name_en=None):
+        self.id = id
+        self.name_ko = name_ko
+        self.name_en = name_en
+
+_CHAMPIONS = {}           # id -> Champion
+_CHAMPION_ALIASES = {}    # 별칭(원문 + 정규화) -> 챔피언 id
+_AUGMENTS = {}            # id -> Augment
+_AUGMENT_ALIASES = {}     # 별칭(원문 + 정규화, 한글 + 영어) -> 증강 id
+_AUGMENT_BY_DB_ID = {}    # DB augment.id -> 증강 id
+_EXTRA_CHAMPION_ALIASES = {}  # add_champion_aliases() 로 추가된 별칭 (다시 load 해도 유지)
+
+def _add_alias(aliases, name, entity_id):
+    # 이미 다른 이름이 차지한 별칭은 덮어쓰지 않음 (DB 이름 우선)
+    if not name: return
+    aliases.setdefault(name, entity_id)
+    aliases.setdefault(normalize(name), entity_id)
+
+def _link_champion_aliases(aliases, pairs):
+    """(이름, 다른 표기) 쌍 중 한쪽이라도 알려진 챔피언이면 양쪽 다 그 챔피언의 별칭으로"""
+    for names in pairs:
+        cid = next((aliases[normalize(n)] for n in names if normalize(n) in aliases), None)
+        if cid is None: continue
+        for n in names:
+            _add_alias(aliases, n, cid)
+
+def load(champions, augments, augment_map):
+    """
+    champions  : {DB champion.id: 표시 이름}
+    augments   : {DB augment.id: 이름 (한글 또는 영어)}
+    augment_map: {한글 이름: 영어 이름}
+    """
+    global _CHAMPIONS, _CHAMPION_ALIASES, _AUGMENTS, _AUGMENT_ALIASES, _AUGMENT_BY_DB_ID
+
+    # 챔피언
+    champion_records = {}
+    champion_aliases = {}
+    for cid, name in sorted(champions.items()):
+        champion_records[cid] = Champion(cid, name)
+        _add_alias(champion_aliases, name, cid)
+    _link_champion_aliases(champion_aliases, list(CHAMPION_NAME_FIXES.items()) +
+                           list(LOLALYTICS_SLUGS.items()) + list(_EXTRA_CHAMPION_ALIASES.items()))
+
+    # 증강: 영어 이름(정규화) 기준으로 한글/영어 행을 하나로 묶음
+    en_by_ko = {normalize(ko): en for ko, en in augment_map.items()}
+
+    def canonical(name):
+        clean = normalize(name)
+        en = en_by_ko.get(clean)
+        return normalize(en) if en else clean
+
+    augment_records = {}
+    augment_ids = {}      # 기준 키 -> 증강 id
+    by_db_id = {}
+    for db_id, name in sorted(augments.items()):
+        key = canonical(name)
+        aid = augment_ids.setdefault(key, db_id)
+        by_db_id[db_id] = aid
+        record = augment_records.setdefault(aid, Augment(aid))
+        if _is_korean(name):
+            record.name_ko = record.name_ko or name
+        else:
+            record.name_en = record.name_en or name
+
+    # DB 에 행이 없는 매핑 증강은 새 id
+    next_id = max(augments, default=0)
+    for ko, en in sorted(augment_map.items()):
+        key = normalize(en)
+        if key not in augment_ids:
+            next_id += 1
+            augment_ids[key] = next_id
+            augment_records[next_id] = Augment(next_id)
+        record = augment_records[augment_ids[key]]
+        record.name_ko = record.name_ko or ko
+        record.name_en = en  # 영어 표기는 매핑 파일 기준
+
+    augment_aliases = {}
+    for db_id, name in augments.items():
+        _add_alias(augment_aliases, name, by_db_id[db_id])
+    for ko, en in augment_map.items():
+        aid = augment_ids[normalize(en)]
+        _add_alias(augment_aliases, ko, aid)
+        _add_alias(augment_aliases, en, aid)
+
+    # 🔥 새 맵을 다 만든 뒤 한 번에 교체 (재로드 중 조회 안전)
+    _CHAMPIONS = champion_records
+    _CHAMPION_ALIASES = champion_aliases
+    _AUGMENTS = augment_records
+    _AUGMENT_ALIASES = augment_aliases
+    _AUGMENT_BY_DB_ID = by_db_id
+
+def _is_korean(name):
+    return any("가" <= ch <= "힣" for ch in name)
+
+def add_champion_aliases(aliases):
+    """{다른 표기: 알려진 이름} 추가 (예: LCU 가 받은 DDragon id / 표시 이름)"""
+    _EXTRA_CHAMPION_ALIASES.update(aliases)
+    _link_champion_aliases(_CHAMPION_ALIASES, aliases.items())
+
+# ==========================================
+# 4. 조회
+# ==========================================
+def champion_id(name):
+    """챔피언 이름(어떤 표기든) -> id. 모르면 None"""
+    if not name: return None
+    cid = _CHAMPION_ALIASES.get(name)
+    return cid if cid is not None else _CHAMPION_ALIASES.get(normalize(name))
+
+def augment_id(name):
+    """증강 이름(한글/영어, 어떤 표기든) -> id. 모르면 None"""
+    if not name: return None
+    aid = _AUGMENT_ALIASES.get(name)
+    return aid if aid is not None else _AUGMENT_ALIASES.get(normalize(name))
+
+def augment_id_for_db(db_id):
+    return _AUGMENT_BY_DB_ID.get(db_id)
+
+def champion(cid):
+    return _CHAMPIONS.get(cid)
+
+def augment(aid):
+    return _AUGMENTS.get(aid)
+
+def champion_ids():
+    return sorted(_CHAMPIONS)
+
+def augment_ids():
+    return sorted(_AUGMENTS)
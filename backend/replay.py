@@ -0,0 +1,263 @@
+"""
+인식 파이프라인 오프라인 리플레이 / 벤치마크
+
+녹화한 프레임(PNG 폴더 또는 영상 파일)을 실제 감지 경로
+(AugmentWatcher.process_frame, shop_detector.check_frame)에 가짜 시계로 흘려보내고
+- 단계별 지연 시간 백분위 (ocr / button / shop / total)
+- 처리 속도 (frames/s), CPU 시간
+- 정답 라벨 대비 인식 정확도
+를 보고합니다. 게임 없이 리눅스에서도 성능 변화를 잴 수 있습니다.
+
+    python replay.py recordings/session1            # PNG 폴더 (이름순)
+    python replay.py session1.mp4 --labels session1.json
+    python replay.py recordings/session1 --no-ocr   # Tesseract 없이 버튼/상점 단계만
+    python replay.py recordings/session1 --probe-check  # 픽셀 프로브 누락률 (전체 매칭과 비교)
+
+라벨 파일 (기본: 폴더 안의 labels.json) - 키는 PNG 파일명, 영상은 프레임 번호:
+    {"frame_0001.png": {"titles": ["빵과 버터", "범람", "마법 미사일"], "shop": false},
+     "frame_0002.png": {"titles": [], "shop": true}}
+"""
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+
+import cv2
+
+import augment_watcher as aw
+import metrics
+import shop_detector
+from database import normalize_name
+
+FRAME_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+STAGES = ("ocr", "button", "shop", "total")
+
+
+class FakeClock:
+    """프레임 시각을 직접 지정하는 시계 (AugmentWatcher 의 clock 으로 사용)"""
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+# ==========================================
+# 1. 프레임 읽기
+# ==========================================
+def iter_frames(source, interval=aw.POLL_INTERVAL):
+    """(이름, 프레임 시각(초), BGR 이미지) 순회"""
+    if os.path.isdir(source):
+        paths = sorted(p for p in glob.glob(os.path.join(source, "*"))
+                       if p.lower().endswith(FRAME_EXTENSIONS))
+        # PNG 시퀀스는 실시간 루프처럼 POLL_INTERVAL 간격으로 찍힌 것으로 간주
+        for i, path in enumerate(paths):
+            img = cv2.imread(path, cv2.IMREAD_COLOR)
+            if img is not None:
+                yield os.path.basename(path), i * interval, img
+        return
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"영상을 열 수 없습니다: {source}")
+    try:
+        index, next_t = 0, 0.0
+        while True:
+            ok, img = cap.read()
+            if not ok: break
+            t = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+            # 실시간 루프와 같은 간격으로만 샘플링
+            if t + 1e-6 >= next_t:
+                yield str(index), t, img
+                next_t += interval
+            index += 1
+    finally:
+        cap.release()
+
+
+def load_labels(source, labels_path=None):
+    if labels_path is None:
+        if not os.path.isdir(source): return {}
+        labels_path = os.path.join(source, "labels.json")
+        if not os.path.exists(labels_path): return {}
+    with open(labels_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ==========================================
+# 2. 통계
+# ==========================================
+def percentile(values, q):
+    """nearest-rank 백분위 (q: 0~100, /metrics 와 같은 계산)"""
+    if not values: return None
+    return metrics._quantile(sorted(values), q / 100)
+
+
+def summarize(values):
+    if not values: return None
+    return {"p50": percentile(values, 50), "p90": percentile(values, 90),
+            "p99": percentile(values, 99), "max": max(values), "mean": sum(values) / len(values)}
+
+
+def _titles_key(titles):
+    return [normalize_name(t) for t in titles]
+
+
+# ==========================================
+# 3. 리플레이
+# ==========================================
+def replay(source, labels=None, use_ocr=True, interval=aw.POLL_INTERVAL, ocr_workers=1,
+           probe_check=False):
+    """
+    ocr_workers: 기본 1 = 순차 OCR (deadline 없음 -> 같은 프레임이면 항상 같은 결과)
+    2 이상이면 실제 감시기처럼 OCR_DEADLINE(실제 시간)이 적용돼서 정확도가 PC 속도에 따라 달라짐
+    """
+    labels = labels or {}
+    aw.init_engine()
+    aw.load_valid_names()
+
+    clock = FakeClock()
+    events = []
+    watcher = aw.AugmentWatcher(
+        sender=lambda active, titles=None: events.append(
+            {"t": round(clock.now, 3), "active": active, "titles": titles}),
+        clock=clock, ocr_workers=ocr_workers)
+
+    timings = {stage: [] for stage in STAGES}
+    counts = {"frames": 0, "title_frames": 0, "title_correct": 0, "cards": 0, "cards_correct": 0,
+              "shop_frames": 0, "shop_correct": 0}
+    cpu_total = 0.0
+    wall_total = 0.0
+    # 프로브 판정 vs 전체 매칭 (probe_check): {단계: {"positives", "missed", "extra"}}
+    probe_stats = {stage: {"positives": 0, "missed": 0, "extra": 0} for stage in ("button", "shop")}
+
+    for name, t, img in iter_frames(source, interval):
+        clock.now = t
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+
+        if use_ocr:
+            result = watcher.process_frame(img)
+            timings["ocr"].append(watcher.last_timings["ocr"])
+            timings["button"].append(watcher.last_timings["button"])
+        else:
+            # OCR 없이 버튼 확인 단계만
+            button_started = time.perf_counter()
+            result = {"titles": [], "augment_phase": aw.is_augment_phase(img)}
+            timings["button"].append((time.perf_counter() - button_started) * 1000)
+
+        shop_started = time.perf_counter()
+        shop_open = shop_detector.check_frame(img)
+        timings["shop"].append((time.perf_counter() - shop_started) * 1000)
+
+        elapsed = time.perf_counter() - started
+        timings["total"].append(elapsed * 1000)
+        wall_total += elapsed
+        cpu_total += time.process_time() - cpu_started
+        counts["frames"] += 1
+
+        if probe_check:
+            # 시간 측정이 끝난 뒤 프로브 없이 전체 매칭을 한 번 더 해서 비교
+            for stage, got, want in (("button", result["augment_phase"], aw.is_augment_phase(img, use_probe=False)),
+                                     ("shop", shop_open, shop_detector.check_frame(img, use_probe=False))):
+                probe_stats[stage]["positives"] += want
+                probe_stats[stage]["missed"] += want and not got
+                probe_stats[stage]["extra"] += got and not want
+
+        # 정답 비교
+        label = labels.get(name)
+        if not label: continue
+        if use_ocr and "titles" in label:
+            predicted = result["titles"] if result["augment_phase"] else []
+            want, got = _titles_key(label["titles"]), _titles_key(predicted)
+            counts["title_frames"] += 1
+            counts["title_correct"] += got == want
+            counts["cards"] += len(want)
+            counts["cards_correct"] += sum(1 for w in want if w in got)
+        if "shop" in label:
+            counts["shop_frames"] += 1
+            counts["shop_correct"] += shop_open == bool(label["shop"])
+
+    watcher.reader.close()
+
+    def ratio(a, b):
+        return round(counts[a] / counts[b], 4) if counts[b] else None
+
+    return {
+        "source": source,
+        "frames": counts["frames"],
+        "fps": round(counts["frames"] / wall_total, 2) if wall_total else None,
+        "cpu_ms_per_frame": round(cpu_total * 1000 / counts["frames"], 3) if counts["frames"] else None,
+        "cpu_utilization": round(cpu_total / wall_total, 3) if wall_total else None,
+        "latency_ms": {stage: summarize(values) for stage, values in timings.items()},
+        "accuracy": {
+            "title_frames": ratio("title_correct", "title_frames"),
+            "cards": ratio("cards_correct", "cards"),
+            "shop": ratio("shop_correct", "shop_frames"),
+        },
+        "labeled": {"title_frames": counts["title_frames"], "shop_frames": counts["shop_frames"]},
+        "probe": {stage: dict(s, false_negative_rate=round(s["missed"] / s["positives"], 4)
+                              if s["positives"] else None)
+                  for stage, s in probe_stats.items()} if probe_check else None,
+        "events": events,
+    }
+
+
+def print_report(report):
+    print(f"[Replay] {report['source']}: {report['frames']} frames, {report['fps']} frames/s, "
+          f"CPU {report['cpu_ms_per_frame']} ms/frame (사용률 {report['cpu_utilization']})")
+    print(f"{'stage':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    for stage, s in report["latency_ms"].items():
+        if not s: continue
+        print(f"{stage:>8} {s['p50']:8.2f} {s['p90']:8.2f} {s['p99']:8.2f} {s['max']:8.2f}")
+
+    acc, labeled = report["accuracy"], report["labeled"]
+    fmt = lambda v: "-" if v is None else f"{v:.1%}"
+    print(f"[Replay] 정확도: 제목(프레임) {fmt(acc['title_frames'])} / 카드 {fmt(acc['cards'])} "
+          f"({labeled['title_frames']} frames), 상점 {fmt(acc['shop'])} ({labeled['shop_frames']} frames)")
+    if report["probe"]:
+        for stage, s in report["probe"].items():
+            print(f"[Replay] 프로브 {stage}: 전체 매칭 양성 {s['positives']} 중 누락 {s['missed']} "
+                  f"(누락률 {fmt(s['false_negative_rate'])}), 추가 양성 {s['extra']}")
+    print(f"[Replay] 전송 이벤트 {len(report['events'])}개")
+    for e in report["events"]:
+        print(f"  t={e['t']:7.2f}s active={e['active']} {e['titles'] or ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 프레임으로 인식 파이프라인 리플레이")
+    parser.add_argument("source", help="PNG 폴더 또는 영상 파일")
+    parser.add_argument("--labels", help="정답 JSON (기본: 폴더의 labels.json)")
+    parser.add_argument("--interval", type=float, default=aw.POLL_INTERVAL, help="프레임 간격(초)")
+    parser.add_argument("--no-ocr", action="store_true", help="Tesseract 없이 버튼/상점 단계만")
+    parser.add_argument("--ocr-workers", type=int, default=1,
+                        help="카드 OCR 동시 실행 수 (기본 1 = 순차, 재현 가능한 정확도). "
+                             "2 이상은 실시간 deadline 이 적용되어 결과가 PC 속도에 따라 달라짐")
+    parser.add_argument("--probe-check", action="store_true",
+                        help="프레임마다 프로브 없는 전체 매칭도 실행해서 프로브 누락률 측정")
+    parser.add_argument("--json", help="리포트를 JSON 으로 저장")
+    args = parser.parse_args()
+
+    use_ocr = not args.no_ocr
+    if use_ocr:
+        aw.init_engine()
+        try:
+            aw.pytesseract.get_tesseract_version()
+        except Exception as e:
+            print(f"[Replay] Tesseract 를 찾을 수 없습니다 ({e}). --no-ocr 로 버튼/상점 단계만 잴 수 있습니다.")
+            return 1
+
+    report = replay(args.source, load_labels(args.source, args.labels), use_ocr, args.interval,
+                    args.ocr_workers, args.probe_check)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"[Replay] 리포트 저장: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,93 +1,176 @@
-
 import os
+import re
+import json
+import argparse
+import tempfile
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import re
-import time
 
 # Create directories
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "augments")
-os.makedirs(ASSETS_DIR, exist_ok=True)
+# url -> {file, etag, last_modified} (조건부 요청용)
+MANIFEST_PATH = os.path.join(ASSETS_DIR, "manifest.json")
 
 URL = "https://wiki.leagueoflegends.com/en-us/ARAM:_Mayhem/Augments"
 
+DEFAULT_WORKERS = 8     # 동시 다운로드 수 (위키 서버 부담 고려해서 작게)
+# 위키가 아닌 주소(로컬 테스트 서버 등)에서 받은 아이콘은 --out-dir 을 주지 않으면 임시 폴더에 저장
+# (실제 assets/augments 아이콘과 매니페스트를 덮어쓰지 않도록)
+TEST_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "scrape_augments")
+
 def safe_filename(name):
     return re.sub(r'[\\/*?:"<>|]', "", name).strip()
 
-def main():
-    print(f"Fetching {URL}...")
+# ==========================================
+# 1. HTTP 세션 (커넥션 재사용 + 재시도)
+# ==========================================
+def make_session(workers=DEFAULT_WORKERS):
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=workers, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "lol-aram-helper/1.0 (augment icon sync)"
+    return session
+
+# ==========================================
+# 2. 매니페스트 (ETag / Last-Modified)
+# ==========================================
+def load_manifest(path=None):
+    path = path or MANIFEST_PATH
     try:
-        response = requests.get(URL)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"Failed to fetch page: {e}")
-        return
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest, path=None):
+    path = path or MANIFEST_PATH
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, path)
+
+# ==========================================
+# 3. 아이콘 목록 파싱
+# ==========================================
+def find_icons(page_html, page_url=URL):
+    """페이지에서 [(증강 이름, 이미지 URL)] 추출"""
+    soup = BeautifulSoup(page_html, 'html.parser')
 
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
     # Target the main content area
     content = soup.find(id="mw-content-text")
     if not content:
-        print("Could not find main content.")
-        return
-
-    # Find all augment icon links
-    # Pattern: <a ... title="..."> <img ... src="..."> </a>
-    # The snippet showed: <a href="..." class="mw-file-description" title="An icon for the ARAM: Mayhem augment ADAPt">
-    
-    links = content.find_all('a', class_='mw-file-description')
-    
-    count = 0
-    for link in links:
+        return []
+
+    # Pattern: <a class="mw-file-description" title="An icon for the ARAM: Mayhem augment ADAPt"><img src="..."></a>
+    # 80px 썸네일(src)로도 템플릿 매칭에는 충분해서 원본 해상도는 따로 받지 않음
+    icons = []
+    for link in content.find_all('a', class_='mw-file-description'):
         title_attr = link.get('title', '')
-        # Filter for "An icon for the ARAM: Mayhem augment ..."
-        if "An icon for the ARAM: Mayhem augment" in title_attr:
-            augment_name = title_attr.replace("An icon for the ARAM: Mayhem augment", "").strip()
-            
-            img_tag = link.find('img')
-            if img_tag:
-                src = img_tag.get('src', '')
-                if not src:
-                    continue
-                
-                # Handle relative URLs if necessary (usually they are absolute or root-relative)
-                if src.startswith('/'):
-                    img_url = "https://wiki.leagueoflegends.com" + src
-                else:
-                    img_url = src
-                
-                # Get higher resolution if possible (remove /thumb/ and the size prefix)
-                # Example: /en-us/images/thumb/ADAPt_mayhem_augment.png/80px-ADAPt_mayhem_augment.png
-                # Target: /en-us/images/ADAPt_mayhem_augment.png
-                
-                # But wiki structure is tricky. Let's try to just download the src as is first, 
-                # or try to derive the full size URL.
-                # Common pattern: /images/thumb/a/a1/Name.png/SIZEpx-Name.png
-                # Full size: /images/a/a1/Name.png
-                
-                # Let's try downloading the 80px thumb first as it's sufficient for template matching usually,
-                # but user might want better quality.
-                
-                # A simple heuristic for high-res:
-                # remove "/thumb" and everything after the last slash in the directory path?
-                # Actually, scraping the thumb is safer for now.
-                
-                try:
-                    print(f"Downloading {augment_name}...")
-                    img_data = requests.get(img_url).content
-                    
-                    filename = safe_filename(augment_name) + ".png"
-                    filepath = os.path.join(ASSETS_DIR, filename)
-                    
-                    with open(filepath, 'wb') as f:
-                        f.write(img_data)
-                    
-                    count += 1
-                    time.sleep(0.1) # Be polite
-                except Exception as e:
-                    print(f"Failed to download {augment_name}: {e}")
-
-    print(f"Done. Downloaded {count} augment icons to {ASSETS_DIR}")
+        if "An icon for the ARAM: Mayhem augment" not in title_attr:
+            continue
+        augment_name = title_attr.replace("An icon for the ARAM: Mayhem augment", "").strip()
+
+        img_tag = link.find('img')
+        src = img_tag.get('src', '') if img_tag else ''
+        if not src:
+            continue
+        # 상대 경로(/en-us/images/...)는 페이지 주소 기준으로 변환
+        icons.append((augment_name, urljoin(page_url, src)))
+    return icons
+
+# ==========================================
+# 4. 다운로드 (조건부 요청)
+# ==========================================
+def download_icon(session, name, img_url, entry, out_dir=ASSETS_DIR):
+    """아이콘 1개 동기화. ('new' | 'updated' | 'unchanged', 매니페스트 항목) 반환"""
+    filename = safe_filename(name) + ".png"
+    filepath = os.path.join(out_dir, filename)
+
+    headers = {}
+    if entry and os.path.exists(filepath):
+        if entry.get("etag"): headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"): headers["If-Modified-Since"] = entry["last_modified"]
+
+    res = session.get(img_url, headers=headers, timeout=15)
+    if res.status_code == 304:
+        return "unchanged", entry
+    res.raise_for_status()
+
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(res.content)
+    os.replace(tmp_path, filepath)
+
+    new_entry = {
+        "file": filename,
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+    }
+    return ("updated" if entry else "new"), new_entry
+
+def sync_icons(page_url=URL, workers=DEFAULT_WORKERS, force=False, out_dir=ASSETS_DIR):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+
+    session = make_session(workers)
+    print(f"Fetching {page_url}...")
+    try:
+        response = session.get(page_url, timeout=15)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Failed to fetch page: {e}")
+        return None
+
+    icons = find_icons(response.content, page_url)
+    if not icons:
+        print("Could not find augment icons.")
+        return None
+
+    manifest = {} if force else load_manifest(manifest_path)
+    counts = {"new": 0, "updated": 0, "unchanged": 0, "failed": 0}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(download_icon, session, name, img_url, manifest.get(img_url), out_dir): (name, img_url)
+                   for name, img_url in icons}
+        for future in as_completed(futures):
+            name, img_url = futures[future]
+            try:
+                status, entry = future.result()
+            except Exception as e:
+                print(f"Failed to download {name}: {e}")
+                counts["failed"] += 1
+                continue
+            manifest[img_url] = entry
+            counts[status] += 1
+            if status != "unchanged":
+                print(f"Downloaded {name} ({status})")
+
+    session.close()
+    save_manifest(manifest, manifest_path)
+    print(f"Done. {len(icons)} icons: new {counts['new']}, updated {counts['updated']}, "
+          f"unchanged {counts['unchanged']}, failed {counts['failed']} -> {out_dir}")
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="ARAM 증강 아이콘 동기화")
+    parser.add_argument("--url", default=URL, help="증강 목록 페이지 (로컬 테스트 서버 주소 가능)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--force", action="store_true", help="매니페스트 무시하고 전부 다시 받기")
+    parser.add_argument("--out-dir", help=f"기본값: {ASSETS_DIR} (--url 이 위키가 아니면 임시 폴더)")
+    args = parser.parse_args()
+
+    out_dir = args.out_dir
+    if out_dir is None:
+        out_dir = ASSETS_DIR if args.url == URL else TEST_OUTPUT_DIR
+        if out_dir != ASSETS_DIR: print(f"Test run: icons and manifest go to {out_dir}")
+    sync_icons(args.url, workers=args.workers, force=args.force, out_dir=out_dir)
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,15 @@
-import cv2
-import numpy as np
-import mss
 import os
 import sys
 
+import lazy_import
+import metrics
+from probe import TemplateProbe
+
+# 상점 감시가 실제로 시작될 때 로드 (lazy_import.py 참고)
+cv2 = lazy_import.lazy("cv2")
+np = lazy_import.lazy("numpy")
+mss = lazy_import.lazy("mss")
+
 # PyInstaller 경로 대응 함수
 def resource_path(relative_path):
     try:
@@ -16,41 +22,53 @@ def resource_path(relative_path):
 TEMPLATE_PATH = resource_path("shop_template.png")
 
 template = None
-if os.path.exists(TEMPLATE_PATH):
-    # 이미지를 흑백으로 읽으면 속도가 더 빠르고 조명 영향을 덜 받습니다.
-    # 하지만 색상 정보가 중요하다면 IMREAD_COLOR 유지하세요. 여기선 그대로 둡니다.
-    template = cv2.imread(TEMPLATE_PATH, cv2.IMREAD_COLOR)
-else:
-    print(f"[Warning] 상점 템플릿 없음: {TEMPLATE_PATH}")
+shop_probe = None
+_TEMPLATE_LOADED = False
+
+# 🔥 [수정] 이미지가 선명하므로 기준을 0.9로 상향 조정 (오인식 차단)
+THRESHOLD = 0.9
+
+def load_template():
+    """템플릿 로드 (첫 감지 시 1회)"""
+    global template, shop_probe, _TEMPLATE_LOADED
+    if _TEMPLATE_LOADED: return template
+
+    if os.path.exists(TEMPLATE_PATH):
+        # 이미지를 흑백으로 읽으면 속도가 더 빠르고 조명 영향을 덜 받습니다.
+        # 하지만 색상 정보가 중요하다면 IMREAD_COLOR 유지하세요. 여기선 그대로 둡니다.
+        template = cv2.imread(TEMPLATE_PATH, cv2.IMREAD_COLOR)
+        if template is not None:
+            shop_probe = TemplateProbe("shop", template, THRESHOLD)
+    else:
+        print(f"[Warning] 상점 템플릿 없음: {TEMPLATE_PATH}")
+    _TEMPLATE_LOADED = True
+    return template
 
 def is_shop_open(sct=None):
-    if template is None: return False
+    if load_template() is None: return False
 
     if sct:
         # 이미터 인스턴스 사용
-        monitor = sct.monitors[1]
-        screen_shot = np.array(sct.grab(monitor))
-        screen_bgr = cv2.cvtColor(screen_shot, cv2.COLOR_BGRA2BGR)
+        with metrics.span("shop_capture"):
+            monitor = sct.monitors[1]
+            screen_shot = np.array(sct.grab(monitor))
+            screen_bgr = cv2.cvtColor(screen_shot, cv2.COLOR_BGRA2BGR)
         return _check_template(screen_bgr)
     else:
         # 기존 방식 (매번 생성)
         with mss.mss() as sct_new:
-            monitor = sct_new.monitors[1]
-            screen_shot = np.array(sct_new.grab(monitor))
-            screen_bgr = cv2.cvtColor(screen_shot, cv2.COLOR_BGRA2BGR)
+            with metrics.span("shop_capture"):
+                monitor = sct_new.monitors[1]
+                screen_shot = np.array(sct_new.grab(monitor))
+                screen_bgr = cv2.cvtColor(screen_shot, cv2.COLOR_BGRA2BGR)
             return _check_template(screen_bgr)
 
-def _check_template(screen_bgr):
-    # 템플릿 매칭
-    res = cv2.matchTemplate(screen_bgr, template, cv2.TM_CCOEFF_NORMED)
-
-    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-    # print(f"[ShopDetector] 일치율: {max_val:.2f}") 
-    
-    # 🔥 [수정] 이미지가 선명하므로 기준을 0.9로 상향 조정 (오인식 차단)
-    threshold = 0.9
-    
-    loc = np.where(res >= threshold)
-    if len(loc[0]) > 0:
-        return True
-    return False
\ No newline at end of file
+def check_frame(screen_bgr, use_probe=True):
+    """이미 캡처한 BGR 프레임으로 상점 열림 여부 판단 (replay.py 에서 사용)"""
+    if load_template() is None: return False
+    return _check_template(screen_bgr, use_probe)
+
+def _check_template(screen_bgr, use_probe=True):
+    # 템플릿 매칭 (마지막 위치의 픽셀 프로브가 "아님" 이면 생략, probe.py 참고)
+    with metrics.span("shop_match"):
+        return shop_probe.match(screen_bgr, use_probe)
@@ -0,0 +1,142 @@
+import json
+import time
+import threading
+import traceback
+from contextlib import contextmanager
+
+# ==========================================
+# 서브시스템 초기화 관리 (Startup Registry)
+# ==========================================
+# HTTP 서버가 먼저 포트를 열고, 무거운 초기화(DB, LCU, OCR 등)는
+# 백그라운드 스레드에서 동시에 진행합니다.
+# 각 서브시스템의 상태와 소요 시간은 /health 에서 확인할 수 있습니다.
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+PROCESS_START = time.time()
+
+_SUBSYSTEMS = {}   # name -> 상태 딕셔너리
+_EVENTS = {}       # name -> threading.Event (완료 신호)
+_SPANS = []        # 시작 프로파일용 구간 기록 [{name, start_ms, elapsed_ms, thread}]
+_LOCK = threading.Lock()
+
+
+def _set(name, **fields):
+    with _LOCK:
+        _SUBSYSTEMS.setdefault(name, {
+            "status": PENDING, "started_at": None, "elapsed_ms": None,
+            "detail": None, "error": None,
+        }).update(fields)
+
+
+def _run(name, init_fn, depends):
+    # 의존하는 서브시스템이 끝날 때까지 대기 (실패해도 진행은 함)
+    for dep in depends:
+        wait_for(dep)
+
+    started = time.time()
+    _set(name, status=RUNNING, started_at=round(started - PROCESS_START, 3))
+    try:
+        with span(f"init:{name}"):
+            detail = init_fn()
+        elapsed = (time.time() - started) * 1000
+        _set(name, status=READY, elapsed_ms=round(elapsed, 1),
+             detail=detail if isinstance(detail, str) else None)
+        print(f"[Startup] ✅ {name} 준비 완료 ({elapsed:.0f} ms)")
+    except Exception as e:
+        elapsed = (time.time() - started) * 1000
+        _set(name, status=FAILED, elapsed_ms=round(elapsed, 1), error=str(e))
+        print(f"[Startup] ❌ {name} 초기화 실패: {e}")
+        traceback.print_exc()
+    finally:
+        _EVENTS[name].set()
+
+
+def start(name, init_fn, depends=()):
+    """init_fn 을 백그라운드 스레드에서 실행하고 상태를 기록"""
+    _set(name)
+    _EVENTS[name] = threading.Event()
+    t = threading.Thread(target=_run, args=(name, init_fn, depends),
+                         name=f"init-{name}", daemon=True)
+    t.start()
+    return t
+
+
+def wait_for(name, timeout=None):
+    """서브시스템 초기화가 끝날 때까지 대기. 성공 여부 반환"""
+    event = _EVENTS.get(name)
+    if event is None: return False
+    event.wait(timeout)
+    return is_ready(name)
+
+
+def is_ready(name):
+    with _LOCK:
+        info = _SUBSYSTEMS.get(name)
+        return bool(info) and info["status"] == READY
+
+
+@contextmanager
+def span(name):
+    """구간 소요 시간을 기록 (프로세스 시작 기준 ms)"""
+    started = time.time()
+    try:
+        yield
+    finally:
+        ended = time.time()
+        with _LOCK:
+            _SPANS.append({
+                "name": name,
+                "start_ms": round((started - PROCESS_START) * 1000, 1),
+                "elapsed_ms": round((ended - started) * 1000, 1),
+                "thread": threading.current_thread().name,
+            })
+
+
+def mark(name):
+    """길이 없는 이벤트 기록 (예: HTTP 바인딩 완료 시점)"""
+    with span(name):
+        pass
+
+
+def wait_all(timeout=None):
+    """등록된 모든 서브시스템 초기화가 끝날 때까지 대기"""
+    deadline = None if timeout is None else time.time() + timeout
+    for name in list(_EVENTS):
+        remaining = None if deadline is None else max(0, deadline - time.time())
+        _EVENTS[name].wait(remaining)
+    return report()["ok"]
+
+
+def spans():
+    with _LOCK:
+        return [dict(s) for s in _SPANS]
+
+
+def report():
+    """/health 응답용 스냅샷"""
+    with _LOCK:
+        subsystems = {name: dict(info) for name, info in _SUBSYSTEMS.items()}
+    return {
+        "ok": all(s["status"] == READY for s in subsystems.values()),
+        "uptime": round(time.time() - PROCESS_START, 3),
+        "subsystems": subsystems,
+    }
+
+
+def write_profile(path, ready_at=None):
+    """시작 프로파일 리포트(JSON) 저장: 서브시스템 상태 + 구간 기록"""
+    ready_at = ready_at or time.time()
+    data = {
+        "process_start": PROCESS_START,
+        "ready_at": ready_at,
+        "ready_ms": round((ready_at - PROCESS_START) * 1000, 1),
+        "health": report(),
+        "spans": sorted(spans(), key=lambda s: s["start_ms"]),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return data
@@ -1,86 +1,241 @@
 import json
 import os
-import time
 import sys
+import hashlib
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 강제로 UTF-8 출력 설정 (윈도우 출력 오류 방지)
 sys.stdout.reconfigure(encoding='utf-8')
 
-try:
-    from googletrans import Translator
-except ImportError:
-    print("[Error] googletrans 라이브러리가 없습니다.")
-    print("pip install googletrans==4.0.0-rc1 명령어를 실행해주세요.")
-    sys.exit(1)
-
 # 파일 경로
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE = os.path.join(BASE_DIR, "augments_global_en.json")
 OUTPUT_FILE = os.path.join(BASE_DIR, "augments_global_ko.json")
+# 번역 메모리: sha1(원문) -> 번역문 (바뀌지 않은 팁은 다시 번역하지 않음)
+MEMORY_FILE = os.path.join(BASE_DIR, "translation_memory.json")
+
+SRC_LANG = "en"
+DEST_LANG = "ko"
+BATCH_SIZE = 20         # 요청 1번에 보낼 문장 수
+BATCH_MAX_CHARS = 4000  # 요청 1번의 최대 글자 수 (구글 번역 제한 5000자)
+MAX_WORKERS = 3         # 동시 요청 수 (차단 방지)
+
+# ==========================================
+# 1. 번역 백엔드 (교체 가능)
+# ==========================================
+# 백엔드 = texts(list[str]) 를 받아 같은 순서의 번역 list 를 돌려주는 함수
+def google_backend():
+    try:
+        from googletrans import Translator
+    except ImportError:
+        print("[Error] googletrans 라이브러리가 없습니다.")
+        print("pip install googletrans==4.0.0-rc1 명령어를 실행해주세요.")
+        sys.exit(1)
+
+    # Translator 는 스레드 간 공유하지 않음
+    local = threading.local()
+
+    def translate_batch(texts):
+        if not hasattr(local, "translator"):
+            local.translator = Translator()
+        results = local.translator.translate(texts, src=SRC_LANG, dest=DEST_LANG)
+        return [r.text for r in results]
+    return translate_batch
+
+def fake_backend():
+    """네트워크 없이 파이프라인을 확인하기 위한 대역 (원문 앞에 [ko] 를 붙임)"""
+    def translate_batch(texts):
+        return [f"[{DEST_LANG}] {t}" for t in texts]
+    return translate_batch
 
-def translate_tips():
+BACKENDS = {
+    "google": google_backend,
+    "fake": fake_backend,
+}
+# 실제 번역 백엔드. 그 외(fake 등)는 --out / --memory 를 직접 주지 않으면 임시 폴더에 저장
+# (실제 팁 파일과 번역 메모리를 "[ko] ..." 로 덮어쓰지 않도록)
+PRODUCTION_BACKENDS = {"google"}
+TEST_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "translate_tips")
+
+# ==========================================
+# 2. 번역 메모리
+# ==========================================
+def text_key(text):
+    return hashlib.sha1(f"{SRC_LANG}>{DEST_LANG}:{text}".encode("utf-8")).hexdigest()
+
+def load_memory(path=None):
+    path = path or MEMORY_FILE
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_memory(memory, path=None):
+    path = path or MEMORY_FILE
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(memory, f, ensure_ascii=False, indent=0, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _previous_sources(old, item):
+    """
+    이전 결과 파일의 번역 원문 목록 (tips 와 같은 순서). 알 수 없으면 None
+    tips_en: 번역할 때 기록한 원문. 예전 파일은 tips 가 번역문으로 덮였으므로,
+    원문이 tips_flat 에서 온 경우(입력에 tips 가 없음)에만 남아 있는 tips_flat 을 원문으로 봄
+    """
+    if "tips_en" in old: return old["tips_en"]
+    if not item.get("tips") and old.get("tips_flat"): return [t for t in old["tips_flat"] if t and isinstance(t, str)]
+    return None
+
+def seed_memory(memory, data, output_file=None):
+    """
+    이미 번역된 결과 파일이 있으면 (원문, 번역) 쌍을 메모리에 채움
+    이전 원문과 글자까지 같은 팁만 가져옴 (개수가 같아도 내용이 바뀐 팁은 새로 번역)
+    """
+    output_file = output_file or OUTPUT_FILE
+    try:
+        with open(output_file, "r", encoding="utf-8") as f:
+            previous = {item.get("name_en"): item for item in json.load(f)}
+    except (OSError, ValueError):
+        return 0
+
+    added = 0
+    for item in data:
+        old = previous.get(item.get("name_en"))
+        if not old: continue
+        old_sources = _previous_sources(old, item)
+        old_tips = old.get("tips") or []
+        if old_sources is None or len(old_sources) != len(old_tips): continue  # 어떤 원문의 번역인지 모름
+        previous_pairs = dict(zip(old_sources, old_tips))
+        for src in get_tips(item):
+            if not isinstance(src, str) or src not in previous_pairs: continue  # 새로 생기거나 바뀐 팁
+            dst, key = previous_pairs[src], text_key(src)
+            if key not in memory and src != dst:
+                memory[key] = dst
+                added += 1
+    return added
+
+# ==========================================
+# 3. 파이프라인
+# ==========================================
+def get_tips(item):
+    tips = item.get("tips") or item.get("tips_flat") or item.get("notes") or []
+    if isinstance(tips, str):
+        tips = [tips]
+    return tips
+
+def needs_translation(text):
+    # 너무 짧거나 번역 불필요한 건 패스
+    return isinstance(text, str) and len(text) >= 2
+
+def make_batches(texts):
+    batch, chars = [], 0
+    for t in texts:
+        if batch and (len(batch) >= BATCH_SIZE or chars + len(t) > BATCH_MAX_CHARS):
+            yield batch
+            batch, chars = [], 0
+        batch.append(t)
+        chars += len(t)
+    if batch:
+        yield batch
+
+def translate_missing(texts, memory, backend, workers=MAX_WORKERS):
+    """메모리에 없는 문장만 배치로 나눠 번역해서 memory 에 추가. (번역 수, 실패 수) 반환"""
+    pending = [t for t in dict.fromkeys(texts) if text_key(t) not in memory]  # 순서 유지 중복 제거
+    if not pending:
+        return 0, 0
+
+    batches = list(make_batches(pending))
+    print(f"[Info] 새 문장 {len(pending)}개 -> {len(batches)}개 배치로 번역")
+
+    done, failed = 0, 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(backend, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results = future.result()
+                if len(results) != len(batch):
+                    raise ValueError(f"결과 개수 불일치 ({len(results)} != {len(batch)})")
+            except Exception as e:
+                # 실패한 배치는 메모리에 남기지 않음 -> 다음 실행 때 재시도
+                print(f"[Warn] 배치 번역 실패 ({len(batch)}문장): {e}")
+                failed += len(batch)
+                continue
+            for src, dst in zip(batch, results):
+                memory[text_key(src)] = dst
+            done += len(batch)
+            print(f"[Progress] {done + failed}/{len(pending)} 완료...")
+    return done, failed
+
+def translate_tips(backend_name="google", workers=MAX_WORKERS, input_file=None, output_file=None,
+                   memory_file=None):
+    input_file = input_file or INPUT_FILE
+    if backend_name in PRODUCTION_BACKENDS:
+        output_file = output_file or OUTPUT_FILE
+        memory_file = memory_file or MEMORY_FILE
+    else:
+        os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
+        output_file = output_file or os.path.join(TEST_OUTPUT_DIR, os.path.basename(OUTPUT_FILE))
+        memory_file = memory_file or os.path.join(TEST_OUTPUT_DIR, os.path.basename(MEMORY_FILE))
+        print(f"[Info] '{backend_name}' 백엔드: 결과/메모리는 {output_file}, {memory_file} 에 저장")
     print("[Start] 스크립트 실행 시작...")
-    
-    if not os.path.exists(INPUT_FILE):
-        print(f"[Error] 파일을 찾을 수 없습니다: {INPUT_FILE}")
+
+    if not os.path.exists(input_file):
+        print(f"[Error] 파일을 찾을 수 없습니다: {input_file}")
         return
 
-    print(f"[Info] 데이터 파일 로딩 중... ({INPUT_FILE})")
-    
+    print(f"[Info] 데이터 파일 로딩 중... ({input_file})")
+
     try:
-        with open(INPUT_FILE, "r", encoding="utf-8") as f:
+        with open(input_file, "r", encoding="utf-8") as f:
             data = json.load(f)
     except Exception as e:
         print(f"[Error] JSON 파일 읽기 실패: {e}")
         return
 
-    translator = Translator()
-    total = len(data)
-    print(f"[Info] 총 {total}개의 증강 데이터 번역을 시도합니다.")
+    memory = load_memory(memory_file)
+    if not memory:
+        seeded = seed_memory(memory, data, output_file)
+        if seeded: print(f"[Info] 기존 번역 파일에서 {seeded}개 문장을 메모리로 가져왔습니다.")
+
+    texts = [t for item in data for t in get_tips(item) if needs_translation(t)]
+    print(f"[Info] 총 {len(data)}개 증강, 팁 {len(texts)}개 (중복 제외 {len(set(texts))}개)")
+
+    try:
+        done, failed = translate_missing(texts, memory, BACKENDS[backend_name](), workers)
+    finally:
+        # 중간에 끊겨도 번역된 만큼은 저장
+        save_memory(memory, memory_file)
+    print(f"[Info] 번역 {done}개, 실패 {failed}개, 메모리 재사용 {len(set(texts)) - done - failed}개")
 
     translated_data = []
-    
-    for idx, item in enumerate(data):
+    for item in data:
         new_item = item.copy()
-        
-        # 팁 가져오기
-        tips = item.get("tips") or item.get("tips_flat") or item.get("notes") or []
-        if isinstance(tips, str):
-            tips = [tips]
-            
-        korean_tips = []
-        if tips:
-            for t in tips:
-                if not t or not isinstance(t, str): continue
-                try:
-                    # 너무 짧거나 번역 불필요한 건 패스
-                    if len(t) < 2:
-                        korean_tips.append(t)
-                        continue
-                        
-                    res = translator.translate(t, src='en', dest='ko')
-                    korean_tips.append(res.text)
-                except Exception as e:
-                    # 번역 실패 시 원본 유지하고 계속 진행
-                    # print(f"[Warn] 번역 실패: {e}") 
-                    korean_tips.append(t)
-                # 차단 방지 딜레이
-                time.sleep(0.1)
-        
-        new_item["tips"] = korean_tips
+        source_tips = [t for t in get_tips(item) if t and isinstance(t, str)]
+        # 번역 실패 시 원본 유지
+        new_item["tips"] = [memory.get(text_key(t), t) if needs_translation(t) else t for t in source_tips]
+        new_item["tips_en"] = source_tips  # 번역 원문 (다음 실행의 seed_memory 가 바뀐 팁을 구분)
         translated_data.append(new_item)
-        
-        # 진행 상황 표시 (10개마다)
-        if (idx + 1) % 10 == 0:
-            print(f"[Progress] {idx+1}/{total} 완료...")
 
     # 파일 저장
     try:
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        with open(output_file, "w", encoding="utf-8") as f:
             json.dump(translated_data, f, ensure_ascii=False, indent=2)
-        print(f"[Success] 번역 완료! 파일 생성됨: {OUTPUT_FILE}")
+        print(f"[Success] 번역 완료! 파일 생성됨: {output_file}")
     except Exception as e:
         print(f"[Error] 파일 저장 실패: {e}")
 
 if __name__ == "__main__":
-    translate_tips()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="증강 팁 한국어 번역")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="google",
+                        help="fake: 네트워크 없이 동작 확인용")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--out", help=f"기본값: {OUTPUT_FILE} (fake 백엔드는 임시 폴더)")
+    parser.add_argument("--memory", help=f"기본값: {MEMORY_FILE} (fake 백엔드는 임시 폴더)")
+    args = parser.parse_args()
+    translate_tips(args.backend, args.workers, output_file=args.out, memory_file=args.memory)
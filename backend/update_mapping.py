@@ -1,69 +1,42 @@
-import sqlite3
 import os
+import sys
+import argparse
+
+import database
 
 # 파일 경로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "game_data.db")
 MAPPING_TXT_PATH = os.path.join(BASE_DIR, "augment_mapping_full.txt")
 
-def update_db_mapping():
+def update_db_mapping(force=False):
     # 1. 파일 존재 여부 확인
     if not os.path.exists(DB_PATH):
         print(f"❌ DB 파일을 찾을 수 없습니다: {DB_PATH}")
         print("서버(app.py)를 한 번이라도 실행해야 DB가 생성됩니다.")
-        return
+        return 1
     
     if not os.path.exists(MAPPING_TXT_PATH):
         print(f"❌ 매핑 텍스트 파일을 찾을 수 없습니다: {MAPPING_TXT_PATH}")
-        return
+        return 1
 
-    # 2. DB 연결
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    
-    # 테이블이 없을 경우를 대비해 생성 (안전장치)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS augment_name_map (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name_ko TEXT NOT NULL UNIQUE,
-            name_en TEXT NOT NULL
-        )
-    """)
-    
     print("🔄 매핑 테이블 업데이트 시작...")
-    
-    count = 0
-    updated_count = 0
-    
-    # 3. 텍스트 파일 읽기 및 DB 갱신
-    try:
-        with open(MAPPING_TXT_PATH, "r", encoding="utf-8") as f:
-            for line in f:
-                if " : " in line:
-                    # 텍스트 파일 파싱 ("한글명 : 영문명")
-                    ko, en = line.strip().split(" : ", 1)
-                    ko = ko.strip()
-                    en = en.strip()
-                    
-                    if not ko or not en:
-                        continue
-                    
-                    # ★ 핵심: INSERT OR REPLACE
-                    # 기존에 해당 한글 이름이 있으면 영문명을 새것으로 덮어씁니다.
-                    cur.execute("""
-                        INSERT OR REPLACE INTO augment_name_map (name_ko, name_en) 
-                        VALUES (?, ?)
-                    """, (ko, en))
-                    count += 1
-        
-        conn.commit()
-        print(f"✅ 업데이트 완료! 총 {count}개의 항목을 처리했습니다.")
-        print("이제 'app.py'를 다시 실행하면 새로운 매핑이 적용됩니다.")
-        
-    except Exception as e:
-        print(f"❌ 오류 발생: {e}")
-    finally:
-        conn.close()
+
+    # 2. 서버와 같은 증분 임포터 사용 (바뀐 항목만 한 트랜잭션으로 반영)
+    result = database.import_mapping_file(MAPPING_TXT_PATH, force=force, db_path=DB_PATH)
+
+    if result["error"]:
+        print(f"❌ 업데이트 실패 (DB 는 바뀌지 않음): {result['error']}")
+        return 1
+    if result["skipped"]:
+        print("✅ 변경 사항 없음 (파일 해시 동일). --force 로 강제 반영 가능")
+    else:
+        print(f"✅ 업데이트 완료! 추가 {result['added']}, 변경 {result['updated']}, 삭제 {result['removed']}")
+        print("실행 중인 서버는 POST /admin/reload-mapping 으로 재시작 없이 반영할 수 있습니다.")
+    return 0
 
 if __name__ == "__main__":
-    update_db_mapping()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="해시가 같아도 다시 비교/반영")
+    args = parser.parse_args()
+    sys.exit(update_db_mapping(force=args.force))
@@ -1,21 +1,55 @@
 import React, { useState, useEffect } from 'react';
 import './ItemBuild.css';
 
-const DDRAGON_VER = "16.1.1"; 
-const IMG_BASE_URL = `https://ddragon.leagueoflegends.com/cdn/${DDRAGON_VER}/img/item/`;
-const DATA_URL = `https://ddragon.leagueoflegends.com/cdn/${DDRAGON_VER}/data/ko_KR/item.json`;
+// 아이템 정보/아이콘은 백엔드의 로컬 캐시에서 (인터넷 없이도 동작, ETag 로 재검증)
+const API_URL = "http://127.0.0.1:5000";
+const IMG_BASE_URL = `${API_URL}/items/icon/`;
+const DATA_URL = `${API_URL}/items/catalog`;
+// 카탈로그 로드 실패/빈 응답(백엔드 아이템 모듈 준비 중) 시 재시도 간격: 1초부터 2배씩, 최대 30초
+const CATALOG_RETRY_MS = 1000;
+const CATALOG_RETRY_MAX_MS = 30000;
 
 const ItemBuild = ({ buildData }) => {
   const [itemMeta, setItemMeta] = useState({});
   const [tooltip, setTooltip] = useState(null);
 
-  // 1. 아이템 데이터 로드
+  // 1. 아이템 데이터 로드 (현재 챔피언 빌드에 나오는 아이템만)
+  // buildData 는 1초마다 새 객체로 오므로 아이템 구성이 바뀔 때만 다시 요청
+  const itemKey = buildData
+    ? ["starting", "core", "item4", "item5", "item6"].flatMap(k => (buildData[k] || []).map(i => i.id)).join(",")
+    : "";
   useEffect(() => {
-    fetch(DATA_URL)
-      .then(res => res.json())
-      .then(json => setItemMeta(json.data))
-      .catch(err => console.error("아이템 데이터 로드 실패:", err));
-  }, []);
+    if (!itemKey) return;
+    let cancelled = false;
+    let timer = null;
+    let delay = CATALOG_RETRY_MS;
+
+    const load = () => {
+      fetch(DATA_URL)
+        .then(res => {
+          if (!res.ok) throw new Error(`HTTP ${res.status}`);
+          return res.json();
+        })
+        .then(json => {
+          if (cancelled) return;
+          const items = json.items || {};
+          // 서버 시작 직후에는 카탈로그가 비어 있음 -> 채워질 때까지 다시 요청
+          if (Object.keys(items).length === 0) throw new Error("빈 카탈로그");
+          setItemMeta(items);
+        })
+        .catch(err => {
+          if (cancelled) return;
+          console.warn(`아이템 데이터 로드 실패, ${delay / 1000}초 후 재시도:`, err.message);
+          timer = setTimeout(load, delay);
+          delay = Math.min(delay * 2, CATALOG_RETRY_MAX_MS);
+        });
+    };
+    load();
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [itemKey]);
 
   // 🔥 [핵심 추가] GPS 좌표 수신 및 충돌 감지
   useEffect(() => {
@@ -159,17 +193,14 @@ const ItemCard = ({ item, size = "normal", hideWin = false }) => {
 const ItemTooltip = ({ info }) => {
   if (!info) return null;
 
-  const cleanDesc = (info.description || "")
-    .replace(/<br\s*\/?>/gi, "\n")
-    .replace(/<[^>]+>/g, "");
-
+  // 설명은 백엔드 카탈로그에서 HTML 태그를 이미 제거한 텍스트
   return (
     <div className="item-tooltip">
       <div className="tooltip-header">
         <span className="tooltip-name">{info.name}</span>
-        <span className="tooltip-gold">🟡 {info.gold?.total || 0}</span>
+        <span className="tooltip-gold">🟡 {info.gold || 0}</span>
       </div>
-      <div className="tooltip-desc">{cleanDesc}</div>
+      <div className="tooltip-desc">{info.description}</div>
     </div>
   );
 };
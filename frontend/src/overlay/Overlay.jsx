@@ -190,7 +190,7 @@ export default function Overlay() {
           {augData.augments.map((aug, i) => {
               const p = getAugmentPosAug(screenW, screenH, i);
               return (
-               <div key={i} className="augmentUnderCard" style={{ left: p.x, top: p.y }}>
+               <div key={i} className={`augmentUnderCard${aug.rank === 1 && aug.score != null ? " best" : ""}`} style={{ left: p.x, top: p.y }}>
                   <div className="augName">{aug.name_ko}</div>
                   <div className="augHeader">
                     <div className="tierGroup">
@@ -202,6 +202,15 @@ export default function Overlay() {
                       <span className="tierLabel">범용</span>
                       <TierBadge tier={aug.tier_global} size="normal" />
                     </div>
+                    {aug.score != null && (
+                      <>
+                        <div className="tierDivider"></div>
+                        <div className="tierGroup">
+                          <span className="tierLabel">추천</span>
+                          <span className="augRank">#{aug.rank} <small>{aug.score}</small></span>
+                        </div>
+                      </>
+                    )}
                   </div>
                </div>
               )